@@ -0,0 +1,39 @@
+"""이미지 원본을 blob 저장소로: sha256 키 컬럼 추가, 기존 BLOB 컬럼은 NULL 허용
+
+기존 테이블(user/face/arm)은 이미 만들어져 있다고 가정한 첫 리비전.
+컬럼 추가 후 `python -m app.tools.migrate_blobs` 로 기존 원본을 이관한다.
+
+Revision ID: 0001_blob_store_keys
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "0001_blob_store_keys"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("face", sa.Column("image_key", sa.String(64), nullable=True))
+    # MODIFY 는 타입을 다시 지정하므로 64KB BLOB 으로 줄지 않게 LONGBLOB 으로 명시
+    op.alter_column("face", "image_blob", existing_type=mysql.LONGBLOB(), nullable=True)
+
+    op.add_column("arm", sa.Column("start_image_key", sa.String(64), nullable=True))
+    op.add_column("arm", sa.Column("end_image_key", sa.String(64), nullable=True))
+    op.alter_column("arm", "start_image_blob", existing_type=mysql.LONGBLOB(), nullable=True)
+    op.alter_column("arm", "end_image_blob", existing_type=mysql.LONGBLOB(), nullable=True)
+
+
+def downgrade() -> None:
+    # 이관된 행은 BLOB 이 비어 있으므로 NOT NULL 복구 전에 원본을 되돌려 넣어야 한다
+    op.alter_column("arm", "end_image_blob", existing_type=mysql.LONGBLOB(), nullable=False)
+    op.alter_column("arm", "start_image_blob", existing_type=mysql.LONGBLOB(), nullable=False)
+    op.drop_column("arm", "end_image_key")
+    op.drop_column("arm", "start_image_key")
+
+    op.alter_column("face", "image_blob", existing_type=mysql.LONGBLOB(), nullable=False)
+    op.drop_column("face", "image_key")
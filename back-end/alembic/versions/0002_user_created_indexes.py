@@ -0,0 +1,23 @@
+"""사용자별 최신/목록 조회용 (user_id, created_at) 복합 인덱스
+
+Revision ID: 0002_user_created_indexes
+Revises: 0001_blob_store_keys
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002_user_created_indexes"
+down_revision = "0001_blob_store_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # InnoDB 보조 인덱스에는 PK 가 붙으므로 ORDER BY created_at DESC, PK DESC 도 인덱스로 해결
+    op.create_index("ix_face_user_id_created_at", "face", ["user_id", "created_at"])
+    op.create_index("ix_arm_user_id_created_at", "arm", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_arm_user_id_created_at", table_name="arm")
+    op.drop_index("ix_face_user_id_created_at", table_name="face")
@@ -0,0 +1,34 @@
+"""오프라인 재채점 결과 테이블 (모델 버전별)
+
+Revision ID: 0003_rescore_results
+Revises: 0002_user_created_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_rescore_results"
+down_revision = "0002_user_created_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rescore_result",
+        sa.Column("modality", sa.String(16), primary_key=True),
+        sa.Column("model_version", sa.String(64), primary_key=True),
+        sa.Column("source_key", sa.String(512), primary_key=True),
+        sa.Column("source_id", sa.BigInteger, nullable=True),
+        sa.Column("proba", sa.Float, nullable=True),
+        sa.Column("pred_label", sa.Integer, nullable=True),
+        sa.Column("error", sa.String(255), nullable=True),
+        sa.Column("features_json", sa.JSON, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.current_timestamp(), nullable=False),
+    )
+    op.create_index("ix_rescore_result_source_id", "rescore_result", ["modality", "source_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rescore_result_source_id", table_name="rescore_result")
+    op.drop_table("rescore_result")
@@ -0,0 +1,37 @@
+"""섀도 평가 결과 테이블
+
+Revision ID: 0004_shadow_results
+Revises: 0003_rescore_results
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_shadow_results"
+down_revision = "0003_rescore_results"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "shadow_result",
+        sa.Column("shadow_id", sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column("modality", sa.String(16), nullable=False),
+        sa.Column("source_id", sa.BigInteger, nullable=True),
+        sa.Column("primary_version", sa.String(64), nullable=False),
+        sa.Column("primary_proba", sa.Float, nullable=False),
+        sa.Column("primary_label", sa.Integer, nullable=False),
+        sa.Column("shadow_version", sa.String(64), nullable=False),
+        sa.Column("shadow_proba", sa.Float, nullable=True),
+        sa.Column("shadow_label", sa.Integer, nullable=True),
+        sa.Column("shadow_latency_ms", sa.Float, nullable=True),
+        sa.Column("error", sa.String(255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.current_timestamp(), nullable=False),
+    )
+    op.create_index("ix_shadow_result_version_created_at", "shadow_result", ["modality", "shadow_version", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shadow_result_version_created_at", table_name="shadow_result")
+    op.drop_table("shadow_result")
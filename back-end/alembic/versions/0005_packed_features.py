@@ -0,0 +1,28 @@
+"""압축 피처/랜드마크 컬럼 (face, arm)
+
+Revision ID: 0005_packed_features
+Revises: 0004_shadow_results
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_packed_features"
+down_revision = "0004_shadow_results"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 피처 ~250B, 랜드마크 face ~5.7KB / arm ~0.7KB → 64KB BLOB 으로 충분
+    for table in ("face", "arm"):
+        op.add_column(table, sa.Column("feature_schema", sa.String(64), nullable=True))
+        op.add_column(table, sa.Column("features_bin", sa.LargeBinary, nullable=True))
+        op.add_column(table, sa.Column("landmarks_bin", sa.LargeBinary, nullable=True))
+
+
+def downgrade() -> None:
+    for table in ("arm", "face"):
+        op.drop_column(table, "landmarks_bin")
+        op.drop_column(table, "features_bin")
+        op.drop_column(table, "feature_schema")
@@ -1,11 +1,18 @@
 from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from app.db.session import get_db
-from app.crud.arm import create_arm
-# ↓ 너의 기존 추론/전처리 유틸 그대로 사용
-from app.services.inference.arm_xgb_runner import predict_proba_and_label
-from app.services.features.arm_features import extract_features_from_two_images
+import re
+from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db, get_db
+from app.crud.arm import create_arm_async, get_arm_image, get_arm_image_blob
+# ↓ 특징 추출/추론은 측정 워커에서 (이벤트 루프 블로킹 방지)
+from app.services.result_cache import measure_cached
+from app.services.executor import measure_executor
+from app.services.shadow import shadow_evaluator
+from app.services.features.packing import packed_columns
+from app.core.config import settings
+from app.services.storage.http import image_response, legacy_validator
 from app.core.security import get_user_id_from_cookie
 router = APIRouter(prefix="/api/v1/arm", tags=["arm"])
 
@@ -13,7 +20,7 @@ router = APIRouter(prefix="/api/v1/arm", tags=["arm"])
 async def predict_arm_v1(
     start_file: UploadFile = File(...),
     end_file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_user_id_from_cookie),  
 ):
     # 1) 업로드 바이트 획득
@@ -23,11 +30,11 @@ async def predict_arm_v1(
         raise HTTPException(status_code=400, detail="start_file, end_file 모두 필요합니다.")
 
     # 2) 특징 추출/추론
-    feats = extract_features_from_two_images(sb, eb)
-    proba, label = predict_proba_and_label(feats)
+    out = await measure_cached("arm", sb, eb)
+    feats, proba, label = out["features"], out["proba"], out["label"]
 
     # 3) DB 저장 (디스크 저장 없음)
-    row = create_arm(
+    row = await create_arm_async(
         db,
         user_id=user_id,
         start_bytes=sb,
@@ -37,7 +44,10 @@ async def predict_arm_v1(
         label=label,
         confidence=float(proba) if proba is not None else None,
         features={"version": "v1", "feats_len": len(feats or [])},
+        **packed_columns(out.get("packed")),  # 16개 피처 + 시작/끝 손 랜드마크 (압축)
     )
+    # 후보 모델이 설정돼 있으면 같은 피처로 섀도 평가 (대기열에 넣기만, 응답을 기다리게 하지 않음)
+    shadow_evaluator.submit("arm", feats, proba=proba, label=int(label == "detected"), source_id=row.arm_id)
 
     # 4) 응답: DB PK와 조회용 API URL 제공
     return JSONResponse({
@@ -48,20 +58,83 @@ async def predict_arm_v1(
     })
 
 
-# 🔹 DB에 저장된 이미지를 그대로 스트리밍해서 내려주는 엔드포인트 2개
+# 🔹 동영상(또는 프레임 시퀀스)으로 측정: 추적 모드로 시간축 drift 까지 계산
+#    시작/끝 대표 프레임은 기존 /predict 와 같은 start/end 이미지로 저장 → 조회 엔드포인트 그대로 사용
+@router.post("/predict-video")
+async def predict_arm_video(
+    video: Optional[UploadFile] = File(None),
+    frames: Optional[List[UploadFile]] = File(None),
+    sample_fps: Optional[float] = Form(None),  # 동영상: 샘플링 fps / 프레임 시퀀스: 프레임 간격 fps
+    db: AsyncSession = Depends(get_async_db),
+    user_id: str = Depends(get_user_id_from_cookie),
+):
+    if (video is None) == (not frames):
+        raise HTTPException(status_code=400, detail="video 또는 frames 중 하나만 보내야 합니다.")
+    if video is not None:
+        data = await video.read()
+        if not data:
+            raise HTTPException(status_code=400, detail="동영상 파일이 비어 있습니다.")
+        if len(data) > settings.ARM_VIDEO_MAX_MB * 1024 * 1024:
+            raise HTTPException(status_code=413, detail=f"동영상은 최대 {settings.ARM_VIDEO_MAX_MB}MB까지 가능합니다.")
+        ext = re.search(r"\.[A-Za-z0-9]{1,8}$", video.filename or "")
+        payloads, params = (data,), {"source": "video", "suffix": ext.group(0) if ext else ".mp4"}
+    else:
+        if len(frames) > settings.ARM_VIDEO_MAX_FRAMES:
+            raise HTTPException(status_code=413, detail=f"프레임은 최대 {settings.ARM_VIDEO_MAX_FRAMES}장까지 가능합니다.")
+        payloads, params = tuple([await f.read() for f in frames]), {"source": "frames"}
+        if not all(payloads):
+            raise HTTPException(status_code=400, detail="비어 있는 프레임이 있습니다.")
+
+    try:
+        out = await measure_executor.run("arm_video", *payloads, sample_fps=sample_fps, **params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    row = await create_arm_async(
+        db,
+        user_id=user_id,
+        start_bytes=out["start_jpeg"],
+        start_mime="image/jpeg",
+        end_bytes=out["end_jpeg"],
+        end_mime="image/jpeg",
+        label=out["label"],
+        confidence=float(out["proba"]),
+        features={"version": "v1", "source": params["source"], "feats_len": len(out["features"]), "drift": out["drift"]},
+        **packed_columns(out.get("packed")),
+    )
+    return JSONResponse({
+        "id": row.arm_id,
+        "label": out["label"],
+        "confidence": round(float(out["proba"]), 6),
+        "drift": out["drift"],
+    })
+
+
+# 🔹 저장소(이관 전 행은 DB)의 이미지를 스트리밍해서 내려주는 엔드포인트 2개 (size=small|medium → 축소본)
+_SIZE = Query("original", regex="^(original|small|medium)$")
+
+
 @router.get("/{arm_id}/image/start")
-def get_arm_start_image(arm_id: int, db: Session = Depends(get_db)):
-    from app.models.arm import Arm
-    row = db.get(Arm, arm_id)
-    if not row or not row.start_image_blob:
+def get_arm_start_image(arm_id: int, request: Request, size: str = _SIZE, db: Session = Depends(get_db)):
+    row = get_arm_image(db, arm_id, "start")
+    resp = image_response(
+        request, key=row[0], mime=row[1] or "image/png", last_modified=row[2],
+        load_blob=lambda: get_arm_image_blob(db, arm_id, "start"), size=size,
+        legacy_etag=legacy_validator(f"arm/{arm_id}/start", row[2]),
+    ) if row else None
+    if resp is None:
         raise HTTPException(status_code=404, detail="not found")
-    return Response(content=row.start_image_blob, media_type=row.start_image_mime or "image/png")
+    return resp
 
 
 @router.get("/{arm_id}/image/end")
-def get_arm_end_image(arm_id: int, db: Session = Depends(get_db)):
-    from app.models.arm import Arm
-    row = db.get(Arm, arm_id)
-    if not row or not row.end_image_blob:
+def get_arm_end_image(arm_id: int, request: Request, size: str = _SIZE, db: Session = Depends(get_db)):
+    row = get_arm_image(db, arm_id, "end")
+    resp = image_response(
+        request, key=row[0], mime=row[1] or "image/png", last_modified=row[2],
+        load_blob=lambda: get_arm_image_blob(db, arm_id, "end"), size=size,
+        legacy_etag=legacy_validator(f"arm/{arm_id}/end", row[2]),
+    ) if row else None
+    if resp is None:
         raise HTTPException(status_code=404, detail="not found")
-    return Response(content=row.end_image_blob, media_type=row.end_image_mime or "image/png")
\ No newline at end of file
+    return resp
\ No newline at end of file
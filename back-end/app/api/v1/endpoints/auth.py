@@ -1,27 +1,65 @@
+import math
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
 from app.schemas.user import UserCreate, UserLogin, MessageResponse
-from app.crud.user import get_user_by_email, create_user, verify_password, get_user_by_id
+from app.crud.user import find_signup_conflict_async, create_user_async, verify_password_async, get_user_by_id_async
 from app.core.security import create_access_token, get_user_id_from_cookie
 from app.core.config import settings
+from app.services.rate_limit import AUTH_RATE_LIMITED, auth_id_limiter, auth_ip_limiter, client_ip
 
 # ⚠️ prefix 제거 (routers.py에서 "/auth"를 붙여서 include 함)
 router = APIRouter(tags=["auth"])
 
+_DUPLICATE = {"id": "이미 존재하는 아이디입니다.", "email": "이미 존재하는 이메일입니다."}
+
+def _rate_keys(request: Request, user_id: Optional[str]):
+    keys = [("ip", auth_ip_limiter, client_ip(request))]
+    if user_id is not None:
+        keys.append(("id", auth_id_limiter, user_id))
+    return keys
+
+def _record_failure(request: Request, user_id: Optional[str] = None) -> None:
+    """실패한 로그인(틀린 아이디/비밀번호)·가입(중복)만 한도에서 차감."""
+    for _, limiter, key in _rate_keys(request, user_id):
+        limiter.hit(key)
+
+def _check_rate_limit(request: Request, user_id: Optional[str] = None) -> None:
+    """비밀번호 해시 전에 IP/아이디별 실패 한도 확인 (차감 없음) → 넘으면 429 (해시 풀을 쓰지 않음)."""
+    for scope, limiter, key in _rate_keys(request, user_id):
+        retry = limiter.retry_after(key)
+        if retry:
+            AUTH_RATE_LIMITED.inc(scope)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="시도가 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": str(math.ceil(retry))},
+            )
+
 @router.post("/signup", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def signup(user_in: UserCreate, db: Session = Depends(get_db)):
-    if get_user_by_id(db, user_in.id):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 존재하는 아이디입니다.")
-    if get_user_by_email(db, user_in.email):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 존재하는 이메일입니다.")
-    create_user(db, user_in)
+async def signup(user_in: UserCreate, request: Request, db: AsyncSession = Depends(get_async_db)):
+    _check_rate_limit(request)
+    conflict = await find_signup_conflict_async(db, user_in.id, user_in.email)
+    if conflict:
+        _record_failure(request)  # 아이디/이메일 존재 여부 탐색
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=_DUPLICATE[conflict])
+    try:
+        await create_user_async(db, user_in)
+    except IntegrityError:
+        # 확인과 저장 사이에 같은 아이디/이메일로 먼저 가입된 경우 (유니크 제약)
+        await db.rollback()
+        _record_failure(request)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 존재하는 아이디 또는 이메일입니다.")
     return {"message": "회원가입 성공"}
 
 @router.post("/login", response_model=MessageResponse)
-def login(user_in: UserLogin, response: Response, db: Session = Depends(get_db)):
-    db_user = get_user_by_id(db, user_in.id)
-    if not db_user or not verify_password(user_in.password, db_user.password_hash):
+async def login(user_in: UserLogin, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    _check_rate_limit(request, user_in.id)
+    db_user = await get_user_by_id_async(db, user_in.id)
+    if not db_user or not await verify_password_async(user_in.password, db_user.password_hash):
+        _record_failure(request, user_in.id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 또는 비밀번호가 올바르지 않습니다.",
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 import json
 
-from app.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db, get_db
 from app.core.security import get_user_id_from_cookie
 from app.schemas.face import FaceOut
-from app.crud.face import create_face, get_latest_face_by_user, get_face_image_blob
+from app.crud.face import create_face_async, get_latest_face_by_user, get_face_image_blob, get_face_image_meta, list_faces_by_user
+from app.services.storage.http import image_response, legacy_validator
 
 router = APIRouter(tags=["face"])
 
@@ -23,7 +25,7 @@ async def upload_face_result(
     image: UploadFile = File(...),
     result_text: str = Form(...),   # "정상" | "비정상"
     landmarks_json: Optional[str] = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_user_id_from_cookie),
 ):
     if result_text not in ("정상", "비정상"):
@@ -40,7 +42,7 @@ async def upload_face_result(
         except Exception:
             raise HTTPException(status_code=400, detail="landmarks_json 이 유효한 JSON이 아닙니다.")
 
-    rec = create_face(
+    rec = await create_face_async(
         db,
         user_id=user_id,
         image_bytes=image_bytes,
@@ -59,10 +61,33 @@ def get_latest(db: Session = Depends(get_db), user_id: str = Depends(get_user_id
         raise HTTPException(status_code=404, detail="기록이 없습니다.")
     return FaceOut.model_validate(rec)
 
-# 이미지 바이너리 내려받기(표시용)
+# 현재 로그인 사용자의 기록 목록 (최신순, 메타만)
+@router.get("/history", response_model=List[FaceOut])
+def get_history(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_user_id_from_cookie),
+):
+    return list_faces_by_user(db, user_id, limit=limit, offset=offset)
+
+# 이미지 바이너리 내려받기(표시용) — ETag/304, Range 지원, size=small|medium 이면 축소본(WebP/JPEG)
 @router.get("/{face_id}/image")
-def get_image(face_id: int, db: Session = Depends(get_db), user_id: str = Depends(get_user_id_from_cookie)):
-    rec = get_face_image_blob(db, face_id)
+def get_image(
+    face_id: int,
+    request: Request,
+    size: str = Query("original", regex="^(original|small|medium)$"),
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_user_id_from_cookie),
+):
+    rec = get_face_image_meta(db, face_id)
     if not rec or rec.user_id != user_id:
         raise HTTPException(status_code=404, detail="이미지가 없습니다.")
-    return Response(content=rec.image_blob, media_type=rec.image_mime or "image/jpeg")
+    resp = image_response(
+        request, key=rec.image_key, mime=rec.image_mime or "image/jpeg", last_modified=rec.created_at,
+        load_blob=lambda: get_face_image_blob(db, face_id), size=size,
+        legacy_etag=legacy_validator(f"face/{face_id}", rec.created_at),
+    )
+    if resp is None:
+        raise HTTPException(status_code=404, detail="이미지가 없습니다.")
+    return resp
@@ -1,34 +1,32 @@
-# app/api/v1/endpoints/measure.py
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
-from sqlalchemy.orm import Session
-from typing import Optional
-import json
-from datetime import datetime
-from pathlib import Path
-
-from app.db.session import get_db
-from app.core.security import get_user_id_from_cookie
-from app.schemas.face import FaceOut
-from app.crud.face import create_face
-from app.crud.user import get_user_by_id
-from app.services.face_result import compose_result_text
-from app.services.pipeline import run_pipeline  # ← tapnet 파이프라인 (추론)
-
-router = APIRouter(prefix="/measure", tags=["measure"])
-
 # back-end/app/api/v1/endpoints/measure.py
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, WebSocket
+from typing import List, Optional
+import asyncio
 import json
+import logging
+
+import numpy as np
 
-from app.db.session import get_db
+from app.core.config import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
 from app.core.security import get_user_id_from_cookie
 from app.schemas.face import FaceOut
-from app.crud.face import create_face
-from app.crud.user import get_user_by_id
+from app.crud.face import create_face_async
+from app.crud.user import get_user_name_async
 from app.services.face_result import compose_result_text
-from app.services.pipeline import run_pipeline  # TabNet 추론
+from app.services.executor import ExecutorSaturated, measure_executor  # 추론은 워커에서
+from app.services import result_cache  # 같은 이미지 재측정 방지
+from app.services.shadow import shadow_evaluator  # 후보 모델 섀도 평가 (응답 후 백그라운드)
+from app.services.features.packing import packed_columns  # 압축 피처/랜드마크 저장
+from app.services.face_stream import serve_face_stream
+from app.services.features.speech_features import (
+    AudioTooLong,
+    RawPcmDecoder,
+    SpeechStream,
+    StreamingWavDecoder,
+    features_to_dict as speech_features_to_dict,
+)
 
 router = APIRouter()  # ⚠️ 여기서는 prefix 주지 않음 (routers.py에서 붙임)
 
@@ -39,13 +37,128 @@ async def predict_face_only(file: UploadFile = File(...)):
     if not data:
         raise HTTPException(status_code=400, detail="이미지 파일이 비어 있습니다.")
     try:
-        feats, proba, label = run_pipeline("face", data)
+        feats, proba, label, _ = await result_cache.measure_cached("face", data)
+    except ExecutorSaturated:
+        raise
     except NotImplementedError as e:
         raise HTTPException(501, str(e))
     except Exception as e:
         raise HTTPException(400, str(e))
+    shadow_evaluator.submit("face", feats, proba=proba, label=label)
     return {"modality": "face", "pred_proba": proba, "pred_label": label, "features": feats}
 
+# ── 1-1) 다중 이미지 예측: /api/v1/measure/face/predict-batch
+#  - 이미지별 디코딩/랜드마크는 워커들에서 병렬, 스케일링/추론은 행렬 1회
+#  - 이미지별 실패(빈 파일, 얼굴 미검출 등)는 해당 항목의 error 로만 표시
+#  - 묶음 추론이 실패하면 피처까지 성공한 항목들에 error 를 달고 부분 결과 반환 (실행기 포화만 503)
+@router.post("/face/predict-batch")
+async def predict_face_batch(files: List[UploadFile] = File(...)):
+    if len(files) > settings.FACE_BATCH_MAX_FILES:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {settings.FACE_BATCH_MAX_FILES}장까지 가능합니다.")
+
+    results = []
+    todo = []  # (결과 인덱스, 이미지 바이트, 캐시 키)
+    for i, f in enumerate(files):
+        data = await f.read()
+        results.append({"index": i, "filename": f.filename, "pred_proba": None, "pred_label": None, "features": None, "error": None})
+        if not data:
+            results[i]["error"] = "이미지 파일이 비어 있습니다."
+            continue
+        key, hit = await result_cache.lookup("face", (data,))
+        if hit is not None:
+            results[i]["features"], results[i]["pred_proba"], results[i]["pred_label"], _ = hit
+        else:
+            todo.append((i, data, key))
+
+    outs = await measure_executor.map("face_features", [(data,) for _, data, _ in todo])
+    ok = []
+    for (i, _, key), out in zip(todo, outs):
+        if out.get("error"):
+            results[i]["error"] = out["error"]
+        else:
+            results[i]["features"] = out["features"]
+            ok.append((i, key, out["row"], out["packed"]))
+
+    if ok:
+        X = np.stack([row for _, _, row, _ in ok]).astype(np.float32)
+        try:
+            preds = await measure_executor.run("face_infer", X.tobytes())
+        except ExecutorSaturated:
+            raise
+        except Exception as e:
+            logging.exception("[FACE BATCH] inference failed for %d images", len(ok))
+            for i, _, _, _ in ok:
+                results[i]["error"] = str(e) or type(e).__name__
+            preds = []
+        for (i, key, _, packed), (proba, label) in zip(ok, preds):
+            results[i]["pred_proba"] = proba
+            results[i]["pred_label"] = label
+            # /face/predict 와 같은 캐시 항목 형태 (features, proba, label, packed)
+            await result_cache.store(key, (results[i]["features"], proba, label, packed))
+
+    return {"modality": "face", "count": len(results), "results": results}
+
+# ── 1-2) 실시간 얼굴 스트림: ws /api/v1/measure/face/stream
+#  - 클라이언트 → 압축 프레임(JPEG/WebP 바이너리), 텍스트 {"type": "reset"} 으로 추적 초기화
+#  - 서버 → 처리한 프레임마다 {"type": "result", seq, dropped, features, pred_proba, smoothed_proba, guidance, ...}
+#  - 처리보다 빨리 보내면 최신 프레임만 처리하고 나머지는 버림 (dropped 로 알림)
+@router.websocket("/face/stream")
+async def face_stream(websocket: WebSocket):
+    await serve_face_stream(websocket)
+
+# ── 1-3) 음성 스트리밍 예측: /api/v1/measure/speech/predict
+#  - 본문: WAV, 또는 ?format=s16le|f32le&sample_rate=..&channels=.. 의 헤더 없는 PCM (chunked 업로드 가능)
+#  - 받는 대로 디코딩/특징 누적 → 녹음 전체를 메모리에 올리지 않고, 마지막 청크 뒤엔 정리 + 추론 1회만 남는다
+#  - 음성 모델이 폴백으로 떠 있으면 503 (/ready 에는 speech: degraded 로 보임)
+@router.post("/speech/predict")
+async def predict_speech_stream(
+    request: Request,
+    fmt: str = Query("wav", alias="format", regex="^(wav|s16le|f32le)$"),
+    sample_rate: Optional[int] = Query(None),
+    channels: int = Query(1),
+):
+    try:
+        if fmt == "wav":
+            decoder = StreamingWavDecoder()
+        elif sample_rate is None:
+            raise ValueError("원시 PCM 은 sample_rate 가 필요합니다.")
+        else:
+            decoder = RawPcmDecoder(sample_rate, channels, fmt)
+        stream = SpeechStream(decoder, max_seconds=settings.SPEECH_MAX_SECONDS)
+
+        # 작은 네트워크 청크는 모아서 넘김 (스레드 전환 비용 < 계산량이 되도록)
+        pending = bytearray()
+        async for chunk in request.stream():
+            pending += chunk
+            if len(pending) >= settings.SPEECH_STREAM_CHUNK_BYTES:
+                await asyncio.to_thread(stream.feed, bytes(pending))
+                pending.clear()
+        if pending:
+            await asyncio.to_thread(stream.feed, bytes(pending))
+        vec = await asyncio.to_thread(stream.finish)
+    except AudioTooLong as e:
+        raise HTTPException(413, str(e))
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    try:
+        proba, label = await measure_executor.run("speech_infer", vec.tobytes())
+    except NotImplementedError as e:
+        # 폴백 모델(항상 0.5)로 만든 진단은 돌려주지 않는다 → 모델 배포 전까지 사용 불가
+        raise HTTPException(503, str(e))
+    return {
+        "modality": "speech",
+        "pred_proba": proba,
+        "pred_label": label,
+        "duration_s": round(stream.duration_s, 3),
+        "features": speech_features_to_dict(vec),
+    }
+
+# ── 1-4) 결과 캐시 적중률: /api/v1/measure/cache/stats
+@router.get("/cache/stats")
+def result_cache_stats():
+    return result_cache.result_cache.stats()
+
 # ── 2) 저장: /api/v1/measure/face/upload
 @router.post("/face/upload", response_model=FaceOut)
 async def upload_face_and_save(
@@ -53,7 +166,7 @@ async def upload_face_and_save(
     result_text: Optional[str] = Form(None),
     pred_label: Optional[int] = Form(None),
     features_json: Optional[str] = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_user_id_from_cookie),
 ):
     image_bytes = await image.read()
@@ -67,6 +180,7 @@ async def upload_face_and_save(
         except Exception:
             raise HTTPException(status_code=400, detail="features_json 이 유효한 JSON이 아닙니다.")
 
+    packed = None
     if result_text is not None:
         if result_text not in ("정상", "비정상"):
             raise HTTPException(status_code=400, detail="result_text 는 '정상' 또는 '비정상' 이어야 합니다.")
@@ -76,15 +190,20 @@ async def upload_face_and_save(
             raise HTTPException(status_code=400, detail="pred_label 은 0 또는 1 이어야 합니다.")
         is_abnormal = (pred_label == 1)
     else:
-        feats2, proba2, label2 = run_pipeline("face", image_bytes)
+        # /face/predict 에서 이미 측정한 이미지면 캐시에서 바로 꺼낸다
+        feats2, proba2, label2, packed = await result_cache.measure_cached("face", image_bytes)
         features = features or feats2
         is_abnormal = (label2 == 1)
+    if packed is None:
+        # 판정을 클라이언트가 보냈어도 /face/predict 로 측정했던 이미지면 압축 피처/랜드마크를 함께 저장
+        # (캐시에 없으면 측정을 새로 돌리지 않는다)
+        _, hit = await result_cache.lookup("face", (image_bytes,))
+        packed = hit[3] if hit is not None else None
 
-    user = get_user_by_id(db, user_id)
-    user_name = getattr(user, "name", None) or user_id
+    user_name = await get_user_name_async(db, user_id) or user_id
     final_result_text = compose_result_text(user_name_or_id=user_name, is_abnormal=is_abnormal, features=features)
 
-    rec = create_face(
+    rec = await create_face_async(
         db,
         user_id=user_id,
         image_bytes=image_bytes,
@@ -92,6 +211,7 @@ async def upload_face_and_save(
         image_size=len(image_bytes),
         result_text=final_result_text,
         landmarks_json=features,
+        **packed_columns(packed),
     )
     return FaceOut.from_orm(rec)  # pydantic v1
  
\ No newline at end of file
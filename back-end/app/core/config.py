@@ -1,6 +1,6 @@
 # back-end/app/core/config.py
 
-from typing import Literal
+from typing import Literal, Tuple
 from pydantic import BaseSettings, Field
 
 # 모달리티 타입 (face | arm | speech)
@@ -15,10 +15,36 @@ class Settings(BaseSettings):
     DB_PORT: int = Field(3306, env="DB_PORT")
     DB_NAME: str = Field("fast_db", env="DB_NAME")
 
+    # 커넥션 풀 (동기/비동기 엔진 각각 적용): 기본 크기 / 초과 허용 수 / 대기 한도(초) / 재연결 주기(초)
+    DB_POOL_SIZE: int = Field(10, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(20, env="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT: float = Field(30.0, env="DB_POOL_TIMEOUT")
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")
+
     # JWT/보안
     SECRET_KEY: str = Field(..., env="SECRET_KEY")
     ALGORITHM: str = Field("HS256", env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
+    # 검증된 토큰 캐시 (토큰 해시 → 사용자 id): 항목 수('0' 이면 끔) / 유지 시간(초, 토큰 만료 시각을 넘지 않음)
+    AUTH_TOKEN_CACHE_SIZE: int = Field(4096, env="AUTH_TOKEN_CACHE_SIZE")
+    AUTH_TOKEN_CACHE_TTL: float = Field(300.0, env="AUTH_TOKEN_CACHE_TTL")
+    # 사용자 프로필 캐시 (id → 이름, 측정 결과 문구용): 항목 수 / 유지 시간(초). 사용자 정보 저장 시 무효화
+    USER_PROFILE_CACHE_SIZE: int = Field(1024, env="USER_PROFILE_CACHE_SIZE")
+    USER_PROFILE_CACHE_TTL: float = Field(600.0, env="USER_PROFILE_CACHE_TTL")
+    # 비밀번호 해시 전용 스레드 풀 (측정/기본 스레드 풀과 분리): 스레드 수 / 대기 한도(넘으면 503) / bcrypt cost
+    #  - cost 를 바꿔도 기존 해시는 저장된 cost 로 검증된다
+    PASSWORD_HASH_WORKERS: int = Field(2, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_QUEUE_SIZE: int = Field(16, env="PASSWORD_HASH_QUEUE_SIZE")
+    PASSWORD_BCRYPT_ROUNDS: int = Field(12, env="PASSWORD_BCRYPT_ROUNDS")
+    # 로그인/가입 실패 한도 (AUTH_RATE_LIMIT_WINDOW 초당 실패 횟수, '0' 이면 끔): 클라이언트 IP 별 / 아이디별
+    #  - 성공한 시도는 세지 않는다 (같은 NAT/행사장에서 몰리는 정상 로그인·가입은 막지 않음)
+    AUTH_RATE_LIMIT_WINDOW: float = Field(60.0, env="AUTH_RATE_LIMIT_WINDOW")
+    AUTH_RATE_LIMIT_PER_IP: int = Field(30, env="AUTH_RATE_LIMIT_PER_IP")
+    AUTH_RATE_LIMIT_PER_ID: int = Field(10, env="AUTH_RATE_LIMIT_PER_ID")
+    # 클라이언트 IP 를 AUTH_CLIENT_IP_HEADER 에서 읽어도 되는 프록시 주소 (쉼표 구분, CIDR 가능. '' 이면 연결 주소만 사용)
+    # 예: 개발 vite 프록시 "127.0.0.1", 운영 리버스 프록시 "10.0.0.0/8"
+    AUTH_TRUSTED_PROXIES: str = Field("", env="AUTH_TRUSTED_PROXIES")
+    AUTH_CLIENT_IP_HEADER: str = Field("X-Forwarded-For", env="AUTH_CLIENT_IP_HEADER")
 
     # === 모델/추론 관련 (WebTest 기능 이식) ===
     # 모델 파일 기본 디렉토리: app/assets/models/{modality}/{version}/(TabNet_final.zip, scaler.save)
@@ -34,6 +60,86 @@ class Settings(BaseSettings):
     ARM_THRESHOLD: float = Field(0.5, env="ARM_THRESHOLD")
     SPEECH_THRESHOLD: float = Field(0.5, env="SPEECH_THRESHOLD")
 
+    # 모달리티별 동적 마이크로배칭: 최대 행 수 / 대기 중인 다른 행이 있을 때 최대 대기(ms). 1 이면 배칭 끔
+    FACE_BATCH_MAX_SIZE: int = Field(16, env="FACE_BATCH_MAX_SIZE")
+    FACE_BATCH_MAX_WAIT_MS: float = Field(2.0, env="FACE_BATCH_MAX_WAIT_MS")
+    ARM_BATCH_MAX_SIZE: int = Field(16, env="ARM_BATCH_MAX_SIZE")
+    ARM_BATCH_MAX_WAIT_MS: float = Field(2.0, env="ARM_BATCH_MAX_WAIT_MS")
+    SPEECH_BATCH_MAX_SIZE: int = Field(16, env="SPEECH_BATCH_MAX_SIZE")
+    SPEECH_BATCH_MAX_WAIT_MS: float = Field(2.0, env="SPEECH_BATCH_MAX_WAIT_MS")
+
+    # /measure/face/predict-batch 요청당 최대 이미지 수
+    FACE_BATCH_MAX_FILES: int = Field(64, env="FACE_BATCH_MAX_FILES")
+
+    # 음성 스트리밍 측정: 최대 녹음 길이(초) / 디코딩·특징 계산에 한 번에 넘기는 업로드 바이트 수
+    SPEECH_MAX_SECONDS: float = Field(600.0, env="SPEECH_MAX_SECONDS")
+    SPEECH_STREAM_CHUNK_BYTES: int = Field(65536, env="SPEECH_STREAM_CHUNK_BYTES")
+
+    # 팔 검사 동영상/프레임 시퀀스 (추적 모드): 기본/최대 샘플링 fps, 최대 길이(초), 추적용 긴 변(px),
+    # 시작/끝 자세를 정하는 앞뒤 구간(초), 업로드 한도(MB, 프레임 수)
+    ARM_VIDEO_SAMPLE_FPS: float = Field(10.0, env="ARM_VIDEO_SAMPLE_FPS")
+    ARM_VIDEO_MAX_SAMPLE_FPS: float = Field(30.0, env="ARM_VIDEO_MAX_SAMPLE_FPS")
+    ARM_VIDEO_MAX_SECONDS: float = Field(15.0, env="ARM_VIDEO_MAX_SECONDS")
+    ARM_VIDEO_MAX_SIDE: int = Field(640, env="ARM_VIDEO_MAX_SIDE")
+    ARM_VIDEO_EDGE_SECONDS: float = Field(1.0, env="ARM_VIDEO_EDGE_SECONDS")
+    ARM_VIDEO_MAX_MB: int = Field(50, env="ARM_VIDEO_MAX_MB")
+    ARM_VIDEO_MAX_FRAMES: int = Field(300, env="ARM_VIDEO_MAX_FRAMES")
+
+    # 실시간 얼굴 스트림(WebSocket): 프로세스당 동시 연결 수 / 공용 계산 스레드 수 / 연결당 최대 처리 fps /
+    # 프레임 크기 상한(KB) / 추적용 긴 변(px) / 확률 지수평활 계수 / 프레임 없이 유지하는 시간(초)
+    FACE_STREAM_MAX_SESSIONS: int = Field(32, env="FACE_STREAM_MAX_SESSIONS")
+    FACE_STREAM_THREADS: int = Field(4, env="FACE_STREAM_THREADS")
+    FACE_STREAM_MAX_FPS: float = Field(8.0, env="FACE_STREAM_MAX_FPS")
+    FACE_STREAM_MAX_FRAME_KB: int = Field(256, env="FACE_STREAM_MAX_FRAME_KB")
+    FACE_STREAM_MAX_SIDE: int = Field(480, env="FACE_STREAM_MAX_SIDE")
+    FACE_STREAM_SMOOTHING: float = Field(0.3, env="FACE_STREAM_SMOOTHING")
+    FACE_STREAM_IDLE_SECONDS: float = Field(30.0, env="FACE_STREAM_IDLE_SECONDS")
+
+    # 모델 레지스트리: 프로세스당 상주 모델 메모리 예산(MB)과 디스크 변경 감지 주기(초)
+    MODEL_CACHE_MAX_MB: int = Field(512, env="MODEL_CACHE_MAX_MB")
+    MODEL_RELOAD_CHECK_SECONDS: float = Field(5.0, env="MODEL_RELOAD_CHECK_SECONDS")
+
+    # 섀도 평가: 후보 모델 버전(비우면 끔)을 본 요청과 같은 피처로 응답 후 백그라운드에서 추론해 나란히 기록
+    # 섀도 스레드 수 / 대기열 길이 / 측정 실행기 사용률이 이 비율 이상이면 섀도 작업부터 버림 / DB 일괄 기록 행 수
+    FACE_SHADOW_VERSION: str = Field("", env="FACE_SHADOW_VERSION")
+    ARM_SHADOW_VERSION: str = Field("", env="ARM_SHADOW_VERSION")
+    SHADOW_WORKERS: int = Field(1, env="SHADOW_WORKERS")
+    SHADOW_QUEUE_SIZE: int = Field(256, env="SHADOW_QUEUE_SIZE")
+    SHADOW_SHED_LOAD_RATIO: float = Field(0.5, env="SHADOW_SHED_LOAD_RATIO")
+    SHADOW_FLUSH_ROWS: int = Field(50, env="SHADOW_FLUSH_ROWS")
+
+    # MediaPipe 검출기 풀: 워커당 최대 인스턴스 수 / 모두 사용 중일 때 대기 한도(초)
+    DETECTOR_POOL_SIZE: int = Field(4, env="DETECTOR_POOL_SIZE")
+    DETECTOR_ACQUIRE_TIMEOUT: float = Field(30.0, env="DETECTOR_ACQUIRE_TIMEOUT")
+
+    # 랜드마크 검출용 이미지 긴 변 상한(px). JPEG 는 축소 디코딩으로 처리, 0 이면 원본 해상도
+    INGEST_MAX_SIDE: int = Field(1280, env="INGEST_MAX_SIDE")
+
+    # 이미지 조회 ?size=small|medium 축소본의 긴 변(px)
+    THUMB_SMALL_SIDE: int = Field(160, env="THUMB_SMALL_SIDE")
+    THUMB_MEDIUM_SIDE: int = Field(480, env="THUMB_MEDIUM_SIDE")
+
+    # 측정(디코딩/랜드마크/추론) 실행기: process | thread | inline
+    # - 동시 처리 한도 = WORKERS + QUEUE_SIZE, 초과 시 즉시 503
+    EXECUTOR_MODE: str = Field("process", env="EXECUTOR_MODE")
+    EXECUTOR_WORKERS: int = Field(2, env="EXECUTOR_WORKERS")
+    EXECUTOR_QUEUE_SIZE: int = Field(8, env="EXECUTOR_QUEUE_SIZE")
+
+    # 시작 시 예열(모델/검출기 로딩 + 더미 추론)할 모달리티 (쉼표 구분, '' 이면 예열 안 함 → 인증 전용 워커 등)
+    WARMUP_MODALITIES: str = Field("face,arm,speech", env="WARMUP_MODALITIES")
+    # 폴백 모델(항상 0.5)로 떠 있는 상태도 /ready 200 으로 볼지
+    READY_ALLOW_DEGRADED: bool = Field(False, env="READY_ALLOW_DEGRADED")
+
+    # 측정 결과 캐시 (입력 해시 + 모델 버전 + 임계치 키): 메모리 LRU 항목 수 / 디스크 경로('' 이면 끔) / 디스크 한도(MB)
+    RESULT_CACHE_ENABLED: bool = Field(True, env="RESULT_CACHE_ENABLED")
+    RESULT_CACHE_MAX_ENTRIES: int = Field(1024, env="RESULT_CACHE_MAX_ENTRIES")
+    RESULT_CACHE_DIR: str = Field("app/cache/results", env="RESULT_CACHE_DIR")
+    RESULT_CACHE_DISK_MAX_MB: int = Field(256, env="RESULT_CACHE_DISK_MAX_MB")
+
+    # 이미지 원본 저장소 (DB 에는 sha256 키만 저장): local
+    BLOB_STORE_BACKEND: str = Field("local", env="BLOB_STORE_BACKEND")
+    BLOB_STORE_DIR: str = Field("app/storage/blobs", env="BLOB_STORE_DIR")
+
     # 개발 편의를 위한 CORS 기본값(프론트 로컬)
     FRONTEND_ORIGIN: str = Field("http://localhost:5173", env="FRONTEND_ORIGIN")
 
@@ -49,19 +155,33 @@ class Settings(BaseSettings):
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    # 비동기 엔진용 URL (aiomysql)
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return (
+            f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        )
+
 
 # === 헬퍼 함수들 ===
-def model_dir(modality: Modality) -> str:
+def model_version(modality: Modality) -> str:
     """
-    모달리티/버전 조합으로 실제 모델 디렉토리 경로 반환.
-    예: app/assets/models/face/v1
+    모달리티별 현재 활성 모델 버전 반환 (런타임에 settings 값을 바꾸면 즉시 반영).
     """
-    ver = {
+    return {
         "face": settings.FACE_MODEL_VERSION,
         "arm": settings.ARM_MODEL_VERSION,
         "speech": settings.SPEECH_MODEL_VERSION,
     }[modality]
-    return f"{settings.MODEL_DIR_BASE}/{modality}/{ver}"
+
+
+def model_dir(modality: Modality) -> str:
+    """
+    모달리티/버전 조합으로 실제 모델 디렉토리 경로 반환.
+    예: app/assets/models/face/v1
+    """
+    return f"{settings.MODEL_DIR_BASE}/{modality}/{model_version(modality)}"
 
 
 def threshold(modality: Modality) -> float:
@@ -75,5 +195,16 @@ def threshold(modality: Modality) -> float:
     }[modality]
 
 
+def batch_config(modality: Modality) -> Tuple[int, float]:
+    """
+    모달리티별 (최대 배치 크기, 최대 대기 ms) 반환.
+    """
+    return {
+        "face": (settings.FACE_BATCH_MAX_SIZE, settings.FACE_BATCH_MAX_WAIT_MS),
+        "arm": (settings.ARM_BATCH_MAX_SIZE, settings.ARM_BATCH_MAX_WAIT_MS),
+        "speech": (settings.SPEECH_BATCH_MAX_SIZE, settings.SPEECH_BATCH_MAX_WAIT_MS),
+    }[modality]
+
+
 # 싱글톤 설정 인스턴스
 settings = Settings()
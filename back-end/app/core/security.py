@@ -1,17 +1,39 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from starlette.requests import Request
 from app.core.config import settings
+from app.core.ttl_cache import MISS, TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# 검증된 토큰 → 사용자 id (인증 요청마다 HMAC 검증을 반복하지 않도록)
+#  - 키는 토큰 sha256 (원문 토큰은 메모리에 남기지 않음), 유지 시간은 토큰 exp 를 넘지 않는다
+#  - 검증 실패는 저장하지 않으므로 잘못된 토큰은 매번 jwt.decode 로 거절된다
+token_cache = TTLCache(max_entries=settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+
 def create_access_token(subject: str) -> str:
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode = {"sub": subject, "exp": expire}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
+def _token_subject(token: str) -> Optional[str]:
+    """서명/만료 검증 후 sub (없으면 None). 검증 실패는 JWTError."""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    user_id = token_cache.get(key)
+    if user_id is not MISS:
+        return user_id
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    user_id = payload.get("sub")
+    if user_id:
+        exp = payload.get("exp")
+        token_cache.put(key, user_id, ttl=float(exp) - time.time() if exp is not None else None)
+    return user_id
+
 def verify_token(token: str = Depends(oauth2_scheme)) -> str:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -19,8 +41,7 @@ def verify_token(token: str = Depends(oauth2_scheme)) -> str:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
+        user_id = _token_subject(token)
         if user_id is None:
             raise credentials_exception
         return user_id
@@ -33,8 +54,7 @@ def get_user_id_from_cookie(request: Request) -> str:
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
+        user_id = _token_subject(token)
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
         return user_id
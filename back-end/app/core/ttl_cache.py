@@ -0,0 +1,67 @@
+# back-end/app/core/ttl_cache.py
+"""
+항목별 만료 시각을 갖는 작은 메모리 LRU (스레드 안전, 프로세스 로컬).
+인증 토큰 검증 결과·사용자 프로필처럼 자주 읽고 드물게 바뀌는 값을 요청마다 다시 계산/조회하지 않기 위한 것.
+워커 프로세스끼리는 공유하지 않으므로 다른 프로세스에서 바뀐 값은 TTL 이 지나야 반영된다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+MISS = object()
+
+
+class TTLCache:
+    def __init__(self, *, max_entries: int, ttl: float):
+        self.max_entries = max(0, max_entries)
+        self.ttl = max(0.0, ttl)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0}
+
+    def get(self, key: Hashable) -> Any:
+        """값 또는 MISS (만료된 항목은 지우고 MISS)."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._counters["misses"] += 1
+                return MISS
+            deadline, value = item
+            if deadline <= now:
+                del self._data[key]
+                self._counters["expired"] += 1
+                return MISS
+            self._data.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """ttl 은 기본 TTL 보다 짧을 때만 적용 (예: 토큰 만료까지 남은 시간)."""
+        ttl = self.ttl if ttl is None else min(self.ttl, ttl)
+        if self.max_entries == 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counters)
+            out["entries"] = len(self._data)
+        lookups = out["hits"] + out["misses"] + out["expired"]
+        out["hit_rate"] = round(out["hits"] / lookups, 4) if lookups else 0.0
+        return out
@@ -1,32 +1,134 @@
+import asyncio
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional, Any, Dict
+from typing import Literal, Optional, Any, Dict, Tuple
+import numpy as np
 from app.models.arm import Arm  # ★ Arm으로 변경
+from app.services.features.packing import unpack_stack
+from app.services.metrics import STAGE_LATENCY
+from app.services.storage.blob_store import get_blob_store
 
-def create_arm(
-    db: Session,
+def _new_arm(
     *,
-    user_id:str,
+    user_id: str,
+    start_key: str,
     start_bytes: bytes,
     start_mime: str,
+    end_key: str,
     end_bytes: bytes,
     end_mime: str,
     label: Optional[str],
     confidence: Optional[float],
-    features: Optional[Dict[str, Any]] = None,
+    features: Optional[Dict[str, Any]],
+    packed: Dict[str, Any],
 ) -> Arm:
-    row = Arm(
+    return Arm(
         user_id=user_id,
-        start_image_blob=start_bytes,
+        start_image_key=start_key,
         start_image_mime=start_mime or "image/png",
         start_image_size=len(start_bytes) if start_bytes else None,
-        end_image_blob=end_bytes,
+        end_image_key=end_key,
         end_image_mime=end_mime or "image/png",
         end_image_size=len(end_bytes) if end_bytes else None,
         label=label,
         confidence=confidence,
         features_json=features,
+        **packed,  # feature_schema / features_bin / landmarks_bin (packing.packed_columns)
+    )
+
+def create_arm(
+    db: Session,
+    *,
+    user_id:str,
+    start_bytes: bytes,
+    start_mime: str,
+    end_bytes: bytes,
+    end_mime: str,
+    label: Optional[str],
+    confidence: Optional[float],
+    features: Optional[Dict[str, Any]] = None,
+    **packed: Any,
+) -> Arm:
+    # 원본은 저장소에 먼저 쓰고 행에는 키만 남긴다
+    store = get_blob_store()
+    with STAGE_LATENCY.time("arm", "blob_write"):
+        start_key, end_key = store.put(start_bytes), store.put(end_bytes)
+    row = _new_arm(
+        user_id=user_id,
+        start_key=start_key, start_bytes=start_bytes, start_mime=start_mime,
+        end_key=end_key, end_bytes=end_bytes, end_mime=end_mime,
+        label=label, confidence=confidence, features=features, packed=packed,
     )
     db.add(row)
-    db.commit()
+    with STAGE_LATENCY.time("arm", "db_commit"):
+        db.commit()
     db.refresh(row)
     return row
+
+async def create_arm_async(
+    db: AsyncSession,
+    *,
+    user_id: str,
+    start_bytes: bytes,
+    start_mime: str,
+    end_bytes: bytes,
+    end_mime: str,
+    label: Optional[str],
+    confidence: Optional[float],
+    features: Optional[Dict[str, Any]] = None,
+    **packed: Any,
+) -> Arm:
+    store = get_blob_store()
+    # 파일 쓰기는 스레드에서 (두 장 동시에)
+    with STAGE_LATENCY.time("arm", "blob_write"):
+        start_key, end_key = await asyncio.gather(
+            asyncio.to_thread(store.put, start_bytes),
+            asyncio.to_thread(store.put, end_bytes),
+        )
+    row = _new_arm(
+        user_id=user_id,
+        start_key=start_key, start_bytes=start_bytes, start_mime=start_mime,
+        end_key=end_key, end_bytes=end_bytes, end_mime=end_mime,
+        label=label, confidence=confidence, features=features, packed=packed,
+    )
+    db.add(row)
+    with STAGE_LATENCY.time("arm", "db_commit"):
+        await db.commit()
+    await db.refresh(row)
+    return row
+
+def get_arm_image(db: Session, arm_id: int, side: Literal["start", "end"]) -> Optional[Row]:
+    """
+    한쪽 이미지 응답(ETag/304 판단)에 필요한 컬럼만: (key, mime, created_at).
+    LONGBLOB 은 읽지 않는다.
+    """
+    cols = {
+        "start": (Arm.start_image_key, Arm.start_image_mime),
+        "end": (Arm.end_image_key, Arm.end_image_mime),
+    }[side]
+    return db.execute(select(*cols, Arm.created_at).where(Arm.arm_id == arm_id)).first()
+
+def get_arm_image_blob(db: Session, arm_id: int, side: Literal["start", "end"]) -> Optional[bytes]:
+    """저장소로 이관되기 전 행의 한쪽 DB 원본 (이관된 행은 None)."""
+    col = Arm.start_image_blob if side == "start" else Arm.end_image_blob
+    return db.execute(select(col).where(Arm.arm_id == arm_id)).scalar()
+
+# ── 압축 피처/랜드마크 일괄 조회 (재계산·분석용): JSON 파싱 없이 blob 을 이어 붙여 한 번에 배열로 ──
+def _packed_rows(column, *, where=(), after_id: Optional[int], limit: int):
+    q = select(Arm.arm_id, column).where(column.is_not(None), *where).order_by(Arm.arm_id).limit(limit)
+    return q.where(Arm.arm_id > after_id) if after_id is not None else q
+
+def _stack(rows) -> Tuple[np.ndarray, np.ndarray]:
+    ids = np.array([r[0] for r in rows], dtype=np.int64)
+    return ids, unpack_stack([r[1] for r in rows])
+
+def get_arm_feature_matrix(db: Session, *, schema: str, after_id: Optional[int] = None, limit: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """schema 로 저장된 행 (PK 순, after_id 다음부터) → (arm_id (N,), (N, 16) float32). 이름은 packing.schema_names(schema)."""
+    rows = db.execute(_packed_rows(Arm.features_bin, where=(Arm.feature_schema == schema,), after_id=after_id, limit=limit)).all()
+    return _stack(rows)
+
+def get_arm_landmarks(db: Session, *, after_id: Optional[int] = None, limit: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """시작/끝 손 랜드마크가 있는 행 (PK 순) → (arm_id (N,), (N, 2, 2, 21, 2) float32, 미검출 손은 NaN)."""
+    return _stack(db.execute(_packed_rows(Arm.landmarks_bin, after_id=after_id, limit=limit)).all())
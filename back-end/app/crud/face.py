@@ -1,38 +1,136 @@
 # back-end/app/crud/face.py
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+# 동기(Session) 함수와 같은 이름의 *_async(AsyncSession) 변형을 함께 둔다 (쿼리는 공유)
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple
+import numpy as np
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 from app.models.face import Face
+from app.services.features.packing import unpack_stack
+from app.services.metrics import STAGE_LATENCY
+from app.services.storage.blob_store import get_blob_store
 
-def create_face(
-    db: Session,
+def _new_face(
     *,
     user_id: str,
-    image_bytes: bytes,
+    image_key: str,
     image_mime: str,
     image_size: Optional[int],
-    result_text: str, 
-    landmarks_json: Optional[Dict[str, Any]] = None,
+    result_text: str,
+    landmarks_json: Optional[Dict[str, Any]],
+    packed: Dict[str, Any],
 ) -> Face:
-    face = Face(
+    return Face(
         user_id=user_id,
-        image_blob=image_bytes,
+        image_key=image_key,
         image_mime=image_mime,
         image_size=image_size,
         result_text=result_text,
         landmarks_json=landmarks_json,
+        **packed,  # feature_schema / features_bin / landmarks_bin (packing.packed_columns)
+    )
+
+def create_face(
+    db: Session,
+    *,
+    user_id: str,
+    image_bytes: bytes,
+    image_mime: str,
+    image_size: Optional[int],
+    result_text: str, 
+    landmarks_json: Optional[Dict[str, Any]] = None,
+    **packed: Any,
+) -> Face:
+    # 원본은 저장소에 먼저 쓰고(같은 이미지는 중복 저장 안 됨) 행에는 키만 남긴다
+    with STAGE_LATENCY.time("face", "blob_write"):
+        image_key = get_blob_store().put(image_bytes)
+    face = _new_face(
+        user_id=user_id, image_key=image_key, image_mime=image_mime, image_size=image_size,
+        result_text=result_text, landmarks_json=landmarks_json, packed=packed,
     )
     db.add(face)
-    db.commit()
+    with STAGE_LATENCY.time("face", "db_commit"):
+        db.commit()
     db.refresh(face)
     return face
 
-def get_latest_face_by_user(db: Session, user_id: str) -> Optional[Face]:
+async def create_face_async(
+    db: AsyncSession,
+    *,
+    user_id: str,
+    image_bytes: bytes,
+    image_mime: str,
+    image_size: Optional[int],
+    result_text: str,
+    landmarks_json: Optional[Dict[str, Any]] = None,
+    **packed: Any,
+) -> Face:
+    with STAGE_LATENCY.time("face", "blob_write"):
+        image_key = await asyncio.to_thread(get_blob_store().put, image_bytes)  # 파일 쓰기는 스레드에서
+    face = _new_face(
+        user_id=user_id, image_key=image_key, image_mime=image_mime, image_size=image_size,
+        result_text=result_text, landmarks_json=landmarks_json, packed=packed,
+    )
+    db.add(face)
+    with STAGE_LATENCY.time("face", "db_commit"):
+        await db.commit()
+    await db.refresh(face)
+    return face
+
+# FaceOut 에 필요한 컬럼만 (원본/랜드마크 JSON 은 읽지 않음)
+_FACE_META = load_only(Face.face_id, Face.user_id, Face.result_text, Face.created_at)
+
+def _faces_by_user(user_id: str) -> Select:
+    # (user_id, created_at) 인덱스 역순 스캔, 동시각은 PK 로 결정
     return (
-        db.query(Face)
-        .filter(Face.user_id == user_id)
-        .order_by(Face.created_at.desc())
-        .first()
+        select(Face)
+        .options(_FACE_META)
+        .where(Face.user_id == user_id)
+        .order_by(Face.created_at.desc(), Face.face_id.desc())
     )
 
-def get_face_image_blob(db: Session, face_id: int) -> Optional[Face]:
-    return db.query(Face).filter(Face.face_id == face_id).first()
+def get_latest_face_by_user(db: Session, user_id: str) -> Optional[Face]:
+    return db.execute(_faces_by_user(user_id).limit(1)).scalars().first()
+
+async def get_latest_face_by_user_async(db: AsyncSession, user_id: str) -> Optional[Face]:
+    return (await db.execute(_faces_by_user(user_id).limit(1))).scalars().first()
+
+def list_faces_by_user(db: Session, user_id: str, *, limit: int = 20, offset: int = 0) -> List[Face]:
+    return list(db.execute(_faces_by_user(user_id).offset(offset).limit(limit)).scalars())
+
+async def list_faces_by_user_async(db: AsyncSession, user_id: str, *, limit: int = 20, offset: int = 0) -> List[Face]:
+    return list((await db.execute(_faces_by_user(user_id).offset(offset).limit(limit))).scalars())
+
+def _image_meta(face_id: int) -> Select:
+    return select(Face.user_id, Face.image_key, Face.image_mime, Face.created_at).where(Face.face_id == face_id)
+
+def get_face_image_meta(db: Session, face_id: int) -> Optional[Row]:
+    """이미지 응답(ETag/304 판단)에 필요한 컬럼만: (user_id, image_key, image_mime, created_at)."""
+    return db.execute(_image_meta(face_id)).first()
+
+async def get_face_image_meta_async(db: AsyncSession, face_id: int) -> Optional[Row]:
+    return (await db.execute(_image_meta(face_id))).first()
+
+def get_face_image_blob(db: Session, face_id: int) -> Optional[bytes]:
+    """저장소로 이관되기 전 행의 DB 원본 (이관된 행은 None)."""
+    return db.execute(select(Face.image_blob).where(Face.face_id == face_id)).scalar()
+
+# ── 압축 피처/랜드마크 일괄 조회 (재계산·분석용): JSON 파싱 없이 blob 을 이어 붙여 한 번에 배열로 ──
+def _packed_rows(column, *, where=(), after_id: Optional[int], limit: int) -> Select:
+    q = select(Face.face_id, column).where(column.is_not(None), *where).order_by(Face.face_id).limit(limit)
+    return q.where(Face.face_id > after_id) if after_id is not None else q
+
+def _stack(rows) -> Tuple[np.ndarray, np.ndarray]:
+    ids = np.array([r[0] for r in rows], dtype=np.int64)
+    return ids, unpack_stack([r[1] for r in rows])
+
+def get_face_feature_matrix(db: Session, *, schema: str, after_id: Optional[int] = None, limit: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """schema 로 저장된 행 (PK 순, after_id 다음부터) → (face_id (N,), (N, F) float32). 이름은 packing.schema_names(schema)."""
+    rows = db.execute(_packed_rows(Face.features_bin, where=(Face.feature_schema == schema,), after_id=after_id, limit=limit)).all()
+    return _stack(rows)
+
+def get_face_landmarks(db: Session, *, after_id: Optional[int] = None, limit: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """원 랜드마크가 있는 행 (PK 순) → (face_id (N,), (N, 478, 3) float32)."""
+    return _stack(db.execute(_packed_rows(Face.landmarks_bin, after_id=after_id, limit=limit)).all())
@@ -1,12 +1,14 @@
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from app.models.user import User
 from app.schemas.user import UserCreate
 from typing import Optional
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.user import User
-
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.core.ttl_cache import MISS, TTLCache
+from app.services.password_hasher import password_hasher, pwd_ctx
 
 def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
@@ -14,9 +16,39 @@ def get_user_by_email(db: Session, email: str) -> User | None:
 def get_user_by_id(db: Session, user_id: str) -> User | None:
     return db.query(User).filter(User.id == user_id).first()
 
-def create_user(db: Session, user_in: UserCreate) -> User:
-    hashed = pwd_ctx.hash(user_in.password)
-    db_user = User(
+async def get_user_by_email_async(db: AsyncSession, email: str) -> User | None:
+    return (await db.execute(select(User).where(User.email == email))).scalars().first()
+
+async def get_user_by_id_async(db: AsyncSession, user_id: str) -> User | None:
+    return await db.get(User, user_id)
+
+async def find_signup_conflict_async(db: AsyncSession, user_id: str, email: str) -> str | None:
+    """아이디/이메일 중복을 쿼리 한 번으로 확인 → "id" / "email" / None (둘 다 겹치면 "id")."""
+    rows = (await db.execute(
+        select(User.id, User.email).where(or_(User.id == user_id, User.email == email)).limit(2)
+    )).all()
+    if any(r.id == user_id for r in rows):
+        return "id"
+    return "email" if rows else None
+
+# 사용자 id → 이름 (측정 결과 문구용). 사용자 정보를 쓰는 함수는 invalidate_user_profile 을 불러야 한다
+_profile_cache = TTLCache(max_entries=settings.USER_PROFILE_CACHE_SIZE, ttl=settings.USER_PROFILE_CACHE_TTL)
+
+async def get_user_name_async(db: AsyncSession, user_id: str) -> str | None:
+    name = _profile_cache.get(user_id)
+    if name is not MISS:
+        return name
+    user = await get_user_by_id_async(db, user_id)
+    if user is None:  # 없는 사용자는 저장하지 않음 (가입 직후 바로 보이도록)
+        return None
+    _profile_cache.put(user_id, user.name)
+    return user.name
+
+def invalidate_user_profile(user_id: str) -> None:
+    _profile_cache.invalidate(user_id)
+
+def _new_user(user_in: UserCreate, hashed: str) -> User:
+    return User(
         id=user_in.id,
         email=user_in.email,
         password_hash=hashed,
@@ -26,13 +58,31 @@ def create_user(db: Session, user_in: UserCreate) -> User:
         gender=user_in.gender,
         privacy_agreed=user_in.privacy_agreed,
     )
+
+def create_user(db: Session, user_in: UserCreate) -> User:
+    hashed = pwd_ctx.hash(user_in.password)
+    db_user = _new_user(user_in, hashed)
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    invalidate_user_profile(db_user.id)
+    return db_user
+
+async def create_user_async(db: AsyncSession, user_in: UserCreate) -> User:
+    # bcrypt 해시는 CPU 를 오래 쓰므로 전용 해시 풀에서
+    hashed = await password_hasher.hash(user_in.password)
+    db_user = _new_user(user_in, hashed)
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    invalidate_user_profile(db_user.id)
     return db_user
 
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_ctx.verify(plain, hashed)
 
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await password_hasher.verify(plain, hashed)
+
 def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
\ No newline at end of file
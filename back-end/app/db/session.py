@@ -1,13 +1,28 @@
 # back-end/app/db/session.py
+from typing import AsyncIterator, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+
+def _pool_options() -> dict:
+    return dict(
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+
 # Settings.DATABASE_URL 프로퍼티에서 조합된 문자열을 사용
+# (동기 엔진: def 엔드포인트 — FastAPI 가 스레드풀에서 실행하므로 루프를 막지 않음)
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    future=True
+    future=True,
+    **_pool_options(),
 )
 
 SessionLocal = sessionmaker(
@@ -23,3 +38,36 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ── 비동기 엔진: async def 엔드포인트용 (aiomysql) ─────────────────────────────
+# 드라이버는 첫 사용 시에만 로딩 (동기 경로만 쓰는 도구/테스트는 aiomysql 없이도 동작)
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, **_pool_options())
+    return _async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        # commit 후에도 응답 직렬화에서 속성을 읽을 수 있도록 expire 하지 않음
+        _async_sessionmaker = async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_sessionmaker()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = _async_sessionmaker = None
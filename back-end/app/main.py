@@ -1,12 +1,23 @@
 # back-end/app/main.py
 from __future__ import annotations
 
-from fastapi import FastAPI
+import threading
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1.routers import api_router
 from app.api.v1.endpoints.arm_predict import router as arm_predict_router
 from app.core.config import settings
+from app.db.session import dispose_async_engine
+from app.services.features.detector_pool import shutdown_detector_pools
+from app.services.executor import ExecutorSaturated, measure_executor
+from app.services.face_stream import shutdown_face_stream
+from app.services.metrics import MetricsMiddleware, registry
+from app.services.password_hasher import password_hasher
+from app.services.readiness import readiness, run_startup_warmup
+from app.services.shadow import shadow_evaluator
 # from app.db.base import Base
 # from app.db.session import engine, ping_db
 
@@ -54,16 +65,57 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # 라우트별 지연/상태 히스토그램 (가장 바깥에서 측정)
+    app.add_middleware(MetricsMiddleware)
 
     # /api/v1/* 엔드포인트
     app.include_router(api_router, prefix="/api/v1")
     # /api/v1/arm/* (모듈 내부 prefix 가정)
     app.include_router(arm_predict_router)
 
+    # 측정 워커/모델 예열은 백그라운드에서 (이벤트 루프/헬스체크를 막지 않음), 진행 상태는 /ready
+    @app.on_event("startup")
+    def _start_executor():
+        threading.Thread(target=run_startup_warmup, name="executor-warmup", daemon=True).start()
+
+    # 워커 종료 시 실행기/MediaPipe 그래프 해제
+    @app.on_event("shutdown")
+    def _shutdown_workers():
+        measure_executor.shutdown()
+        shutdown_face_stream()
+        shadow_evaluator.shutdown()
+        password_hasher.shutdown()
+        shutdown_detector_pools()
+
+    # 비동기 DB 커넥션 풀 정리 (사용한 적 없으면 아무 것도 안 함)
+    @app.on_event("shutdown")
+    async def _dispose_async_db():
+        await dispose_async_engine()
+
+    # 측정 대기열 포화 → 기다리게 하지 않고 즉시 503
+    @app.exception_handler(ExecutorSaturated)
+    async def _executor_saturated(request: Request, exc: ExecutorSaturated):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."},
+            headers={"Retry-After": "1"},
+        )
+
     @app.get("/health")
     def health():
         return {"status": "ok"}
 
+    # 모델 예열까지 끝나 측정 요청을 받아도 되는지 (아니면 503 + 모달리티별 상태)
+    @app.get("/ready")
+    def ready():
+        body = {"ready": readiness.is_ready(), **readiness.snapshot()}
+        return JSONResponse(status_code=200 if body["ready"] else 503, content=body)
+
+    # Prometheus 텍스트 포맷 메트릭 (측정 워커에서 쌓인 값은 작업 결과와 함께 합쳐져 있음)
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
     # 라우트 디버깅용 핑 (선택)
     @app.get("/api/v1/ping")
     def ping():
@@ -1,19 +1,25 @@
 # back-end/app/models/arm.py
-from sqlalchemy import Column, BigInteger, String, Integer, Float, JSON, ForeignKey, text
+from sqlalchemy import Column, BigInteger, String, Integer, Float, JSON, ForeignKey, Index, LargeBinary, text
+from sqlalchemy.orm import deferred
 from sqlalchemy.dialects.mysql import LONGBLOB, DATETIME as MySQLDateTime
 from app.db.base import Base
 
 class Arm(Base):
     __tablename__ = "arm"
+    # 사용자별 최신/목록 조회용
+    __table_args__ = (Index("ix_arm_user_id_created_at", "user_id", "created_at"),)
 
     arm_id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey("user.id"), nullable=False)
 
-    start_image_blob = Column(LONGBLOB, nullable=False)
+    # 원본은 blob 저장소(sha256 키)에 저장. *_blob 은 이관 전 기존 행에만 남아 있음
+    start_image_key  = Column(String(64), nullable=True)
+    start_image_blob = deferred(Column(LONGBLOB, nullable=True))  # 접근할 때만 로딩
     start_image_mime = Column(String(64), nullable=False, default="image/jpeg")
     start_image_size = Column(Integer, nullable=True)
 
-    end_image_blob   = Column(LONGBLOB, nullable=False)
+    end_image_key    = Column(String(64), nullable=True)
+    end_image_blob   = deferred(Column(LONGBLOB, nullable=True))
     end_image_mime   = Column(String(64), nullable=False, default="image/jpeg")
     end_image_size   = Column(Integer, nullable=True)
 
@@ -21,6 +27,12 @@ class Arm(Base):
     confidence   = Column(Float, nullable=True)
     features_json = Column(JSON, nullable=True)
 
+    # 압축 피처(float32, feature_schema 순서) + 시작/끝 손 랜드마크 (2×2×21×2 float32, 미검출 NaN)
+    # 형식/디코딩은 services/features/packing.py
+    feature_schema = Column(String(64), nullable=True)
+    features_bin   = deferred(Column(LargeBinary, nullable=True))
+    landmarks_bin  = deferred(Column(LargeBinary, nullable=True))
+
     # ✅ MySQL DATETIME(6)과 동일하게 선언
     created_at = Column(
         MySQLDateTime(fsp=6),
@@ -1,14 +1,18 @@
-from sqlalchemy import Column, String, BigInteger, LargeBinary, JSON, DateTime, Integer, text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, BigInteger, LargeBinary, JSON, DateTime, Integer, Index, text, ForeignKey
+from sqlalchemy.orm import deferred, relationship
 from app.db.base import Base
 
 class Face(Base):
     __tablename__ = "face"
+    # 사용자별 최신/목록 조회: (user_id, created_at) 인덱스 역순 스캔으로 끝남
+    __table_args__ = (Index("ix_face_user_id_created_at", "user_id", "created_at"),)
 
     face_id        = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id        = Column(String(50), ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False)
 
-    image_blob     = Column(LargeBinary, nullable=False)
+    # 원본은 blob 저장소(sha256 키)에 저장. image_blob 은 이관 전 기존 행에만 남아 있음
+    image_key      = Column(String(64), nullable=True)
+    image_blob     = deferred(Column(LargeBinary, nullable=True))  # 접근할 때만 로딩
     image_mime     = Column(String(64), nullable=False, server_default="image/jpeg")
     image_size     = Column(Integer, nullable=True)
 
@@ -18,6 +22,12 @@ class Face(Base):
     # 선택: 특징값/랜드마크 메타(아래 리스트의 값들을 JSON으로 보낼 때 저장)
     landmarks_json = Column(JSON, nullable=True)
 
+    # 서버에서 측정한 경우: 압축 피처(float32, feature_schema 순서) + 원 FaceMesh 랜드마크 (478×3 float32)
+    # 형식/디코딩은 services/features/packing.py — 피처 계산이 바뀌어도 MediaPipe 를 다시 돌리지 않고 재계산
+    feature_schema = Column(String(64), nullable=True)
+    features_bin   = deferred(Column(LargeBinary, nullable=True))
+    landmarks_bin  = deferred(Column(LargeBinary, nullable=True))
+
     created_at     = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP(6)"), nullable=False)
     updated_at     = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)"), nullable=False)
 
@@ -0,0 +1,25 @@
+# back-end/app/models/rescore.py
+from sqlalchemy import Column, String, BigInteger, Integer, Float, JSON, DateTime, Index, func
+from app.db.base import Base
+
+class RescoreResult(Base):
+    """
+    오프라인 재채점 결과 (python -m app.tools.rescore).
+    모델 버전별로 한 벌씩: (modality, model_version, source_key) 가 키라서 같은 버전을 다시 돌려도 덮어쓴다.
+    """
+    __tablename__ = "rescore_result"
+    # 원본 측정(face/arm)과 조인해 버전 간 비교할 때
+    __table_args__ = (Index("ix_rescore_result_source_id", "modality", "source_id"),)
+
+    modality      = Column(String(16), primary_key=True)
+    model_version = Column(String(64), primary_key=True)
+    # DB 원본이면 PK 문자열, 디렉터리면 루트 기준 상대 경로
+    source_key    = Column(String(512), primary_key=True)
+    source_id     = Column(BigInteger, nullable=True)  # face.face_id / arm.arm_id (디렉터리 원본은 NULL)
+
+    proba         = Column(Float, nullable=True)
+    pred_label    = Column(Integer, nullable=True)
+    error         = Column(String(255), nullable=True)  # 디코딩/검출 실패 사유 (proba 는 NULL)
+    features_json = Column(JSON, nullable=True)  # --with-features 일 때만
+
+    created_at    = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
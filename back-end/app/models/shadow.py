@@ -0,0 +1,25 @@
+# back-end/app/models/shadow.py
+from sqlalchemy import Column, String, BigInteger, Integer, Float, DateTime, Index, func
+from app.db.base import Base
+
+class ShadowResult(Base):
+    """섀도 평가 1건: 본 요청(활성 버전) 결과와 같은 피처로 돌린 후보 버전 결과를 나란히 (오프라인 비교용)."""
+    __tablename__ = "shadow_result"
+    # 후보 버전별 기간 집계용
+    __table_args__ = (Index("ix_shadow_result_version_created_at", "modality", "shadow_version", "created_at"),)
+
+    shadow_id         = Column(BigInteger, primary_key=True, autoincrement=True)
+    modality          = Column(String(16), nullable=False)
+    source_id         = Column(BigInteger, nullable=True)  # 저장된 측정이면 arm.arm_id (face 예측 전용 요청은 NULL)
+
+    primary_version   = Column(String(64), nullable=False)
+    primary_proba     = Column(Float, nullable=False)
+    primary_label     = Column(Integer, nullable=False)
+
+    shadow_version    = Column(String(64), nullable=False)
+    shadow_proba      = Column(Float, nullable=True)
+    shadow_label      = Column(Integer, nullable=True)
+    shadow_latency_ms = Column(Float, nullable=True)
+    error             = Column(String(255), nullable=True)  # 후보 모델 로딩/추론 실패
+
+    created_at        = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
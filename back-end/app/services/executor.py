@@ -0,0 +1,205 @@
+# back-end/app/services/executor.py
+"""
+CPU 바운드 측정 작업(디코딩 → 랜드마크 → 추론)을 이벤트 루프 밖에서 실행하는 계층.
+- process: 워커 프로세스 풀(모델/검출기 상주), 이미지는 공유메모리로 전달
+- thread : 스레드 풀 (개발/디버그용, GIL 영향 있음)
+- inline : 호출 스레드에서 바로 실행 (테스트용)
+동시 처리 한도(워커 + 대기열)를 넘으면 기다리지 않고 ExecutorSaturated 를 던진다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.services import jobs
+from app.services.metrics import EXECUTOR_REJECTED, JOB_LATENCY, registry
+
+
+class ExecutorSaturated(RuntimeError):
+    """대기열이 가득 차 작업을 받을 수 없음 (→ 503)."""
+
+
+class MeasureExecutor:
+    def __init__(self, *, mode: str, workers: int, queue_size: int):
+        if mode not in ("process", "thread", "inline"):
+            raise ValueError(f"unknown EXECUTOR_MODE: {mode}")
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_size)
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._inflight = 0
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    # ── 수명주기 ────────────────────────────────────────────────────────────
+    def start(self) -> None:
+        """풀 생성 + 모든 워커를 미리 띄워 모델을 올려 둔다."""
+        pool = self._ensure_pool()
+        if pool is not None:
+            for f in [pool.submit(jobs.ping) for _ in range(self.workers)]:
+                f.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_pool(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        with self._lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    # fork 는 MediaPipe/torch 스레드 상태를 복제하므로 spawn 사용
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=jobs.init_worker,
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="measure")
+                logging.info("[EXECUTOR] %s pool started (workers=%d, capacity=%d)", self.mode, self.workers, self.capacity)
+            return self._pool
+
+    # ── 슬롯 관리 ───────────────────────────────────────────────────────────
+    def _reserve(self, n: int) -> None:
+        with self._lock:
+            if self._inflight + n > self.capacity:
+                EXECUTOR_REJECTED.inc()
+                raise ExecutorSaturated(f"measure executor saturated ({self._inflight}/{self.capacity})")
+            self._inflight += n
+
+    def _release(self, n: int) -> None:
+        with self._lock:
+            self._inflight -= n
+
+    # ── 실행 ────────────────────────────────────────────────────────────────
+    async def run(self, kind: str, *payloads: bytes, **params: Any) -> Any:
+        """
+        jobs.JOBS[kind](*payloads, **params) 를 워커에서 실행하고 결과를 기다린다.
+        payloads 는 (프로세스 모드에서 공유메모리로 넘기는) 큰 바이트, params 는 작은 옵션 값.
+        슬롯은 클라이언트가 끊겨도 워커 작업이 실제로 끝날 때 반납된다.
+        """
+        self._reserve(1)
+        return await self._execute(kind, payloads, on_done=lambda: self._release(1), params=params)
+
+    async def map(self, kind: str, payload_list: Sequence[Sequence[bytes]]) -> List[Any]:
+        """
+        여러 입력을 워커 수만큼 병렬로 실행 (입력 순서대로 결과 반환).
+        슬롯은 min(입력 수, 워커 수)개를 한 번에 예약하며, 부족하면 즉시 ExecutorSaturated.
+        취소돼도 이미 워커에 넘어간 작업의 슬롯은 그 작업이 실제로 끝날 때 반납된다 (run() 과 같음).
+        """
+        if not payload_list:
+            return []
+        k = min(len(payload_list), self.workers)
+        self._reserve(k)
+        sem = asyncio.Semaphore(k)
+        state = {"running": 0, "closed": False}  # 워커에 넘어가 아직 안 끝난 작업 수 / map 종료 여부
+
+        def _done() -> None:
+            with self._lock:
+                state["running"] -= 1
+                if state["closed"]:
+                    self._inflight -= 1
+
+        async def _one(payloads: Sequence[bytes]) -> Any:
+            async with sem:
+                with self._lock:
+                    state["running"] += 1
+                return await self._execute(kind, payloads, on_done=_done)
+
+        try:
+            return list(await asyncio.gather(*(_one(p) for p in payload_list)))
+        finally:
+            # 끝난(또는 시작 전 취소된) 몫은 지금 반납, 아직 도는 작업의 몫은 각 작업의 _done 에서
+            with self._lock:
+                state["closed"] = True
+                self._inflight -= k - state["running"]
+
+    async def _execute(self, kind: str, payloads: Sequence[bytes], on_done: Optional[Callable[[], None]],
+                       params: Optional[Dict[str, Any]] = None) -> Any:
+        with JOB_LATENCY.time(jobs.JOB_MODALITY.get(kind, kind), kind):
+            return await self._submit(kind, payloads, on_done, params or {})
+
+    async def _submit(self, kind: str, payloads: Sequence[bytes], on_done: Optional[Callable[[], None]],
+                      params: Dict[str, Any]) -> Any:
+        if self.mode == "inline":
+            try:
+                return jobs.run_local(kind, payloads, params)
+            finally:
+                if on_done:
+                    on_done()
+
+        segments: List[shared_memory.SharedMemory] = []
+        try:
+            pool = self._ensure_pool()
+            if self.mode == "process":
+                segments = [_to_shared(p) for p in payloads]
+                specs = [(seg.name, len(p)) for seg, p in zip(segments, payloads)]
+                fut: Future = pool.submit(jobs.run_shared, kind, specs, params)
+            else:
+                fut = pool.submit(jobs.run_local, kind, payloads, params)
+        except BaseException:
+            _free_shared(segments)
+            if on_done:
+                on_done()
+            raise
+
+        def _done(_: Future) -> None:
+            _free_shared(segments)
+            if on_done:
+                on_done()
+
+        fut.add_done_callback(_done)
+        try:
+            result = await asyncio.wrap_future(fut)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료(네이티브 크래시 등) → 다음 요청부터 새 풀 사용
+            logging.exception("[EXECUTOR] process pool broken. restarting.")
+            self.shutdown()
+            raise RuntimeError("측정 워커가 비정상 종료되었습니다.")
+        if self.mode == "process":
+            result, delta = result
+            registry.merge(delta)
+        return result
+
+
+def _to_shared(data: bytes) -> shared_memory.SharedMemory:
+    seg = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    seg.buf[: len(data)] = data
+    return seg
+
+
+def _free_shared(segments: List[shared_memory.SharedMemory]) -> None:
+    for seg in segments:
+        try:
+            seg.close()
+            seg.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# 싱글톤 실행기 (풀은 첫 사용/startup 시 생성)
+measure_executor = MeasureExecutor(
+    mode=settings.EXECUTOR_MODE,
+    workers=settings.EXECUTOR_WORKERS,
+    queue_size=settings.EXECUTOR_QUEUE_SIZE,
+)
+
+registry.gauge(
+    "measure_executor_inflight", "실행 중 + 대기 중인 측정 작업 수",
+    fn=lambda: [((), measure_executor.inflight)])
+registry.gauge(
+    "measure_executor_capacity", "측정 실행기 동시 처리 한도 (워커 + 대기열)",
+    fn=lambda: [((), measure_executor.capacity)])
@@ -0,0 +1,280 @@
+# back-end/app/services/face_stream.py
+"""
+실시간 얼굴 측정 스트림 (WebSocket /api/v1/measure/face/stream).
+- 연결마다 FaceMesh 추적 모드 인스턴스 1개(풀에서 빌려 reset) → 첫 프레임 이후엔 얼굴 검출 없이 랜드마크 추적
+- 수신과 처리를 분리: 처리 중에 들어온 프레임은 최신 1장만 남기고 버린다 (클라이언트가 빨라도 지연이 쌓이지 않음)
+- 연결별 처리 fps 상한 / 프레임 크기 상한, 프로세스당 동시 연결 상한(초과 시 1013 으로 닫음)
+- 디코딩·추적·특징·추론은 공용 스레드 풀에서 → 연결 수와 무관하게 동시 계산량은 스레드 수로 제한,
+  추론은 마이크로배처가 여러 연결의 행을 묶어 처리
+- 응답: 프레임 특징 + 원 확률 + 지수평활 확률 + 자세 안내(no_face / face_camera / hold_still / ok)
+MediaPipe 는 세션을 만들 때 import (이 모듈은 가볍게).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from app.core.config import settings
+from app.services.metrics import STAGE_LATENCY, registry
+
+# 자세 안내 기준 (눈 사이 거리로 정규화)
+YAW_LIMIT = 0.25      # 코끝이 두 눈 중점에서 벗어난 비율
+ROLL_LIMIT_DEG = 10.0  # 두 눈을 잇는 선의 기울기
+MOTION_LIMIT = 0.03   # 직전 처리 프레임 대비 랜드마크 평균 이동
+
+STREAM_FRAMES = registry.counter(
+    "face_stream_frames_total", "실시간 얼굴 스트림 프레임 수 (processed, dropped, oversize)", ("outcome",))
+
+
+class SessionLimiter:
+    """프로세스당 동시 스트림 연결 수 제한."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.active >= self.limit:
+                return False
+            self.active += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+
+sessions = SessionLimiter(settings.FACE_STREAM_MAX_SESSIONS)
+registry.gauge("face_stream_sessions", "연결 중인 실시간 얼굴 스트림 수", fn=lambda: [((), sessions.active)])
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _compute_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=max(1, settings.FACE_STREAM_THREADS), thread_name_prefix="face-stream")
+        return _pool
+
+
+def shutdown_face_stream() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def guidance(xy: np.ndarray, prev: Optional[np.ndarray]) -> str:
+    """(478, 2) 랜드마크 → 자세 안내. 정면/정지 상태여야 측정값을 믿을 수 있다."""
+    from app.services.features.face_features import LM
+
+    eye_l, eye_r, nose = xy[LM["eye_l"]], xy[LM["eye_r"]], xy[LM["nose"]]
+    d = eye_r - eye_l
+    iod = float(np.hypot(*d)) or 1.0
+    yaw = abs(float(np.dot(nose - (eye_l + eye_r) / 2, d)) / (iod * iod))
+    roll = abs(np.degrees(np.arctan2(d[1], d[0])))
+    roll = min(roll, 180.0 - roll)
+    if yaw > YAW_LIMIT or roll > ROLL_LIMIT_DEG:
+        return "face_camera"
+    if prev is not None and float(np.mean(np.hypot(*(xy - prev).T))) / iod > MOTION_LIMIT:
+        return "hold_still"
+    return "ok"
+
+
+class FaceStreamSession:
+    """연결 1개의 추적 상태 (FaceMesh 그래프, 직전 랜드마크, 평활 확률). process 는 스레드 풀에서 호출."""
+
+    def __init__(self, *, alpha: float, max_side: int):
+        from app.services.features.face_features import face_mesh_tracking_pool
+
+        self.alpha = alpha
+        self.max_side = max_side
+        self.smoothed: Optional[float] = None
+        self._prev: Optional[np.ndarray] = None
+        self._pool = face_mesh_tracking_pool
+        self._mesh = self._pool.checkout()
+        self._mesh.reset()  # 이전 연결의 추적 상태 제거
+
+    def close(self, ok: bool = True) -> None:
+        """그래프 반납 (처리 중 예외가 났던 그래프는 버림)."""
+        if self._mesh is not None:
+            mesh, self._mesh = self._mesh, None
+            self._pool.checkin(mesh, ok)
+
+    def reset(self) -> None:
+        self._mesh.reset()
+        self.smoothed = None
+        self._prev = None
+
+    def process(self, data: bytes) -> Dict[str, Any]:
+        from app.services.features.face_features import (
+            FEATURE_NAMES, feature_vector_from_landmarks, features_to_dict, landmarks_array,
+        )
+        from app.services.features.image_ingest import ingest_image
+        from app.services.inference.tabnet_runner import predict_row_and_label, vector_row
+
+        with STAGE_LATENCY.time("face", "decode"):
+            img = ingest_image(data, max_side=self.max_side)
+        if img is None:
+            return {"face": False, "guidance": "bad_frame"}
+        with STAGE_LATENCY.time("face", "landmarks"):
+            res = self._mesh.process(img.rgb)
+        if not res.multi_face_landmarks:
+            self.smoothed, self._prev = None, None  # 얼굴을 놓치면 평활값도 새로 시작
+            return {"face": False, "guidance": "no_face"}
+
+        xy = landmarks_array(res.multi_face_landmarks[0].landmark)[:, :2] * (img.width, img.height)
+        with STAGE_LATENCY.time("face", "features"):
+            vec = feature_vector_from_landmarks(xy)
+        proba, _ = predict_row_and_label("face", vector_row("face", vec, FEATURE_NAMES))
+        self.smoothed = proba if self.smoothed is None else self.alpha * proba + (1 - self.alpha) * self.smoothed
+        hint = guidance(xy, self._prev)
+        self._prev = xy
+        return {
+            "face": True,
+            "guidance": hint,
+            "pred_proba": proba,
+            "smoothed_proba": self.smoothed,
+            "pred_label": int(self.smoothed >= 0.5),
+            "features": features_to_dict(vec),
+        }
+
+
+class FrameSlot:
+    """최신 프레임 1장만 보관하는 우편함. 처리 전에 새 프레임이 오면 이전 것은 버린다."""
+
+    def __init__(self) -> None:
+        self._frame: Optional[Tuple[int, bytes, float]] = None
+        self._event = asyncio.Event()
+        self.dropped = 0
+        self.closed = False
+
+    def put(self, seq: int, data: bytes) -> None:
+        if self._frame is not None:
+            self.dropped += 1
+            STREAM_FRAMES.inc("dropped")
+        self._frame = (seq, data, time.perf_counter())
+        self._event.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._event.set()
+
+    async def get(self, timeout: float) -> Optional[Tuple[int, bytes, float]]:
+        """다음 프레임 (닫혔으면 None). timeout 동안 아무 프레임도 없으면 asyncio.TimeoutError."""
+        while self._frame is None and not self.closed:
+            self._event.clear()
+            await asyncio.wait_for(self._event.wait(), timeout)
+        frame, self._frame = self._frame, None
+        return None if self.closed else frame
+
+    def take_newer(self, frame: Tuple[int, bytes, float]) -> Tuple[int, bytes, float]:
+        """대기 중에 더 새 프레임이 왔으면 그것으로 교체."""
+        if self._frame is not None:
+            self.dropped += 1
+            STREAM_FRAMES.inc("dropped")
+            frame, self._frame = self._frame, None
+        return frame
+
+
+async def _receive(ws: WebSocket, slot: FrameSlot, session_reset: asyncio.Event) -> None:
+    max_bytes = settings.FACE_STREAM_MAX_FRAME_KB * 1024
+    seq = 0
+    try:
+        while True:
+            msg = await ws.receive()
+            if msg["type"] == "websocket.disconnect":
+                break
+            data = msg.get("bytes")
+            if data is None:
+                # 텍스트는 제어 메시지: {"type": "reset"} → 추적/평활 상태 초기화
+                try:
+                    if json.loads(msg.get("text") or "{}").get("type") == "reset":
+                        session_reset.set()
+                except (ValueError, AttributeError):
+                    pass
+                continue
+            seq += 1
+            if len(data) > max_bytes:
+                STREAM_FRAMES.inc("oversize")
+                await ws.send_json({"type": "error", "seq": seq, "detail": f"프레임은 최대 {settings.FACE_STREAM_MAX_FRAME_KB}KB까지 가능합니다."})
+                continue
+            slot.put(seq, data)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        slot.close()
+
+
+async def serve_face_stream(ws: WebSocket) -> None:
+    """WebSocket 1개 연결의 전체 수명. 처리 루프는 최신 프레임만, 연결별 최대 fps 로 돈다."""
+    if not sessions.try_acquire():
+        await ws.close(code=1013)  # Try Again Later
+        return
+    session: Optional[FaceStreamSession] = None
+    recv: Optional[asyncio.Task] = None
+    loop = asyncio.get_running_loop()
+    ok = True
+    try:
+        await ws.accept()
+        pool = _compute_pool()
+        session = await loop.run_in_executor(
+            pool, lambda: FaceStreamSession(alpha=settings.FACE_STREAM_SMOOTHING, max_side=settings.FACE_STREAM_MAX_SIDE))
+        slot, session_reset = FrameSlot(), asyncio.Event()
+        recv = asyncio.create_task(_receive(ws, slot, session_reset))
+        min_interval = 1.0 / settings.FACE_STREAM_MAX_FPS if settings.FACE_STREAM_MAX_FPS > 0 else 0.0
+        next_at = 0.0
+
+        while True:
+            try:
+                frame = await slot.get(settings.FACE_STREAM_IDLE_SECONDS)
+            except asyncio.TimeoutError:
+                await ws.close(code=1000)
+                break
+            if frame is None:
+                break
+            wait = next_at - time.perf_counter()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                frame = slot.take_newer(frame)
+            if session_reset.is_set():
+                session_reset.clear()
+                await loop.run_in_executor(pool, session.reset)
+
+            seq, data, received_at = frame
+            next_at = time.perf_counter() + min_interval
+            try:
+                result = await loop.run_in_executor(pool, session.process, data)
+            except Exception as e:
+                ok = False
+                logging.exception("[FACE-STREAM] frame processing failed")
+                await ws.send_json({"type": "error", "seq": seq, "detail": f"{type(e).__name__}: {e}"})
+                break
+            STREAM_FRAMES.inc("processed")
+            if slot.closed:
+                break  # 처리하는 동안 클라이언트가 끊김
+            await ws.send_json({
+                "type": "result", "seq": seq, "dropped": slot.dropped,
+                "latency_ms": round((time.perf_counter() - received_at) * 1000, 1), **result,
+            })
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if recv is not None:
+            recv.cancel()
+        if session is not None:
+            session.close(ok)
+        sessions.release()
@@ -1,10 +1,14 @@
 # back-end/app/services/features/arm_features.py
 from __future__ import annotations
 import io, math
-import cv2, numpy as np
+import numpy as np
 import mediapipe as mp
 from typing import Dict, Tuple, Optional
 
+from app.services.features.detector_pool import create_pool
+from app.services.features.image_ingest import IngestedImage, ingest_image
+from app.services.metrics import STAGE_LATENCY
+
 FEATURE_COLS = [
     "left_start_slope","left_end_slope","left_slope_diff",
     "right_start_slope","right_end_slope","right_slope_diff",
@@ -14,18 +18,24 @@ FEATURE_COLS = [
 
 mp_hands = mp.solutions.hands
 
-def _decode_bgr(image_bytes: bytes) -> np.ndarray:
-    arr = np.frombuffer(image_bytes, dtype=np.uint8)
-    img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
+# static_image_mode 그래프는 이미지 간 상태가 없으므로 재사용해도 결과 동일
+hands_pool = create_pool(
+    "hands",
+    lambda: mp_hands.Hands(static_image_mode=True, max_num_hands=2, min_detection_confidence=0.5),
+)
+
+def _decode(image_bytes: bytes) -> IngestedImage:
+    # 축소 디코딩 + EXIF 방향 + RGB (image_ingest 공통 단계)
+    img = ingest_image(image_bytes)
     if img is None:
         raise ValueError("이미지 디코딩 실패")
     return img
 
-def _extract_xy21(img_bgr: np.ndarray) -> Dict[str, Optional[np.ndarray]]:
-    h, w = img_bgr.shape[:2]
-    rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-    with mp_hands.Hands(static_image_mode=True, max_num_hands=2, min_detection_confidence=0.5) as hands:
-        res = hands.process(rgb)
+def _extract_xy21(img: IngestedImage) -> Dict[str, Optional[np.ndarray]]:
+    # 정규화 좌표 × 원본 크기 → 원본 픽셀 좌표 (축소해도 y 변화량 스케일 유지)
+    w, h = img.width, img.height
+    with hands_pool.acquire() as hands:
+        res = hands.process(img.rgb)
 
     out: Dict[str, Optional[np.ndarray]] = {"Left": None, "Right": None}
     if not res.multi_hand_landmarks or not res.multi_handedness:
@@ -44,13 +54,21 @@ def _slope_xy(p1: np.ndarray, p2: np.ndarray) -> float:
         return float("inf") if dy >= 0 else -float("inf")
     return dy / dx
 
-def extract_features_from_two_images(start_bytes: bytes, end_bytes: bytes) -> Dict[str, float]:
-    start = _decode_bgr(start_bytes)
-    end = _decode_bgr(end_bytes)
+def extract_features_and_landmarks(start_bytes: bytes, end_bytes: bytes):
+    """시작/끝 이미지 → (FEATURE_COLS 피처 dict, 시작 손별 (21,2), 끝 손별 (21,2)) — 랜드마크는 저장용"""
+    with STAGE_LATENCY.time("arm", "decode"):
+        start = _decode(start_bytes)
+        end = _decode(end_bytes)
+    with STAGE_LATENCY.time("arm", "landmarks"):
+        s_xy, e_xy = _extract_xy21(start), _extract_xy21(end)
+    with STAGE_LATENCY.time("arm", "features"):
+        return features_from_hand_landmarks(s_xy, e_xy), s_xy, e_xy
 
-    s_xy = _extract_xy21(start)
-    e_xy = _extract_xy21(end)
+def extract_features_from_two_images(start_bytes: bytes, end_bytes: bytes) -> Dict[str, float]:
+    return extract_features_and_landmarks(start_bytes, end_bytes)[0]
 
+def features_from_hand_landmarks(s_xy: Dict[str, Optional[np.ndarray]], e_xy: Dict[str, Optional[np.ndarray]]) -> Dict[str, float]:
+    """시작/끝 자세의 손별 (21,2) 픽셀 좌표 → FEATURE_COLS 16개 피처 (검출 안 된 손은 0.0)."""
     def hand_feats(hand: str):
         # landmark 4(엄지끝) ↔ 20(새끼끝)
         def slope(hxy):
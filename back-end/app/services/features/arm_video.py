@@ -0,0 +1,183 @@
+# back-end/app/services/features/arm_video.py
+"""
+팔 들기(drift) 검사 — 짧은 동영상 / 프레임 시퀀스 버전.
+- MediaPipe Hands 추적 모드(static_image_mode=False): 손바닥 검출은 처음(또는 추적을 놓쳤을 때)만 하고
+  이후 프레임은 이전 랜드마크 주변만 추적 → 프레임당 비용이 정지 이미지 검출보다 작다
+- 샘플링 fps 에 해당하는 프레임만 꺼내고(나머지는 grab 만) 긴 변을 줄여서 추적
+- 시작/끝 자세는 앞/뒤 구간 랜드마크의 중앙값 → 기존 16개 피처(FEATURE_COLS)와 XGB 모델을 그대로 사용
+  (정지 사진 두 장보다 잡음이 작다), 시간축 통계(손끝 하강 속도/최대 하강량/추적률)는 drift 로 따로 반환
+프레임 자체는 보관하지 않고 손별 (T, 21, 2) 좌표만 쌓는다.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.services.features.arm_features import features_from_hand_landmarks, mp_hands
+from app.services.features.detector_pool import create_pool
+from app.services.features.image_ingest import ingest_image
+from app.services.metrics import STAGE_LATENCY
+
+HANDS = ("Left", "Right")
+TIP_IDX = [4, 8, 12, 16, 20]  # thumb, index, middle, ring, pinky (tip)
+
+# (시각(초), 검출용 RGB, 원본 너비, 원본 높이)
+Frame = Tuple[float, np.ndarray, int, int]
+
+# 추적 그래프는 프레임 간 상태를 가지므로 클립마다 reset() 후 사용
+tracking_hands_pool = create_pool(
+    "hands_tracking",
+    lambda: mp_hands.Hands(
+        static_image_mode=False, max_num_hands=2,
+        min_detection_confidence=0.5, min_tracking_confidence=0.5,
+    ),
+)
+
+
+def _shrink(bgr: np.ndarray, max_side: int) -> np.ndarray:
+    h, w = bgr.shape[:2]
+    if max_side > 0 and max(h, w) > max_side:
+        r = max_side / max(h, w)
+        bgr = cv2.resize(bgr, (max(1, round(w * r)), max(1, round(h * r))), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+
+def iter_video_frames(path: str, *, sample_fps: float, max_seconds: float, max_side: int) -> Iterator[Frame]:
+    """동영상 파일 → sample_fps 간격의 프레임. 샘플링에서 빠지는 프레임은 색 변환/축소 없이 grab 만."""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError("동영상을 열 수 없습니다.")
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    fps = fps if 0 < fps < 1000 else 30.0
+    step = 1.0 / sample_fps if sample_fps > 0 else 0.0
+    next_t, i = 0.0, 0
+    try:
+        while True:
+            with STAGE_LATENCY.time("arm", "decode"):
+                if not cap.grab():
+                    break
+            msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+            t = msec / 1000.0 if msec > 0 or i == 0 else i / fps  # 가변 프레임레이트는 컨테이너 시각 우선
+            i += 1
+            if t > max_seconds:
+                raise ValueError(f"동영상은 최대 {max_seconds:g}초까지 가능합니다.")
+            if t + 1e-6 < next_t:
+                continue
+            while next_t <= t + 1e-6:
+                next_t += step or 1.0 / fps
+            with STAGE_LATENCY.time("arm", "decode"):
+                ok, bgr = cap.retrieve()
+                if not ok:
+                    break
+                rgb = _shrink(bgr, max_side)
+            yield t, rgb, bgr.shape[1], bgr.shape[0]
+    finally:
+        cap.release()
+
+
+def iter_video_bytes(data: bytes, *, suffix: str = ".mp4", **kwargs) -> Iterator[Frame]:
+    """업로드 바이트 → 임시 파일(OpenCV 는 경로로만 연다) → iter_video_frames."""
+    fd, path = tempfile.mkstemp(suffix=suffix if suffix.startswith(".") else ".mp4")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        yield from iter_video_frames(path, **kwargs)
+    finally:
+        os.unlink(path)
+
+
+def iter_image_frames(images: Sequence[bytes], *, fps: float, max_side: int) -> Iterator[Frame]:
+    """이미 샘플링된 프레임 이미지들 (fps 간격으로 찍었다고 본다)."""
+    for i, data in enumerate(images):
+        with STAGE_LATENCY.time("arm", "decode"):
+            img = ingest_image(data, max_side=max_side)
+        if img is None:
+            raise ValueError(f"{i}번째 프레임 디코딩 실패")
+        yield i / fps, img.rgb, img.width, img.height
+
+
+def track_hands(frames: Iterable[Frame], *, keep_edges: bool = False):
+    """
+    추적 모드로 프레임을 차례로 처리.
+    반환: (times (T,), {"Left"/"Right": (T, 21, 2) 원본 픽셀 좌표, 미검출 프레임은 NaN}, (첫 RGB, 끝 RGB) | None)
+    """
+    times: List[float] = []
+    tracks: Dict[str, List[np.ndarray]] = {h: [] for h in HANDS}
+    missing = np.full((21, 2), np.nan)
+    first = last = None
+    with tracking_hands_pool.acquire() as hands:
+        hands.reset()
+        for t, rgb, w, h in frames:
+            with STAGE_LATENCY.time("arm", "landmarks"):
+                res = hands.process(rgb)
+            found: Dict[str, np.ndarray] = {}
+            for lm, handed in zip(res.multi_hand_landmarks or (), res.multi_handedness or ()):
+                found[handed.classification[0].label] = np.array([(p.x * w, p.y * h) for p in lm.landmark])
+            times.append(t)
+            for hand in HANDS:
+                tracks[hand].append(found.get(hand, missing))
+            if keep_edges:
+                first = rgb if first is None else first
+                last = rgb
+    if not times:
+        raise ValueError("프레임이 없습니다.")
+    return (
+        np.asarray(times),
+        {hand: np.stack(v) for hand, v in tracks.items()},
+        (first, last) if keep_edges else None,
+    )
+
+
+def _edge_pose(times: np.ndarray, xy: np.ndarray, present: np.ndarray, edge_seconds: float, end: bool) -> Optional[np.ndarray]:
+    """손이 보인 첫(끝) 시각부터 edge_seconds 구간의 랜드마크 중앙값 (21, 2)."""
+    if not present.any():
+        return None
+    tp = times[present]
+    sel = present & ((times >= tp[-1] - edge_seconds) if end else (times <= tp[0] + edge_seconds))
+    return np.median(xy[sel], axis=0)
+
+
+def drift_features(times: np.ndarray, tracks: Dict[str, np.ndarray], *, edge_seconds: float) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    손별 좌표 시계열 → (모델 입력 16개 피처, 시간축 drift 통계).
+    drift: *_tip_drop_rate (손끝 평균 y 의 선형 기울기, px/s, 아래로 +), *_max_drop (시작 자세 대비 최대 하강 px),
+           *_coverage (손이 추적된 프레임 비율)
+    """
+    start: Dict[str, Optional[np.ndarray]] = {}
+    end: Dict[str, Optional[np.ndarray]] = {}
+    drift: Dict[str, float] = {"frames": float(len(times)), "duration_s": float(times[-1] - times[0])}
+    for hand in HANDS:
+        xy = tracks[hand]
+        present = ~np.isnan(xy[:, 0, 0])
+        start[hand] = _edge_pose(times, xy, present, edge_seconds, end=False)
+        end[hand] = _edge_pose(times, xy, present, edge_seconds, end=True)
+
+        key = hand.lower()
+        drift[f"{key}_coverage"] = float(present.mean())
+        rate = drop = 0.0
+        if present.sum() >= 2:
+            tips = xy[present][:, TIP_IDX, 1].mean(axis=1)
+            tp = times[present]
+            if np.ptp(tp) > 0:
+                rate = float(np.polyfit(tp, tips, 1)[0])
+            drop = float(np.max(tips - start[hand][TIP_IDX, 1].mean()))
+        drift[f"{key}_tip_drop_rate"] = rate
+        drift[f"{key}_max_drop"] = drop
+    with STAGE_LATENCY.time("arm", "features"):
+        feats = features_from_hand_landmarks(start, end)
+    return feats, drift
+
+
+def video_settings(sample_fps: Optional[float] = None) -> Dict[str, float]:
+    """요청별 샘플링 fps (없으면 설정값, 설정 상한으로 자름) + 공통 한도."""
+    fps = settings.ARM_VIDEO_SAMPLE_FPS if not sample_fps or sample_fps <= 0 else sample_fps
+    return {
+        "sample_fps": min(fps, settings.ARM_VIDEO_MAX_SAMPLE_FPS),
+        "max_seconds": settings.ARM_VIDEO_MAX_SECONDS,
+        "max_side": settings.ARM_VIDEO_MAX_SIDE,
+    }
@@ -0,0 +1,131 @@
+# back-end/app/services/features/detector_pool.py
+from __future__ import annotations
+
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+
+from app.core.config import settings
+
+
+class DetectorPool:
+    """
+    MediaPipe 검출기(FaceMesh/Hands 등) 재사용 풀.
+    - 그래프 초기화 비용을 이미지마다가 아니라 워커당 1회만 지불
+    - 최대 max_size 개까지 지연 생성, 모두 사용 중이면 반납될 때까지 대기
+    - 처리 중 예외가 난 인스턴스는 상태를 믿을 수 없으므로 닫고 버림
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], *, max_size: int, acquire_timeout: float):
+        self.name = name
+        self.max_size = max(1, max_size)
+        self.acquire_timeout = acquire_timeout
+        self._factory = factory
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()  # 최근 반납된(캐시가 따뜻한) 인스턴스 우선
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        det = self._checkout()
+        ok = False
+        try:
+            yield det
+            ok = True
+        finally:
+            if ok:
+                self._checkin(det)
+            else:
+                self._discard(det)
+
+    def checkout(self) -> Any:
+        """with 블록으로 감쌀 수 없는 긴 사용(스트림 연결 등)용. 끝나면 반드시 checkin."""
+        return self._checkout()
+
+    def checkin(self, det: Any, ok: bool = True) -> None:
+        """checkout 한 인스턴스 반납. ok=False 면 상태를 믿을 수 없으므로 닫고 버림."""
+        if ok:
+            self._checkin(det)
+        else:
+            self._discard(det)
+
+    def warmup(self) -> None:
+        """인스턴스 1개를 미리 만들어 둔다 (첫 요청 지연 제거)."""
+        with self.acquire():
+            pass
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                det = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(det)
+        logging.info("[DETECTOR] pool %s shut down", self.name)
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _checkout(self) -> Any:
+        if self._closed:
+            raise RuntimeError(f"detector pool '{self.name}' is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                det = self._factory()
+                logging.info("[DETECTOR] %s instance created (%d/%d)", self.name, self._created, self.max_size)
+                return det
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"detector pool '{self.name}' exhausted ({self.max_size})")
+
+    def _checkin(self, det: Any) -> None:
+        if self._closed:
+            self._discard(det)
+            return
+        self._idle.put(det)
+
+    def _discard(self, det: Any) -> None:
+        with self._lock:
+            self._created -= 1
+        try:
+            det.close()
+        except Exception:
+            logging.exception("[DETECTOR] %s close failed", self.name)
+
+
+_POOLS: List[DetectorPool] = []
+
+
+def create_pool(name: str, factory: Callable[[], Any], max_size: Optional[int] = None) -> DetectorPool:
+    pool = DetectorPool(
+        name,
+        factory,
+        max_size=settings.DETECTOR_POOL_SIZE if max_size is None else max_size,
+        acquire_timeout=settings.DETECTOR_ACQUIRE_TIMEOUT,
+    )
+    _POOLS.append(pool)
+    return pool
+
+
+def shutdown_detector_pools() -> None:
+    """앱/워커 종료 시 모든 검출기 그래프 해제."""
+    for pool in _POOLS:
+        pool.shutdown()
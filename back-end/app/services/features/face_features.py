@@ -1,12 +1,40 @@
 import math
 from typing import Dict, Optional, Tuple
 
-import cv2
 import numpy as np
 import mediapipe as mp
 
+from app.core.config import settings
+from app.services.features.detector_pool import create_pool
+from app.services.features.image_ingest import IngestedImage, ingest_image
+from app.services.metrics import STAGE_LATENCY
+
 mp_face_mesh = mp.solutions.face_mesh
 
+# static_image_mode 그래프는 이미지 간 상태가 없으므로 재사용해도 결과 동일
+face_mesh_pool = create_pool(
+    "face_mesh",
+    lambda: mp_face_mesh.FaceMesh(
+        static_image_mode=True,
+        max_num_faces=1,
+        refine_landmarks=True,
+        min_detection_confidence=0.5,
+    ),
+)
+
+# 실시간 스트림(WebSocket)용 추적 모드: 연결마다 1개를 빌려 reset 후 사용 (연결 수만큼 필요)
+face_mesh_tracking_pool = create_pool(
+    "face_mesh_tracking",
+    lambda: mp_face_mesh.FaceMesh(
+        static_image_mode=False,
+        max_num_faces=1,
+        refine_landmarks=True,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+    ),
+    max_size=settings.FACE_STREAM_MAX_SESSIONS,
+)
+
 # === dataset.py와 동일한 정의/순서 ===
 landmark_pairs = [
     (61, 291), (48, 278), (123, 352), (132, 361),
@@ -23,95 +51,156 @@ LM = {
     "lip_u": 13, "lip_d": 14,
 }
 
-def _euclid(p1, p2) -> float:
-    return float(np.linalg.norm(np.array(p1) - np.array(p2)))
+# 59개 피처의 계산 순서(= dataset.py 순서). feature_order.json 과는 인덱스로 매핑한다.
+FEATURE_NAMES: Tuple[str, ...] = tuple(
+    [f"{p}_{l}_{r}" for (l, r) in landmark_pairs for p in ("AI_x", "AI_y", "angle")]
+    + [
+        "lip_slope", "lip_down_angle_left", "lip_down_angle_right",
+        "ratio_mouth_face", "ratio_lip_nose_eye_nose", "ratio_eye_lip_face_height",
+        "angle_diff_lip_eye", "ratio_lip_corner_height", "angle_diff_eye_lip",
+        "ratio_lip_center_symmetry", "ratio_mouth_opening",
+    ]
+)
+
+# 벡터 연산용 인덱스 배열 (모듈 로드 시 1회 계산)
+_PAIR_L = np.array([l for l, _ in landmark_pairs])
+_PAIR_R = np.array([r for _, r in landmark_pairs])
+
+# 각도 계산 대상 (p1, p2): 16쌍 + 추가 지표 6개
+#   lip_l→lip_r, lip_l→chin, lip_r→chin, eye_l→eye_r, eye_l→lip_l, eye_r→lip_r
+_ANGLE_P1 = np.concatenate([_PAIR_L, [LM["lip_l"], LM["lip_l"], LM["lip_r"], LM["eye_l"], LM["eye_l"], LM["eye_r"]]])
+_ANGLE_P2 = np.concatenate([_PAIR_R, [LM["lip_r"], LM["chin"], LM["chin"], LM["eye_r"], LM["lip_l"], LM["lip_r"]]])
+
+
+def _angles(xy: np.ndarray) -> np.ndarray:
+    """(p1→p2) 각도(deg), 소수 2자리. dx == 0 이면 90.0 (dataset.py와 동일)."""
+    d = xy[_ANGLE_P2] - xy[_ANGLE_P1]
+    ang = np.round(np.degrees(np.arctan2(d[:, 1], d[:, 0])), 2)
+    return np.where(d[:, 0] == 0, 90.0, ang)
+
+
+def _norms(d: np.ndarray) -> np.ndarray:
+    """
+    행별 유클리드 거리. np.linalg.norm(1D) 이 쓰는 dot 기반 합산을 그대로 따라
+    기존 스칼라 계산과 비트 단위로 같은 값을 낸다 (hypot/einsum 은 1ulp 차이 가능).
+    """
+    return np.sqrt(np.matmul(d[:, None, :], d[:, :, None]).ravel())
+
+
+def _safe_div(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    return np.where(den != 0, num / np.where(den != 0, den, 1.0), 0.0)
 
-def _calculate_ai(dR: float, dL: float) -> float:
-    denom = dR + dL
-    return 0.0 if denom == 0 else abs(dR - dL) / denom
 
-def _angle(p1, p2) -> float:
-    dx, dy = (p2[0] - p1[0]), (p2[1] - p1[1])
-    if dx == 0:
-        return 90.0
-    return round(np.degrees(np.arctan2(dy, dx)), 2)  # dataset.py와 동일 라운딩
+def landmarks_array(landmarks) -> np.ndarray:
+    """MediaPipe NormalizedLandmark 목록 → (N, 3) 정규화 좌표 배열."""
+    return np.array([(p.x, p.y, p.z) for p in landmarks], dtype=np.float64)
+
+
+def feature_vector_from_landmarks(xy: np.ndarray) -> np.ndarray:
+    """
+    픽셀 좌표 (N, 2) 랜드마크 → FEATURE_NAMES 순서의 (59,) float64 벡터.
+    기존 dict 계산(쌍별 파이썬 루프)과 수치적으로 동일.
+    """
+    c = xy[center_point_idx]
+    dR = np.abs(xy[_PAIR_R] - c)   # (16, 2)  center 대비 좌/우 거리
+    dL = np.abs(xy[_PAIR_L] - c)
+    ai = _safe_div(np.abs(dR - dL), dR + dL)
+    # 파이썬 float round 와 np.round 는 경계값에서 다를 수 있어 AI 값은 파이썬 round 유지
+    ai = np.array([round(v, 3) for v in ai.ravel().tolist()]).reshape(-1, 2)
+    ang = _angles(xy)
+
+    lip_l, lip_r = xy[LM["lip_l"]], xy[LM["lip_r"]]
+    eye_l, eye_r = xy[LM["eye_l"]], xy[LM["eye_r"]]
+    nose, chin = xy[LM["nose"]], xy[LM["chin"]]
+    lip_u, lip_d = xy[LM["lip_u"]], xy[LM["lip_d"]]
+    eye_center = (eye_l + eye_r) / 2.0
+    lip_center = (lip_l + lip_r) / 2.0
+
+    # mouth_width, face_width, eye_nose, lip_nose, eye_lip, face_height, dist_l, dist_r
+    dist = _norms(np.stack([
+        lip_l - lip_r, eye_l - eye_r, eye_center - nose, lip_center - nose,
+        eye_center - lip_center, nose - chin, lip_center - lip_l, lip_center - lip_r,
+    ]))
+    mouth_width, face_width, eye_nose, lip_nose, eye_lip, face_height, dist_l, dist_r = dist
+
+    ratios = _safe_div(
+        np.array([mouth_width, lip_nose, eye_lip, abs(lip_l[1] - lip_r[1]), abs(dist_l - dist_r), abs(lip_u[1] - lip_d[1])]),
+        np.array([face_width, eye_nose, face_height, face_height, mouth_width, face_height]),
+    )
+
+    vec = np.empty(len(FEATURE_NAMES), dtype=np.float64)
+    pair_block = vec[:48].reshape(16, 3)
+    pair_block[:, 0] = ai[:, 0]
+    pair_block[:, 1] = ai[:, 1]
+    pair_block[:, 2] = ang[:16]
+    vec[48:51] = ang[16:19]                       # lip_slope, lip_down_angle_left/right
+    vec[51:54] = ratios[0:3]                      # ratio_mouth_face, ratio_lip_nose_eye_nose, ratio_eye_lip_face_height
+    vec[54] = abs(ang[16] - ang[19])              # angle_diff_lip_eye
+    vec[55] = ratios[3]                           # ratio_lip_corner_height
+    vec[56] = abs(ang[20] - ang[21])              # angle_diff_eye_lip
+    vec[57:59] = ratios[4:6]                      # ratio_lip_center_symmetry, ratio_mouth_opening
+    return vec
+
+
+def features_to_dict(vec: np.ndarray) -> Dict[str, float]:
+    """API 응답/결과 문장용 dict 는 필요할 때만 만든다."""
+    return dict(zip(FEATURE_NAMES, vec.tolist()))
+
+
+def extract_feature_vector_and_landmarks(
+    image_bytes: bytes,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    이미지 바이트 → (축소 디코딩) → Mediapipe FaceMesh → FEATURE_NAMES 순서 (59,) 벡터 + 원 랜드마크.
+    반환: (vector, (478, 3) 랜드마크, 검출용 RGB 이미지) | (None, None, img) (검출 실패) | (None, None, None) (디코딩 실패)
+    """
+    with STAGE_LATENCY.time("face", "decode"):
+        image = ingest_image(image_bytes)
+    if image is None:
+        return None, None, None
+
+    with STAGE_LATENCY.time("face", "landmarks"):
+        lm = detect_face_landmarks_3d(image)
+    if lm is None:
+        # 얼굴 미검출: dataset.py에서도 이런 경우 None 리턴
+        return None, None, image.rgb
+    with STAGE_LATENCY.time("face", "features"):
+        vec = feature_vector_from_landmarks(lm[:, :2])
+    return vec, lm, image.rgb
+
+
+def extract_feature_vector_from_image_bytes(image_bytes: bytes) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    이미지 바이트 → FEATURE_NAMES 순서 (59,) 벡터.
+    반환: (vector, 검출용 RGB 이미지) | (None, img) (검출 실패) | (None, None) (디코딩 실패)
+    """
+    vec, _, rgb = extract_feature_vector_and_landmarks(image_bytes)
+    return vec, rgb
+
+
+def detect_face_landmarks_3d(image: IngestedImage) -> Optional[np.ndarray]:
+    """FaceMesh → (478, 3) = (x, y, z) × (너비, 높이, 너비) 픽셀 스케일 랜드마크. 얼굴 미검출 시 None."""
+    with face_mesh_pool.acquire() as face_mesh:
+        results = face_mesh.process(image.rgb)
+    if not results.multi_face_landmarks:
+        return None
+    # 정규화 좌표 × 원본 크기 → 원본 픽셀 좌표 (축소 여부와 무관하게 기존 특징 스케일 유지)
+    # z 는 MediaPipe 정의상 x 와 같은 스케일
+    return landmarks_array(results.multi_face_landmarks[0].landmark) * (image.width, image.height, image.width)
+
+
+def detect_face_landmarks(image: IngestedImage) -> Optional[np.ndarray]:
+    """FaceMesh → 원본 픽셀 좌표 (478, 2) 랜드마크. 얼굴 미검출 시 None."""
+    lm = detect_face_landmarks_3d(image)
+    return None if lm is None else lm[:, :2]
+
 
 def extract_features_from_image_bytes(image_bytes: bytes) -> Tuple[Optional[Dict[str, float]], Optional[np.ndarray]]:
     """
     이미지 바이트 → Mediapipe FaceMesh → dataset.py와 동일한 59개 피처 계산.
     반환: (features_dict, 디버그용 이미지) | (None, img) (검출 실패) | (None, None) (디코딩 실패)
     """
-    file_bytes = np.frombuffer(image_bytes, np.uint8)
-    img = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
-    if img is None:
-        return None, None
-
-    h, w = img.shape[:2]
-    with mp_face_mesh.FaceMesh(
-        static_image_mode=True,
-        max_num_faces=1,
-        refine_landmarks=True,
-        min_detection_confidence=0.5
-    ) as face_mesh:
-        results = face_mesh.process(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-        if not results.multi_face_landmarks:
-            # 얼굴 미검출: dataset.py에서도 이런 경우 None 리턴
-            return None, img
-
-        lms = results.multi_face_landmarks[0].landmark
-
-        def get_xy(idx: int):
-            return (lms[idx].x * w, lms[idx].y * h)
-
-        cx, cy = get_xy(center_point_idx)
-
-        features: Dict[str, float] = {}
-
-        # 1) 기본 AI_x/AI_y/angle (16쌍 × 3 = 48개)  ← 순서 매우 중요
-        for (l_idx, r_idx) in landmark_pairs:
-            lx, ly = get_xy(l_idx)
-            rx, ry = get_xy(r_idx)
-            # center 대비 좌/우 거리
-            dR_x, dL_x = abs(rx - cx), abs(lx - cx)
-            dR_y, dL_y = abs(ry - cy), abs(ly - cy)
-
-            features[f"AI_x_{l_idx}_{r_idx}"] = round(_calculate_ai(dR_x, dL_x), 3)
-            features[f"AI_y_{l_idx}_{r_idx}"] = round(_calculate_ai(dR_y, dL_y), 3)
-            features[f"angle_{l_idx}_{r_idx}"] = _angle((lx, ly), (rx, ry))
-
-        # 2) 추가 11개 지표 (dataset.py와 계산/순서 동일)
-        lip_l = get_xy(LM["lip_l"])
-        lip_r = get_xy(LM["lip_r"])
-        eye_l = get_xy(LM["eye_l"])
-        eye_r = get_xy(LM["eye_r"])
-        nose  = get_xy(LM["nose"])
-        chin  = get_xy(LM["chin"])
-        lip_u = get_xy(LM["lip_u"])
-        lip_d = get_xy(LM["lip_d"])
-
-        eye_center = ((eye_l[0] + eye_r[0]) / 2.0, (eye_l[1] + eye_r[1]) / 2.0)
-        lip_center = ((lip_l[0] + lip_r[0]) / 2.0, (lip_l[1] + lip_r[1]) / 2.0)
-
-        mouth_width = _euclid(lip_l, lip_r)
-        face_width  = _euclid(eye_l, eye_r)
-        eye_nose    = _euclid(eye_center, nose)
-        lip_nose    = _euclid(lip_center, nose)
-        eye_lip     = _euclid(eye_center, lip_center)
-        face_height = _euclid(nose, chin)
-
-        features["lip_slope"]              = _angle(lip_l, lip_r)
-        features["lip_down_angle_left"]    = _angle(lip_l, chin)
-        features["lip_down_angle_right"]   = _angle(lip_r, chin)
-
-        features["ratio_mouth_face"]            = mouth_width / face_width if face_width else 0.0
-        features["ratio_lip_nose_eye_nose"]     = lip_nose / eye_nose     if eye_nose else 0.0
-        features["ratio_eye_lip_face_height"]   = eye_lip / face_height    if face_height else 0.0
-        features["angle_diff_lip_eye"]          = abs(_angle(lip_l, lip_r) - _angle(eye_l, eye_r))
-        features["ratio_lip_corner_height"]     = abs(lip_l[1] - lip_r[1]) / face_height if face_height else 0.0
-        features["angle_diff_eye_lip"]          = abs(_angle(eye_l, lip_l) - _angle(eye_r, lip_r))
-        dist_l = _euclid(lip_center, lip_l)
-        dist_r = _euclid(lip_center, lip_r)
-        features["ratio_lip_center_symmetry"]   = (abs(dist_l - dist_r) / mouth_width) if mouth_width else 0.0
-        features["ratio_mouth_opening"]         = abs(lip_u[1] - lip_d[1]) / face_height if face_height else 0.0
-
-        return features, img
+    vec, img = extract_feature_vector_from_image_bytes(image_bytes)
+    if vec is None:
+        return None, img
+    return features_to_dict(vec), img
@@ -0,0 +1,105 @@
+# back-end/app/services/features/image_ingest.py
+"""
+랜드마크 검출 전 공통 이미지 적재 단계.
+- 헤더만 먼저 읽어 원본 크기/EXIF 방향을 확인 (픽셀 디코딩 없음)
+- JPEG 는 DCT 단계에서 1/2·1/4·1/8 로 줄여 디코딩 (IMREAD_REDUCED_*), 남는 차이만 resize
+- EXIF 방향은 cv2.imdecode 가 적용, 색은 디코더에서 바로 RGB 로 (지원 안 되는 OpenCV 는 작은 이미지에서 변환)
+MediaPipe 는 정규화 좌표(0~1)를 돌려주므로, 원본(방향 보정 후) 크기를 곱하면
+축소와 무관하게 원본 픽셀 좌표가 된다 → 특징값 스케일이 기존과 동일.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+from app.core.config import settings
+
+# EXIF Orientation 5~8 은 90° 회전 → 가로/세로가 바뀜
+_EXIF_ORIENTATION = 0x0112
+_TRANSPOSED = {5, 6, 7, 8}
+
+_REDUCED = {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+# OpenCV 4.11+ 는 디코더가 바로 RGB 로 출력 가능
+_COLOR_RGB: Optional[int] = getattr(cv2, "IMREAD_COLOR_RGB", None)
+
+
+@dataclass
+class IngestedImage:
+    rgb: np.ndarray   # 검출용 RGB (축소됨, 방향 보정됨)
+    width: int        # 원본 너비 (방향 보정 후) — 랜드마크 좌표 복원용
+    height: int       # 원본 높이 (방향 보정 후)
+
+    @property
+    def scale(self) -> float:
+        """원본 대비 검출용 이미지 배율 (1.0 = 축소 없음)."""
+        return self.rgb.shape[1] / self.width
+
+
+def _probe(image_bytes: bytes) -> Optional[Tuple[int, int, str]]:
+    """헤더만 읽어 (방향 보정 후 너비, 높이, 포맷). Pillow 가 모르는 포맷이면 None."""
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as im:
+            w, h = im.size
+            fmt = im.format or ""
+            orientation = im.getexif().get(_EXIF_ORIENTATION, 1)
+    except (UnidentifiedImageError, OSError, ValueError):
+        return None
+    if orientation in _TRANSPOSED:
+        w, h = h, w
+    return w, h, fmt
+
+
+def _reduce_factor(width: int, height: int, max_side: int) -> int:
+    """축소 후에도 긴 변이 max_side 이상 남는 가장 큰 배율 (화질 손실 없이 디코딩량만 줄임)."""
+    longest = max(width, height)
+    for f in (8, 4, 2):
+        if longest // f >= max_side:
+            return f
+    return 1
+
+
+def _decode_flags(factor: int) -> Tuple[int, bool]:
+    """(imdecode 플래그, RGB 로 디코딩되는지)"""
+    base = _REDUCED.get(factor, cv2.IMREAD_COLOR)
+    if _COLOR_RGB is None:
+        return base, False
+    return (base & ~cv2.IMREAD_COLOR) | _COLOR_RGB, True
+
+
+def ingest_image(image_bytes: bytes, max_side: Optional[int] = None) -> Optional[IngestedImage]:
+    """
+    이미지 바이트 → 긴 변 max_side 이하 RGB + 원본 크기. 디코딩 실패 시 None.
+    max_side <= 0 이면 원본 해상도 그대로.
+    """
+    max_side = settings.INGEST_MAX_SIDE if max_side is None else max_side
+    probe = _probe(image_bytes)
+    factor = 1
+    # 축소 디코딩은 JPEG 에서만 실제 디코딩량이 줄어든다 (다른 포맷은 전체 디코딩 후 축소)
+    if probe is not None and max_side > 0 and probe[2] == "JPEG":
+        factor = _reduce_factor(probe[0], probe[1], max_side)
+
+    flags, is_rgb = _decode_flags(factor)
+    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), flags)
+    if img is None:
+        return None
+
+    h, w = img.shape[:2]
+    # 축소 디코딩 크기는 ceil(원본/배율) → 헤더 크기와 배율 이내로 맞으면 헤더의 정확한 원본 크기 사용
+    # (Pillow 가 못 읽은 포맷이거나 방향 처리가 헤더와 다르면 디코딩 결과 기준)
+    width, height = w * factor, h * factor
+    if probe is not None and abs(probe[0] - width) < factor + 1 and abs(probe[1] - height) < factor + 1:
+        width, height = probe[0], probe[1]
+
+    if max_side > 0 and max(h, w) > max_side:
+        r = max_side / max(h, w)
+        # 축소 디코딩 뒤 남는 2배 이내 축소는 LINEAR 로 충분 (비정수 배율 AREA 는 수 배 느림)
+        interp = cv2.INTER_LINEAR if r >= 0.5 else cv2.INTER_AREA
+        img = cv2.resize(img, (max(1, round(w * r)), max(1, round(h * r))), interpolation=interp)
+    if not is_rgb:
+        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    return IngestedImage(rgb=np.ascontiguousarray(img), width=width, height=height)
@@ -0,0 +1,177 @@
+# back-end/app/services/features/packing.py
+"""
+랜드마크/피처 벡터의 압축 바이너리 저장 형식 (face/arm 테이블의 *_bin 컬럼).
+- 배열 1개 = 헤더(매직 "NP", 형식 버전, dtype 코드, 차원 수, 차원별 uint16 크기) + 리틀엔디언 원시 값
+  → 디코딩은 np.frombuffer 한 번 (JSON 파싱 없음), 같은 모양의 행들은 이어 붙여 한 번에 (N, ...) 배열로
+- 피처 벡터는 float32, 순서는 피처 스키마가 정한다.
+  스키마 id = "{modality}/{모델 버전}#{이름 목록 해시 8자리}" → MODEL_DIR_BASE/{modality}/{버전}/feature_order.json
+  (파일이 없는 모달리티는 추출기의 이름 목록). 파일이 바뀌면 해시가 달라져 옛 행을 잘못 읽지 않는다.
+- 랜드마크는 원본 픽셀 좌표라 float32 (float16 은 1024px 이상에서 1px 미만 정밀도를 잃음)
+  face: (478, 3) = (x, y, z) × (너비, 높이, 너비) / arm: (2 자세[시작, 끝], 2 손[Left, Right], 21, 2), 미검출 손은 NaN
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import Modality, model_version, settings
+
+MAGIC = b"NP"
+FORMAT_VERSION = 1
+_DTYPES = {1: np.dtype("<f2"), 2: np.dtype("<f4"), 3: np.dtype("<f8")}
+_CODES = {dt: code for code, dt in _DTYPES.items()}
+_HEAD = struct.Struct("<2sBBB")
+
+HANDS = ("Left", "Right")
+
+
+# ── 배열 ────────────────────────────────────────────────────────────────────
+def pack_array(a: np.ndarray, dtype: Any = np.float32) -> bytes:
+    dt = np.dtype(dtype).newbyteorder("<")
+    if dt not in _CODES:
+        raise ValueError(f"지원하지 않는 dtype: {dt}")
+    a = np.ascontiguousarray(a, dtype=dt)
+    return _HEAD.pack(MAGIC, FORMAT_VERSION, _CODES[dt], a.ndim) + struct.pack(f"<{a.ndim}H", *a.shape) + a.tobytes()
+
+
+def _header(buf: bytes) -> Tuple[np.dtype, Tuple[int, ...], int]:
+    """→ (dtype, shape, 데이터 시작 오프셋)"""
+    magic, ver, code, ndim = _HEAD.unpack_from(buf)
+    if magic != MAGIC or ver != FORMAT_VERSION or code not in _DTYPES:
+        raise ValueError("압축 배열 형식이 아닙니다.")
+    shape = struct.unpack_from(f"<{ndim}H", buf, _HEAD.size)
+    return _DTYPES[code], shape, _HEAD.size + 2 * ndim
+
+
+def unpack_array(buf: bytes) -> np.ndarray:
+    """압축 바이트 → 배열 (복사 없는 읽기 전용 뷰)."""
+    dt, shape, off = _header(buf)
+    return np.frombuffer(buf, dtype=dt, offset=off).reshape(shape)
+
+
+def unpack_stack(blobs: Sequence[bytes]) -> np.ndarray:
+    """
+    같은 모양의 압축 배열 여러 개 → (N, *shape).
+    헤더가 모두 같으면 이어 붙인 버퍼에서 헤더 열만 잘라내고 한 번에 변환 (행별 파싱 없음).
+    """
+    if not blobs:
+        return np.empty((0,), dtype=np.float32)
+    dt, shape, off = _header(blobs[0])
+    size = len(blobs[0])
+    head = blobs[0][:off]
+    if any(len(b) != size or b[:off] != head for b in blobs):
+        return np.stack([unpack_array(b) for b in blobs])
+    raw = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(len(blobs), size)[:, off:]
+    return np.ascontiguousarray(raw).view(dt).reshape((len(blobs),) + shape)
+
+
+# ── 피처 스키마 ──────────────────────────────────────────────────────────────
+def _default_names(modality: str) -> Tuple[str, ...]:
+    if modality == "face":
+        from app.services.features.face_features import FEATURE_NAMES
+        return tuple(FEATURE_NAMES)
+    if modality == "arm":
+        from app.services.features.arm_features import FEATURE_COLS
+        return tuple(FEATURE_COLS)
+    if modality == "speech":
+        from app.services.features.speech_features import FEATURE_NAMES as SPEECH_NAMES
+        return tuple(SPEECH_NAMES)
+    raise ValueError(f"unknown modality: {modality}")
+
+
+def _names_for(modality: str, version: str) -> Tuple[str, ...]:
+    path = Path(settings.MODEL_DIR_BASE) / modality / version / "feature_order.json"
+    if path.exists():
+        return tuple(json.loads(path.read_text(encoding="utf-8")))
+    return _default_names(modality)
+
+
+def _digest(names: Sequence[str]) -> str:
+    return hashlib.sha1("\n".join(names).encode("utf-8")).hexdigest()[:8]
+
+
+def feature_schema(modality: Modality, version: Optional[str] = None) -> str:
+    """활성(또는 지정) 버전의 피처 스키마 id."""
+    version = version or model_version(modality)
+    return f"{modality}/{version}#{_digest(_names_for(modality, version))}"
+
+
+@lru_cache(maxsize=64)
+def schema_names(schema: str) -> Tuple[str, ...]:
+    """스키마 id → 피처 이름 순서. feature_order.json 이 그 사이 바뀌었으면 ValueError."""
+    try:
+        path, digest = schema.split("#", 1)
+        modality, version = path.split("/", 1)
+    except ValueError:
+        raise ValueError(f"잘못된 피처 스키마 id: {schema!r}") from None
+    names = _names_for(modality, version)
+    if _digest(names) != digest:
+        raise ValueError(f"피처 스키마 {schema} 의 feature_order.json 이 바뀌었습니다.")
+    return names
+
+
+def pack_features(modality: Modality, feats: Dict[str, Any], version: Optional[str] = None) -> Tuple[str, bytes]:
+    """피처 dict → (스키마 id, float32 압축 벡터). 없는 피처는 NaN."""
+    schema = feature_schema(modality, version)
+    vec = np.array([float(feats.get(k, np.nan)) for k in schema_names(schema)], dtype=np.float32)
+    return schema, pack_array(vec, np.float32)
+
+
+def decode_features(buf: bytes, schema: str) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """압축 벡터 → ((F,) float32, 이름 순서)."""
+    vec, names = unpack_array(buf), schema_names(schema)
+    if vec.shape != (len(names),):
+        raise ValueError(f"피처 수 불일치: {vec.shape} vs 스키마 {len(names)}")
+    return vec, names
+
+
+# ── 랜드마크 ────────────────────────────────────────────────────────────────
+def pack_face_landmarks(lm: np.ndarray) -> bytes:
+    """(478, 3) 픽셀 스케일 좌표."""
+    return pack_array(lm, np.float32)
+
+
+def pack_arm_landmarks(start: Dict[str, Optional[np.ndarray]], end: Dict[str, Optional[np.ndarray]]) -> bytes:
+    """시작/끝 자세의 손별 (21, 2) 좌표 → (2, 2, 21, 2), 미검출 손은 NaN."""
+    out = np.full((2, len(HANDS), 21, 2), np.nan, dtype=np.float32)
+    for p, pose in enumerate((start, end)):
+        for h, hand in enumerate(HANDS):
+            if pose.get(hand) is not None:
+                out[p, h] = pose[hand]
+    return pack_array(out, np.float32)
+
+
+def arm_landmarks_to_dicts(arr: np.ndarray) -> Tuple[Dict[str, Optional[np.ndarray]], Dict[str, Optional[np.ndarray]]]:
+    """(2, 2, 21, 2) → features_from_hand_landmarks 입력 형태 (시작, 끝) dict (재계산용)."""
+    return tuple(
+        {hand: None if np.isnan(arr[p, h, 0, 0]) else arr[p, h].astype(np.float64) for h, hand in enumerate(HANDS)}
+        for p in range(2)
+    )  # type: ignore[return-value]
+
+
+# ── 측정 결과 ↔ DB 컬럼 ─────────────────────────────────────────────────────
+# 측정 결과는 결과 캐시(JSON)에도 들어가므로 바이트는 base64 문자열로 싣고, 저장 직전에 풀어 쓴다
+def packed_result(schema: str, features_bin: bytes, landmarks_bin: Optional[bytes]) -> Dict[str, Optional[str]]:
+    return {
+        "feature_schema": schema,
+        "features_bin": base64.b64encode(features_bin).decode("ascii"),
+        "landmarks_bin": base64.b64encode(landmarks_bin).decode("ascii") if landmarks_bin is not None else None,
+    }
+
+
+def packed_columns(packed: Optional[Dict[str, Optional[str]]]) -> Dict[str, Any]:
+    """packed_result → create_face/create_arm 키워드 (없으면 빈 dict)."""
+    if not packed:
+        return {}
+    return {
+        "feature_schema": packed["feature_schema"],
+        "features_bin": base64.b64decode(packed["features_bin"]),
+        "landmarks_bin": base64.b64decode(packed["landmarks_bin"]) if packed.get("landmarks_bin") else None,
+    }
@@ -0,0 +1,441 @@
+# back-end/app/services/features/speech_features.py
+"""
+음성(speech) 특징 추출 — 스트리밍.
+- 업로드 청크를 받는 대로 디코딩(WAV/원시 PCM) → 프레임 단위 STFT → MFCC/운율/조음 특징의 누적 통계
+- 메모리는 녹음 길이와 무관: 디코더는 샘플 1개 미만의 잔여 바이트, 누적기는 프레임 1개 미만의 잔여 샘플과
+  합/제곱합 같은 고정 크기 통계만 들고 있다
+- 프레임 위치는 스트림 절대 위치 기준 → 청크를 어떻게 나눠 보내도 한 번에 처리한 것과 같은 특징
+마지막 청크 이후에는 통계를 벡터로 정리하는 일만 남으므로 결과가 바로 나온다.
+"""
+from __future__ import annotations
+
+import struct
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.services.metrics import STAGE_LATENCY
+
+# ── 분석 파라미터 (샘플레이트와 무관하게 초 단위) ─────────────────────────────
+FRAME_SECONDS = 0.032      # 분석 창 (16 kHz 에서 512 샘플)
+HOP_SECONDS = 0.010
+N_MELS = 40
+N_MFCC = 13
+MEL_FMIN = 20.0
+MEL_FMAX = 8000.0          # 16 kHz 이상 녹음도 같은 대역으로 비교
+F0_MIN, F0_MAX = 75.0, 400.0
+SILENCE_DB = -45.0         # 프레임 RMS(dBFS)가 이보다 작으면 무음
+VOICING_THRESHOLD = 0.45   # 정규화 자기상관 피크가 이 이상이면 유성음
+MIN_PAUSE_SECONDS = 0.15   # 이보다 짧은 무음은 휴지로 세지 않음
+MIN_SAMPLE_RATE, MAX_SAMPLE_RATE = 8000, 192000
+
+FEATURE_NAMES = [
+    "duration_s",
+    "voiced_ratio",
+    "pause_count",
+    "pause_ratio",
+    "mean_pause_s",
+    "f0_mean_hz",
+    "f0_std_st",
+    "energy_db_mean",
+    "energy_db_std",
+    "spectral_centroid_mean",
+    "spectral_centroid_std",
+    "spectral_flux_mean",
+    "zcr_mean",
+    "delta_mfcc_mean",
+    *[f"mfcc_{i}_mean" for i in range(N_MFCC)],
+    *[f"mfcc_{i}_std" for i in range(N_MFCC)],
+]
+
+
+class AudioTooLong(ValueError):
+    """설정된 최대 녹음 길이(SPEECH_MAX_SECONDS) 초과 (→ 413)."""
+
+
+# ── 디코더 ────────────────────────────────────────────────────────────────────
+def _pcm_to_float(data: bytes, fmt: Tuple[str, int], channels: int) -> np.ndarray:
+    """인터리브된 PCM 바이트 → 모노 float32 [-1, 1]."""
+    kind, width = fmt
+    if kind == "float":
+        x = np.frombuffer(data, dtype="<f4" if width == 4 else "<f8").astype(np.float32)
+    elif width == 1:
+        x = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        x = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        b = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        v = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        x = ((v << 8) >> 8).astype(np.float32) / 8388608.0  # 24bit 부호 확장
+    else:
+        x = np.frombuffer(data, dtype="<i4").astype(np.float32) / 2147483648.0
+    if channels > 1:
+        x = x.reshape(-1, channels).mean(axis=1)
+    return x
+
+
+class _PcmFramer:
+    """바이트 청크를 샘플 경계(block_align)에 맞춰 잘라 float 로 바꾸고, 잔여 바이트만 보관."""
+
+    def __init__(self, sample_rate: int, channels: int, fmt: Tuple[str, int]):
+        if not MIN_SAMPLE_RATE <= sample_rate <= MAX_SAMPLE_RATE:
+            raise ValueError(f"지원하지 않는 샘플레이트: {sample_rate}")
+        if not 1 <= channels <= 8:
+            raise ValueError(f"지원하지 않는 채널 수: {channels}")
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.fmt = fmt
+        self.block_align = fmt[1] * channels
+        self._rest = b""
+
+    def feed(self, data: bytes) -> np.ndarray:
+        if self._rest:
+            data = self._rest + bytes(data)
+        usable = len(data) - len(data) % self.block_align
+        self._rest = bytes(data[usable:])
+        if not usable:
+            return np.empty(0, dtype=np.float32)
+        return _pcm_to_float(memoryview(data)[:usable], self.fmt, self.channels)
+
+
+class RawPcmDecoder:
+    """헤더 없는 little-endian PCM (s16le | f32le)."""
+
+    _FORMATS = {"s16le": ("int", 2), "f32le": ("float", 4)}
+
+    def __init__(self, sample_rate: int, channels: int = 1, sample_format: str = "s16le"):
+        if sample_format not in self._FORMATS:
+            raise ValueError(f"지원하지 않는 PCM 형식: {sample_format}")
+        self._framer = _PcmFramer(sample_rate, channels, self._FORMATS[sample_format])
+        self.sample_rate: Optional[int] = sample_rate
+
+    def feed(self, chunk: bytes) -> np.ndarray:
+        return self._framer.feed(chunk)
+
+    def close(self) -> None:
+        pass
+
+
+class StreamingWavDecoder:
+    """
+    RIFF/WAVE 를 청크 단위로 파싱. 헤더가 청크 경계에 걸려도 되고, data 이외 청크는 버리면서 건너뛴다.
+    data 크기가 0/0xFFFFFFFF(실시간 녹음기가 길이를 모르고 쓴 경우)면 스트림 끝까지를 데이터로 본다.
+    """
+
+    _MAX_FMT_BYTES = 1024
+
+    def __init__(self) -> None:
+        self._buf = b""
+        self._state = "riff"      # riff → chunk → (fmt | skip | data)
+        self._need = 12
+        self._skip = 0
+        self._data_left: Optional[int] = None  # None: 끝까지
+        self._framer: Optional[_PcmFramer] = None
+        self.sample_rate: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> np.ndarray:
+        out = []
+        data = memoryview(chunk)
+        while data:
+            if self._state == "data":
+                take = data if self._data_left is None else data[: self._data_left]
+                if self._data_left is not None:
+                    self._data_left -= len(take)
+                    if self._data_left == 0:
+                        self._state = "done"
+                out.append(self._framer.feed(take))
+                data = data[len(take):]
+            elif self._state == "skip":
+                n = min(self._skip, len(data))
+                self._skip -= n
+                data = data[n:]
+                if self._skip == 0:
+                    self._state, self._need = "chunk", 8
+            elif self._state == "done":
+                break  # data 뒤의 LIST 등 꼬리 청크는 무시
+            else:
+                n = min(self._need - len(self._buf), len(data))
+                self._buf += bytes(data[:n])
+                data = data[n:]
+                if len(self._buf) == self._need:
+                    head, self._buf = self._buf, b""
+                    self._header(head)
+        return np.concatenate(out) if len(out) > 1 else (out[0] if out else np.empty(0, dtype=np.float32))
+
+    def _header(self, head: bytes) -> None:
+        if self._state == "riff":
+            if head[:4] not in (b"RIFF", b"RF64") or head[8:12] != b"WAVE":
+                raise ValueError("WAV(RIFF/WAVE) 형식이 아닙니다.")
+            self._state, self._need = "chunk", 8
+        elif self._state == "chunk":
+            cid, size = head[:4], struct.unpack("<I", head[4:8])[0]
+            padded = size + (size & 1)
+            if cid == b"fmt ":
+                if not 16 <= size <= self._MAX_FMT_BYTES:
+                    raise ValueError(f"WAV fmt 청크 크기가 올바르지 않습니다: {size}")
+                self._state, self._need = "fmt", padded
+            elif cid == b"data":
+                if self._framer is None:
+                    raise ValueError("WAV fmt 청크가 data 보다 먼저 와야 합니다.")
+                self._data_left = None if size in (0, 0xFFFFFFFF) else size
+                self._state = "data"
+            else:
+                self._state, self._skip = "skip", padded
+                if padded == 0:
+                    self._state = "chunk"
+        elif self._state == "fmt":
+            tag, channels, rate = struct.unpack("<HHI", head[:8])
+            bits = struct.unpack("<H", head[14:16])[0]
+            if tag == 0xFFFE and len(head) >= 26:  # WAVE_FORMAT_EXTENSIBLE → 서브포맷 GUID 앞 2바이트
+                tag = struct.unpack("<H", head[24:26])[0]
+            if tag == 1 and bits in (8, 16, 24, 32):
+                fmt = ("int", bits // 8)
+            elif tag == 3 and bits in (32, 64):
+                fmt = ("float", bits // 8)
+            else:
+                raise ValueError(f"지원하지 않는 WAV 인코딩 (format={tag}, bits={bits})")
+            self._framer = _PcmFramer(rate, channels, fmt)
+            self.sample_rate = rate
+            self._state, self._need = "chunk", 8
+
+    def close(self) -> None:
+        if self._state not in ("data", "done"):
+            raise ValueError("WAV 오디오 데이터가 없습니다.")
+
+
+# ── 특징 누적기 ───────────────────────────────────────────────────────────────
+def _hz_to_mel(f):
+    return 2595.0 * np.log10(1.0 + np.asarray(f) / 700.0)
+
+
+def _mel_to_hz(m):
+    return 700.0 * (10.0 ** (np.asarray(m) / 2595.0) - 1.0)
+
+
+@lru_cache(maxsize=8)
+def _analysis(sample_rate: int) -> Dict[str, np.ndarray]:
+    """샘플레이트별 창/필터뱅크/DCT 등 고정 행렬 (프로세스당 1회)."""
+    frame = int(round(FRAME_SECONDS * sample_rate))
+    hop = int(round(HOP_SECONDS * sample_rate))
+    min_lag = int(sample_rate / F0_MAX)
+    max_lag = int(np.ceil(sample_rate / F0_MIN))
+    n_fft = 1 << int(np.ceil(np.log2(frame + max_lag)))  # 자기상관이 원형으로 겹치지 않도록
+    window = np.hanning(frame).astype(np.float32)
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+
+    hz = _mel_to_hz(np.linspace(_hz_to_mel(MEL_FMIN), _hz_to_mel(min(MEL_FMAX, sample_rate / 2)), N_MELS + 2))
+    lower = (freqs[:, None] - hz[None, :-2]) / (hz[1:-1] - hz[:-2])
+    upper = (hz[None, 2:] - freqs[:, None]) / (hz[2:] - hz[1:-1])
+    mel_fb = np.maximum(0.0, np.minimum(lower, upper)).astype(np.float32)  # (bins, N_MELS)
+
+    k, n = np.arange(N_MFCC), np.arange(N_MELS)
+    dct = np.cos(np.pi / N_MELS * (n[:, None] + 0.5) * k[None, :]) * np.sqrt(2.0 / N_MELS)
+    dct[:, 0] /= np.sqrt(2.0)
+
+    # 창 함수 자체의 자기상관 (창에 의한 감쇠를 나눠서 보정)
+    rw = np.fft.irfft(np.abs(np.fft.rfft(window, n_fft)) ** 2, n_fft)[: max_lag + 1]
+    return {
+        "frame": frame, "hop": hop, "n_fft": n_fft, "min_lag": min_lag, "max_lag": max_lag,
+        "window": window, "freqs": freqs.astype(np.float32), "mel_fb": mel_fb,
+        "dct": dct.astype(np.float32), "win_ac": (rw / rw[0])[min_lag: max_lag + 1],
+    }
+
+
+class SpeechFeatureAccumulator:
+    """모노 float32 샘플을 받는 대로 프레임 분석 → 고정 크기 누적 통계."""
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self._a = _analysis(sample_rate)
+        self._tail = np.empty(0, dtype=np.float32)
+        self.samples = 0
+        self.frames = 0
+        self.active = 0
+        self.voiced = 0
+        # 합/제곱합 (float64)
+        self._mfcc_sum = np.zeros(N_MFCC)
+        self._mfcc_sq = np.zeros(N_MFCC)
+        self._energy = np.zeros(2)
+        self._centroid = np.zeros(2)
+        self._f0 = np.zeros(2)
+        self._zcr = 0.0
+        self._flux = 0.0
+        self._delta = 0.0
+        self._prev_spec: Optional[np.ndarray] = None
+        self._prev_mfcc: Optional[np.ndarray] = None
+        # 휴지 추적 (첫 발화 이전/마지막 발화 이후의 무음은 세지 않음)
+        self._seen_speech = False
+        self._silent_run = 0
+        self.pause_count = 0
+        self._pause_frames = 0
+
+    def feed(self, samples: np.ndarray) -> None:
+        self.samples += len(samples)
+        a = self._a
+        buf = np.concatenate((self._tail, samples)) if len(self._tail) else np.asarray(samples, dtype=np.float32)
+        if len(buf) < a["frame"]:
+            self._tail = buf
+            return
+        n = (len(buf) - a["frame"]) // a["hop"] + 1
+        frames = sliding_window_view(buf, a["frame"])[:: a["hop"]][:n]
+        self._tail = buf[n * a["hop"]:].copy()  # 다음 프레임 시작 위치부터 (큰 buf 를 붙잡지 않도록 복사)
+        self._process(frames)
+
+    def _process(self, frames: np.ndarray) -> None:
+        a = self._a
+        n = frames.shape[0]
+        self.frames += n
+
+        spec = np.fft.rfft(frames * a["window"], n=a["n_fft"], axis=1)
+        power = (spec.real ** 2 + spec.imag ** 2).astype(np.float32)
+        mag = np.sqrt(power)
+
+        energy_db = 10.0 * np.log10(np.mean(np.square(frames, dtype=np.float64), axis=1) + 1e-12)
+        active = energy_db > SILENCE_DB
+
+        mfcc = np.log(power @ a["mel_fb"] + 1e-10) @ a["dct"]  # (n, N_MFCC)
+
+        # 피치: |X|^2 의 역변환 = 자기상관. 창 보정 후 최대값의 90% 를 처음 넘는 지점 근처의
+        # 국소 최대를 주기로 본다 (배수 주기를 고르는 옥타브 오류 완화) + 포물선 보간
+        ac = np.fft.irfft(power, n=a["n_fft"], axis=1)[:, : a["max_lag"] + 1]
+        norm = ac[:, a["min_lag"]:] / np.maximum(ac[:, :1], 1e-12) / a["win_ac"]
+        peak = norm.max(axis=1)
+        first = np.argmax(norm >= 0.9 * peak[:, None], axis=1)
+        near = np.minimum(first[:, None] + np.arange(a["min_lag"]), norm.shape[1] - 1)
+        rows = np.arange(n)[:, None]
+        i = near[rows[:, 0], np.argmax(norm[rows, near], axis=1)]
+        y0, y1, y2 = norm[rows[:, 0], np.maximum(i - 1, 0)], norm[rows[:, 0], i], norm[rows[:, 0], np.minimum(i + 1, norm.shape[1] - 1)]
+        den = y0 - 2 * y1 + y2
+        shift = np.where(np.abs(den) > 1e-12, 0.5 * (y0 - y2) / np.where(den == 0, 1, den), 0.0)
+        lag = i + a["min_lag"] + np.clip(shift, -0.5, 0.5)
+        voiced = active & (peak >= VOICING_THRESHOLD)
+
+        # 프레임 간 변화량 (청크 경계를 넘어 이전 프레임과 이어서 계산)
+        spec_n = mag / np.maximum(mag.sum(axis=1, keepdims=True), 1e-12)
+        prev_spec = spec_n[:-1] if self._prev_spec is None else np.vstack((self._prev_spec, spec_n[:-1]))
+        prev_mfcc = mfcc[:-1] if self._prev_mfcc is None else np.vstack((self._prev_mfcc, mfcc[:-1]))
+        cur = slice(1, None) if self._prev_spec is None else slice(None)
+        self._flux += float(np.linalg.norm(spec_n[cur] - prev_spec, axis=1).sum())
+        self._delta += float(np.abs(mfcc[cur] - prev_mfcc).mean(axis=1).sum())
+        self._prev_spec, self._prev_mfcc = spec_n[-1:], mfcc[-1:]
+
+        if active.any():
+            act = np.flatnonzero(active)
+            m = mfcc[act].astype(np.float64)
+            self.active += len(act)
+            self._mfcc_sum += m.sum(axis=0)
+            self._mfcc_sq += np.square(m).sum(axis=0)
+            e = energy_db[act]
+            self._energy += (e.sum(), np.square(e).sum())
+            c = (mag[act] @ a["freqs"]) / np.maximum(mag[act].sum(axis=1), 1e-12)
+            self._centroid += (c.sum(), np.square(c, dtype=np.float64).sum())
+            signs = np.signbit(frames[act])
+            self._zcr += float((signs[:, 1:] != signs[:, :-1]).mean(axis=1).sum())
+        if voiced.any():
+            st = 12.0 * np.log2(self.sample_rate / lag[voiced] / 100.0)  # 100 Hz 기준 반음
+            self.voiced += int(voiced.sum())
+            self._f0 += (st.sum(), np.square(st).sum())
+
+        self._track_pauses(active)
+
+    def _track_pauses(self, active: np.ndarray) -> None:
+        starts = np.r_[0, np.flatnonzero(active[1:] != active[:-1]) + 1]
+        lengths = np.diff(np.r_[starts, len(active)])
+        min_frames = int(round(MIN_PAUSE_SECONDS / HOP_SECONDS))
+        for is_active, length in zip(active[starts], lengths):
+            if not is_active:
+                self._silent_run += int(length)
+                continue
+            if self._seen_speech and self._silent_run >= min_frames:
+                self.pause_count += 1
+                self._pause_frames += self._silent_run
+            self._silent_run = 0
+            self._seen_speech = True
+
+    def finish(self) -> np.ndarray:
+        """누적 통계 → FEATURE_NAMES 순서 벡터. 발화 프레임이 없으면 ValueError."""
+        if not self.active:
+            raise ValueError("음성이 감지되지 않았습니다.")
+
+        def mean_std(s: float, sq: float, n: int) -> Tuple[float, float]:
+            mu = s / n
+            return mu, float(np.sqrt(max(sq / n - mu * mu, 0.0)))
+
+        hop_s = self._a["hop"] / self.sample_rate
+        e_mu, e_sd = mean_std(*self._energy, self.active)
+        c_mu, c_sd = mean_std(*self._centroid, self.active)
+        if self.voiced:
+            st_mu, st_sd = mean_std(*self._f0, self.voiced)
+            f0_hz = 100.0 * 2.0 ** (st_mu / 12.0)
+        else:
+            f0_hz, st_sd = 0.0, 0.0
+        mfcc_mu = self._mfcc_sum / self.active
+        mfcc_sd = np.sqrt(np.maximum(self._mfcc_sq / self.active - mfcc_mu ** 2, 0.0))
+        pairs = max(self.frames - 1, 1)
+
+        head = [
+            self.samples / self.sample_rate,
+            self.voiced / self.active,
+            float(self.pause_count),
+            self._pause_frames / (self._pause_frames + self.active),
+            self._pause_frames * hop_s / self.pause_count if self.pause_count else 0.0,
+            f0_hz, st_sd,
+            e_mu, e_sd,
+            c_mu, c_sd,
+            self._flux / pairs,
+            self._zcr / self.active,
+            self._delta / pairs,
+        ]
+        return np.concatenate((np.array(head), mfcc_mu, mfcc_sd)).astype(np.float64)
+
+
+# ── 디코더 + 누적기 ───────────────────────────────────────────────────────────
+class SpeechStream:
+    """
+    업로드 청크 → 디코딩 → 특징 누적. feed 를 여러 번, 마지막에 finish 1번.
+    max_seconds 를 넘는 순간 AudioTooLong (나머지 업로드를 기다리지 않음).
+    """
+
+    def __init__(self, decoder=None, *, max_seconds: Optional[float] = None):
+        self.decoder = decoder if decoder is not None else StreamingWavDecoder()
+        self.max_seconds = max_seconds
+        self._acc: Optional[SpeechFeatureAccumulator] = None
+
+    @property
+    def duration_s(self) -> float:
+        return self._acc.samples / self._acc.sample_rate if self._acc else 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        with STAGE_LATENCY.time("speech", "decode"):
+            samples = self.decoder.feed(chunk)
+        if not len(samples):
+            return
+        if self._acc is None:
+            self._acc = SpeechFeatureAccumulator(self.decoder.sample_rate)
+        with STAGE_LATENCY.time("speech", "features"):
+            self._acc.feed(samples)
+        if self.max_seconds and self.duration_s > self.max_seconds:
+            raise AudioTooLong(f"녹음은 최대 {self.max_seconds:g}초까지 가능합니다.")
+
+    def finish(self) -> np.ndarray:
+        self.decoder.close()
+        if self._acc is None:
+            raise ValueError("오디오 샘플이 없습니다.")
+        with STAGE_LATENCY.time("speech", "features"):
+            return self._acc.finish()
+
+
+def features_to_dict(vec: np.ndarray) -> Dict[str, float]:
+    """FEATURE_NAMES 순서 벡터 → 응답/저장용 dict."""
+    return dict(zip(FEATURE_NAMES, vec.tolist()))
+
+
+def extract_feature_vector_from_audio_bytes(data: bytes, chunk_size: int = 1 << 16) -> np.ndarray:
+    """메모리에 이미 있는 WAV 바이트 → (len(FEATURE_NAMES),) 벡터 (스트리밍 경로와 같은 계산)."""
+    stream = SpeechStream()
+    view = memoryview(data)
+    for i in range(0, len(view), chunk_size):
+        stream.feed(view[i: i + chunk_size])
+    return stream.finish()
@@ -1,16 +1,25 @@
 # back-end/app/services/inference/arm_xgb_runner.py
 from __future__ import annotations
+import logging
+import time
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 import numpy as np
 from joblib import load
 
-from app.core.config import model_dir, threshold, settings
+from app.core.config import batch_config, model_dir, threshold, settings
 from app.services.features.arm_features import FEATURE_COLS
+from app.services.inference.batcher import MicroBatcher
+from app.services.metrics import BATCH_SIZE, MODEL_LOAD_LATENCY, MODEL_LOADS, STAGE_LATENCY
 
 MODEL_FILENAME = "xgb_model.pkl"
 
-def _resolve_model_path() -> Path:
+def _resolve_model_path(version: Optional[str] = None) -> Path:
+    # 0) 버전 지정(섀도 평가 등): 활성 버전 설정/덮어쓰기와 무관하게 MODEL_DIR_BASE/arm/{version}
+    if version:
+        return Path(settings.MODEL_DIR_BASE) / "arm" / version / MODEL_FILENAME
+
     # 1) .env 등에서 절대/상대 경로로 덮어쓰기 (디렉터리 or 파일)
     override = getattr(settings, "ARM_MODEL_DIR", None)
     if override:
@@ -31,18 +40,48 @@ def _resolve_model_path() -> Path:
     base = Path(__file__).resolve().parents[3] / "app" / "assets" / "models" / "arm" / "v1"
     return base / MODEL_FILENAME
 
-@lru_cache(maxsize=1)
-def _load_model():
-    path = _resolve_model_path()
-    print(f"[ARM MODEL] loading => {path}")  # 디버그 로그
+def _load_model(version: Optional[str] = None):
+    """활성(또는 지정) 버전 모델. 캐시는 실제 파일 경로 기준 → _load_model() 과 _load_model("v1") 이 같은 항목"""
+    return _load_model_at(str(_resolve_model_path(version)))
+
+@lru_cache(maxsize=2)  # 활성 + 섀도 후보
+def _load_model_at(model_path: str):
+    path = Path(model_path)
+    logging.info("[ARM MODEL] loading => %s", path)
     if not path.exists():
         raise FileNotFoundError(f"ARM 모델 파일을 찾을 수 없음: {path}")
-    return load(path)
+    t0 = time.perf_counter()
+    model = load(path)
+    MODEL_LOAD_LATENCY.observe(time.perf_counter() - t0, "arm")
+    MODEL_LOADS.inc("arm", path.parent.name, type(model).__name__)
+    return model
+
+def _run_batch(model, X: np.ndarray) -> np.ndarray:
+    BATCH_SIZE.observe(X.shape[0], "arm")
+    with STAGE_LATENCY.time("arm", "inference"):
+        if hasattr(model, "predict_proba"):
+            return np.asarray(model.predict_proba(X))[:, 1]
+        return np.asarray(model.predict(X)).ravel()
+
+# 동시 요청을 모아 XGBoost 1회 호출로 처리
+_batcher = MicroBatcher("arm", _run_batch, max_batch=batch_config("arm")[0], max_wait_ms=batch_config("arm")[1])
+
+def predict_proba_batch(X: np.ndarray) -> np.ndarray:
+    """X: (N, 16) FEATURE_COLS 순서 → (N,) 클래스1 확률"""
+    return _run_batch(_load_model(), np.asarray(X, dtype=float))
+
+def predict_proba_version(features: dict[str, float], version: str) -> float:
+    """지정 버전 모델로 1건 추론 (섀도 평가용: 배처/단계 메트릭을 거치지 않아 본 요청 지표와 섞이지 않음)"""
+    model = _load_model(version)
+    x = np.array([[float(features[k]) for k in FEATURE_COLS]], dtype=float)
+    if hasattr(model, "predict_proba"):
+        return float(np.asarray(model.predict_proba(x))[0, 1])
+    return float(np.asarray(model.predict(x)).ravel()[0])
 
 def predict_proba_and_label(features: dict[str, float]) -> tuple[float, str]:
     model = _load_model()
-    X = np.array([[float(features[k]) for k in FEATURE_COLS]], dtype=float)
-    proba1 = float(model.predict_proba(X)[0, 1]) if hasattr(model, "predict_proba") else float(model.predict(X)[0])
+    x = np.array([float(features[k]) for k in FEATURE_COLS], dtype=float)
+    proba1 = _batcher.submit(x, ctx=model)
     thr = float(getattr(settings, "ARM_THRESHOLD", None) or threshold("arm") or 0.5)
     label = "detected" if proba1 >= thr else "normal"
     return proba1, label
@@ -0,0 +1,97 @@
+# back-end/app/services/inference/batcher.py
+from __future__ import annotations
+
+import queue
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# (ctx, X) → (N,) 클래스1 확률. ctx 는 같은 모델 entry 끼리만 묶기 위한 식별자
+BatchPredictFn = Callable[[Any, np.ndarray], np.ndarray]
+
+
+class MicroBatcher:
+    """
+    동시 요청의 1행 피처 벡터를 모아 한 번의 predict_proba 로 처리하는 동적 배처.
+    - 첫 행을 꺼냈을 때 다른 제출자가 없으면 기다리지 않고 바로 추론 (혼자 오는 요청은 지연 추가 없음,
+      프로세스 실행기처럼 워커당 요청이 하나뿐이면 배칭 비용도 0)
+    - 제출 중인 행이 더 있으면 최대 max_wait_ms 동안 또는 max_batch 행이 찰 때까지 모음
+    - 같은 ctx(=같은 모델 버전) 끼리만 하나의 행렬로 쌓아 추론
+    - max_batch <= 1 이면 배칭 없이 호출 스레드에서 바로 추론
+    """
+
+    def __init__(self, name: str, predict_fn: BatchPredictFn, *, max_batch: int, max_wait_ms: float):
+        self.name = name
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._predict_fn = predict_fn
+        self._queue: "queue.Queue[Tuple[Any, np.ndarray, Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._pending = 0  # 제출했지만 아직 배치로 꺼내지 않은 행 수 (큐에 넣기 직전 포함)
+
+    def submit(self, row: np.ndarray, ctx: Any = None) -> float:
+        """row(1차원 벡터)를 제출하고 해당 행의 확률을 돌려받는다 (블로킹)."""
+        if self.max_batch <= 1:
+            return float(self._predict_fn(ctx, row[None, :])[0])
+        self._ensure_thread()
+        fut: Future = Future()
+        with self._lock:
+            self._pending += 1
+        self._queue.put((ctx, row, fut))
+        return float(fut.result())
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name=f"batcher-{self.name}", daemon=True)
+                self._thread.start()
+
+    def _collect(self) -> List[Tuple[Any, np.ndarray, Future]]:
+        items = [self._queue.get()]
+        self._taken(1)
+        deadline = time.monotonic() + self.max_wait
+        while len(items) < self.max_batch:
+            # 기다릴 다른 제출자가 없으면 바로 처리
+            if self._pending == 0:
+                break
+            timeout = deadline - time.monotonic()
+            try:
+                items.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+            self._taken(1)
+        return items
+
+    def _taken(self, n: int) -> None:
+        with self._lock:
+            self._pending -= n
+
+    def _loop(self) -> None:
+        while True:
+            items = self._collect()
+            groups: Dict[int, List[Tuple[Any, np.ndarray, Future]]] = {}
+            for it in items:
+                groups.setdefault(id(it[0]), []).append(it)
+            for group in groups.values():
+                self._run_group(group)
+
+    def _run_group(self, group: List[Tuple[Any, np.ndarray, Future]]) -> None:
+        ctx = group[0][0]
+        try:
+            X = np.stack([row for _, row, _ in group])
+            probas = self._predict_fn(ctx, X)
+        except Exception as e:
+            logging.exception("[BATCH] %s batch of %d failed", self.name, len(group))
+            for _, _, fut in group:
+                fut.set_exception(e)
+            return
+        for (_, _, fut), p in zip(group, probas):
+            fut.set_result(p)
@@ -0,0 +1,193 @@
+# back-end/app/services/inference/model_registry.py
+from __future__ import annotations
+
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import model_version, settings
+from app.services.metrics import MODEL_LOAD_LATENCY, MODEL_LOADS
+
+# (modality, version) → 로딩된 아티팩트 묶음
+ModelKey = Tuple[str, str]
+LoaderFn = Callable[[str], Any]        # mdir → artifacts
+DirFn = Callable[[str, str], str]      # (modality, version) → mdir
+
+
+def _dir_fingerprint(mdir: str) -> Tuple[Tuple[str, int, int], ...]:
+    """디렉터리 내 파일들의 (이름, mtime_ns, size) 목록. 파일 교체 감지용."""
+    try:
+        entries = [e for e in os.scandir(mdir) if e.is_file()]
+    except FileNotFoundError:
+        return ()
+    out = []
+    for e in entries:
+        st = e.stat()
+        out.append((e.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(out))
+
+
+@dataclass
+class ModelEntry:
+    modality: str
+    version: str
+    mdir: str
+    artifacts: Any
+    fingerprint: Tuple[Tuple[str, int, int], ...]
+    nbytes: int
+    load_ms: float
+    loaded_at: float = field(default_factory=time.time)
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class ModelRegistry:
+    """
+    프로세스 전역 모델 레지스트리.
+    - (modality, version) 단위로 아티팩트를 1회만 로딩하고 여러 스레드가 공유
+    - 디스크 파일이 바뀌면 새 아티팩트를 먼저 로딩한 뒤 원자적으로 교체
+      (이미 entry를 잡은 요청은 기존 모델로 끝까지 처리됨)
+    - 여러 버전 동시 상주, 메모리 예산 초과 시 LRU 순으로 제거
+      (메모리 사용량은 아티팩트 파일 크기 합으로 근사)
+    """
+
+    def __init__(self, *, max_bytes: int, check_interval: float):
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self._entries: "OrderedDict[ModelKey, ModelEntry]" = OrderedDict()
+        self._loaders: Dict[str, Tuple[LoaderFn, DirFn]] = {}
+        self._lock = threading.RLock()
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+
+    # ── 등록 ────────────────────────────────────────────────────────────────
+    def register(self, modality: str, loader: LoaderFn, dir_fn: DirFn) -> None:
+        with self._lock:
+            self._loaders[modality] = (loader, dir_fn)
+
+    def is_registered(self, modality: str) -> bool:
+        return modality in self._loaders
+
+    # ── 조회 ────────────────────────────────────────────────────────────────
+    def get(self, modality: str, version: Optional[str] = None) -> ModelEntry:
+        """
+        활성(또는 지정) 버전의 entry 반환. 없으면 로딩, 디스크 변경 시 재로딩.
+        """
+        ver = version or model_version(modality)  # type: ignore[arg-type]
+        key = (modality, ver)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                now = time.monotonic()
+                if now - entry.checked_at < self.check_interval:
+                    return entry
+                # 다른 스레드가 같은 검사를 중복 수행하지 않도록 먼저 갱신
+                entry.checked_at = now
+
+        if entry is not None:
+            if _dir_fingerprint(entry.mdir) == entry.fingerprint:
+                return entry
+            logging.info("[REGISTRY] %s/%s changed on disk. reloading.", modality, ver)
+
+        return self._load(key, stale=entry)
+
+    def activate(self, modality: str, version: str) -> ModelEntry:
+        """
+        새 버전을 먼저 로딩한 뒤 활성 버전을 전환 (재시작 없이 교체).
+        """
+        entry = self.get(modality, version)
+        setattr(settings, f"{modality.upper()}_MODEL_VERSION", version)
+        logging.info("[REGISTRY] active %s version → %s", modality, version)
+        return entry
+
+    def evict(self, modality: str, version: Optional[str] = None) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == modality and (version is None or key[1] == version):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """상주 중인 entry 메타 목록 (LRU → MRU 순)."""
+        with self._lock:
+            return [
+                {
+                    "modality": e.modality,
+                    "version": e.version,
+                    "nbytes": e.nbytes,
+                    "load_ms": round(e.load_ms, 2),
+                    "loaded_at": e.loaded_at,
+                }
+                for e in self._entries.values()
+            ]
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _key_lock(self, key: ModelKey) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _load(self, key: ModelKey, stale: Optional[ModelEntry]) -> ModelEntry:
+        modality, ver = key
+        if modality not in self._loaders:
+            raise KeyError(f"등록되지 않은 모달리티: {modality}")
+        loader, dir_fn = self._loaders[modality]
+
+        with self._key_lock(key):
+            # 대기하는 동안 다른 스레드가 이미 로딩했으면 그대로 사용
+            with self._lock:
+                current = self._entries.get(key)
+            if current is not None and current is not stale:
+                return current
+
+            mdir = dir_fn(modality, ver)
+            fingerprint = _dir_fingerprint(mdir)
+            t0 = time.perf_counter()
+            artifacts = loader(mdir)
+            load_ms = (time.perf_counter() - t0) * 1000.0
+            entry = ModelEntry(
+                modality=modality,
+                version=ver,
+                mdir=mdir,
+                artifacts=artifacts,
+                fingerprint=fingerprint,
+                nbytes=sum(size for _, _, size in fingerprint),
+                load_ms=load_ms,
+            )
+            logging.info("[REGISTRY] loaded %s/%s in %.1f ms (%d bytes)", modality, ver, load_ms, entry.nbytes)
+            # (scaler, model, feature_order) 형태면 모델 클래스명을 백엔드로 기록 (ONNX/TabNet/Fallback 구분)
+            backend = type(artifacts[1]).__name__ if isinstance(artifacts, tuple) and len(artifacts) > 1 else type(artifacts).__name__
+            MODEL_LOADS.inc(modality, ver, backend)
+            MODEL_LOAD_LATENCY.observe(load_ms / 1000.0, modality)
+
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self._evict_over_budget(keep=key)
+            return entry
+
+    def _evict_over_budget(self, keep: ModelKey) -> None:
+        total = sum(e.nbytes for e in self._entries.values())
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._entries.pop(key).nbytes
+            logging.info("[REGISTRY] evicted %s/%s (memory budget)", *key)
+
+
+# 싱글톤 레지스트리 인스턴스
+model_registry = ModelRegistry(
+    max_bytes=settings.MODEL_CACHE_MAX_MB * 1024 * 1024,
+    check_interval=settings.MODEL_RELOAD_CHECK_SECONDS,
+)
@@ -0,0 +1,102 @@
+# back-end/app/services/inference/onnx_runner.py
+"""
+TabNet 을 ONNX 로 내보낸 모델(model.onnx)의 서빙 백엔드. (내보내기: python -m app.tools.export_onnx)
+- onnxruntime(CPU) 만 사용 → 서빙 프로세스에서 torch/pytorch_tabnet 을 import 하지 않는다
+- 입력은 기존과 같은 스케일 적용된 float32 행렬, 출력은 softmax 확률 (N, 2) → predict_proba 와 호환
+- 로딩 시 내보내기 때 원본 모델로 기록해 둔 기준 입출력(parity)과 비교해 어긋나면 사용하지 않음
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+ONNX_MODEL = "model.onnx"
+ONNX_META = "model.onnx.json"          # 원본 해시/opset/내보내기 시 최대 오차
+ONNX_PARITY = "model.onnx.parity.npz"  # X (스케일 적용 입력), proba (원본 모델 출력)
+SOURCE_MODEL = "TabNet_final.zip"
+
+# 원본(torch) 대비 허용 오차 — float32 연산 순서 차이 수준
+PARITY_ATOL = 1e-4
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class OnnxClassifier:
+    """onnxruntime 세션을 predict_proba 인터페이스로 감싼 분류기."""
+
+    def __init__(self, path: str, *, intra_op_threads: int = 1):
+        import onnxruntime as ort
+
+        opts = ort.SessionOptions()
+        # 동시성은 실행기(프로세스/스레드)와 마이크로배처가 담당 → 세션 내부 스레드는 최소로
+        opts.intra_op_num_threads = max(1, intra_op_threads)
+        opts.inter_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.path = path
+        self.session = ort.InferenceSession(path, sess_options=opts, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return self.session.run(None, {self.input_name: X})[0]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.predict_proba(X).argmax(axis=1)
+
+
+def check_parity(model: Any, mdir: str, atol: float = PARITY_ATOL) -> Optional[float]:
+    """기록된 기준 입출력과 비교해 최대 절대 오차 반환 (기준 파일이 없으면 None). 허용 오차 초과 시 ValueError."""
+    path = os.path.join(mdir, ONNX_PARITY)
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as ref:
+        X, expected = ref["X"], ref["proba"]
+    diff = float(np.max(np.abs(np.asarray(model.predict_proba(X), dtype=np.float64) - expected))) if len(X) else 0.0
+    if diff > atol:
+        raise ValueError(f"ONNX parity mismatch: max_abs_diff={diff:.3g} > {atol:g}")
+    return diff
+
+
+def try_load_onnx(mdir: str) -> Optional[OnnxClassifier]:
+    """model.onnx 로딩 시도. onnxruntime 미설치, 원본과 버전 불일치, parity 실패면 None."""
+    path = os.path.join(mdir, ONNX_MODEL)
+    if not os.path.exists(path):
+        return None
+    try:
+        import onnxruntime  # noqa: F401
+    except Exception:
+        logging.warning("[INFER] onnxruntime이 설치되어 있지 않아 %s 로딩을 건너뜁니다.", path)
+        return None
+
+    try:
+        meta_path = os.path.join(mdir, ONNX_META)
+        meta = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        # 원본 모델이 다시 학습/교체됐는데 ONNX 를 갱신하지 않은 경우 → 옛 모델로 서빙하지 않음
+        source = os.path.join(mdir, meta.get("source", SOURCE_MODEL))
+        if meta.get("source_sha256") and os.path.exists(source) and file_sha256(source) != meta["source_sha256"]:
+            logging.error("[INFER] %s 가 %s 와 다른 버전에서 내보내졌습니다. 다시 export 하세요.", path, source)
+            return None
+
+        model = OnnxClassifier(path)
+        diff = check_parity(model, mdir)
+        if diff is None:
+            logging.warning("[INFER] %s 가 없어 ONNX parity 확인을 건너뜁니다.", ONNX_PARITY)
+        logging.info("[INFER] Loaded ONNX model: %s (parity max_abs_diff=%s)", path, diff)
+        return model
+    except Exception as e:
+        logging.exception("[INFER] ONNX load failed (%s): %s", path, e)
+        return None
@@ -5,20 +5,20 @@ import os
 import io
 import json
 import logging
-from typing import Tuple, List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Tuple, List, Dict, Any, Optional, Sequence
 
 import numpy as np
 import joblib
 
-try:
-    from pytorch_tabnet.tab_model import TabNetClassifier
-except Exception:  # pytorch_tabnet 미설치 환경 대비
-    TabNetClassifier = None
+from app.core.config import batch_config, model_version
+from app.services.inference.batcher import MicroBatcher
+from app.services.inference.model_registry import model_registry
+from app.services.inference.onnx_runner import try_load_onnx
+from app.services.metrics import BATCH_SIZE, FALLBACKS, STAGE_LATENCY
 
-try:
-    import torch
-except Exception:
-    torch = None
+# torch/pytorch_tabnet 은 무거우므로 해당 형식의 모델을 실제로 로딩할 때만 import
+# (model.onnx 가 있으면 서빙 프로세스에 torch 가 올라오지 않는다)
 
 
 # 프로젝트 루트 기준: app/assets/models/<modality>/<version>/*
@@ -29,8 +29,8 @@ _ASSETS_DIR = os.path.join(
 )
 
 
-def _model_dir(modality: str, version: str = "v1") -> str:
-    return os.path.join(_ASSETS_DIR, modality, version)
+def _model_dir(modality: str, version: Optional[str] = None) -> str:
+    return os.path.join(_ASSETS_DIR, modality, version or model_version(modality))
 
 
 class PassthroughScaler:
@@ -39,6 +39,39 @@ class PassthroughScaler:
         return X
 
 
+class AffineScaler:
+    """
+    StandardScaler/MinMaxScaler 를 y = x * a + b 계수로 미리 풀어 둔 스케일러.
+    - sklearn transform 의 입력 검증/복사 오버헤드 없이 1행 단위로 적용
+    - float64 로 계산 후 float32 로 내보냄 (sklearn 결과와 float32 반올림 수준 차이)
+    """
+    def __init__(self, a: np.ndarray, b: np.ndarray, source: Any):
+        self.a = np.asarray(a, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+        self.source = source
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        return (np.asarray(X, dtype=np.float64) * self.a + self.b).astype(np.float32)
+
+
+def _compile_scaler(scaler: Any) -> Any:
+    """지원되는 sklearn 스케일러면 AffineScaler 로 변환, 아니면 그대로 사용."""
+    try:
+        scale = getattr(scaler, "scale_", None)
+        if hasattr(scaler, "min_") and scale is not None and not getattr(scaler, "clip", False):
+            # MinMaxScaler: X * scale_ + min_
+            return AffineScaler(scale, scaler.min_, scaler)
+        if hasattr(scaler, "with_mean") and hasattr(scaler, "with_std"):
+            # StandardScaler: (X - mean_) / scale_
+            n = int(scaler.n_features_in_)
+            mean = scaler.mean_ if scaler.with_mean and scaler.mean_ is not None else np.zeros(n)
+            std = scale if scaler.with_std and scale is not None else np.ones(n)
+            return AffineScaler(1.0 / std, -mean / std, scaler)
+    except Exception:
+        logging.exception("[INFER] scaler compile failed. Using sklearn transform.")
+    return scaler
+
+
 class FallbackClassifier:
     """
     모델 파일이 전혀 로드되지 않을 때를 위한 임시 폴백.
@@ -84,7 +117,9 @@ def _try_load_tabnet_zip(mdir: str) -> Optional[Any]:
     model_path = os.path.join(mdir, "TabNet_final.zip")
     if not os.path.exists(model_path):
         return None
-    if TabNetClassifier is None:
+    try:
+        from pytorch_tabnet.tab_model import TabNetClassifier
+    except Exception:  # pytorch_tabnet 미설치 환경 대비
         logging.warning("[INFER] pytorch_tabnet이 설치되어 있지 않아 .zip 로딩을 건너뜁니다.")
         return None
     model = TabNetClassifier()
@@ -118,11 +153,13 @@ def _try_load_sklearn_pickle(mdir: str) -> Optional[Any]:
 
 def _try_load_torch_pth(mdir: str) -> Optional[Any]:
     """PyTorch .pth 로딩 시도 (간이)."""
-    if torch is None:
-        return None
     path = os.path.join(mdir, "model.pth")
     if not os.path.exists(path):
         return None
+    try:
+        import torch
+    except Exception:
+        return None
     try:
         obj = torch.load(path, map_location="cpu")
         # obj가 학습된 모형 그 자체(예: torchscript)거나, wrapper일 수 있음
@@ -138,78 +175,175 @@ def _try_load_torch_pth(mdir: str) -> Optional[Any]:
 
 def _load_model_flexible(mdir: str) -> Any:
     """
-    TabNet zip → sklearn pickle → torch pth → 폴백 순으로 시도.
+    ONNX → TabNet zip → sklearn pickle → torch pth → 폴백 순으로 시도.
     """
-    # 1) TabNet .zip
+    # 1) ONNX (export_onnx 로 내보낸 TabNet, torch 없이 onnxruntime 으로 추론)
+    model = try_load_onnx(mdir)
+    if model is not None:
+        return model
+
+    # 2) TabNet .zip
     model = _try_load_tabnet_zip(mdir)
     if model is not None:
         return model
 
-    # 2) sklearn pickle
+    # 3) sklearn pickle
     model = _try_load_sklearn_pickle(mdir)
     if model is not None:
         return model
 
-    # 3) torch pth
+    # 4) torch pth
     model = _try_load_torch_pth(mdir)
     if model is not None:
         return model
 
-    # 4) 최종 폴백
+    # 5) 최종 폴백
     logging.error("[INFER] No valid model file found in: %s  (using FallbackClassifier)", mdir)
     return FallbackClassifier()
 
 
-def _load_scaler_model_feature_order(modality: str) -> Tuple[Any, Any, List[str]]:
-    mdir = _model_dir(modality)
+def _load_artifacts(mdir: str) -> Tuple[Any, Any, List[str]]:
     feature_order = _load_feature_order(mdir)
-    scaler = _try_load_scaler(mdir)
+    scaler = _compile_scaler(_try_load_scaler(mdir))
     model = _load_model_flexible(mdir)
     return scaler, model, feature_order
 
 
-def predict_proba_and_label(modality: str, feats: Dict[str, Any]) -> Tuple[float, int]:
-    """
-    feats: {feature_name: value}
-    returns: (proba_of_class_1, label)
-    """
-    scaler, model, feature_order = _load_scaler_model_feature_order(modality)
+# TabNet 계열 모달리티는 레지스트리를 통해 프로세스당 1회만 로딩
+for _m in ("face", "speech"):
+    model_registry.register(_m, _load_artifacts, _model_dir)
 
-    # 입력 벡터 구성 (누락 피처는 0.0)
-    X = np.array([[float(feats.get(k, 0.0)) for k in feature_order]], dtype=np.float32)
 
-    # 스케일 변환
-    try:
-        Xs = scaler.transform(X)
-    except Exception as e:
-        logging.exception("[INFER] scaler.transform failed. Using raw features. err=%s", e)
-        Xs = X
+def _load_scaler_model_feature_order(modality: str) -> Tuple[Any, Any, List[str]]:
+    return model_registry.get(modality).artifacts
+
+
+def uses_fallback(modality: str) -> bool:
+    """활성 버전이 실제 모델 대신 폴백(FallbackClassifier/PassthroughScaler)으로 떠 있는지."""
+    scaler, model, _ = model_registry.get(modality).artifacts
+    return isinstance(model, FallbackClassifier) or isinstance(scaler, PassthroughScaler)
 
-    proba_1: float
 
-    # 모델 유형에 따라 분기
+def _proba_class1(model: Any, Xs: np.ndarray, modality: str = "unknown") -> np.ndarray:
+    """모델 유형에 따라 (N,) 클래스1 확률 벡터 반환. 추론 실패 시 전 행 0.5."""
+    n = Xs.shape[0]
     try:
         if hasattr(model, "predict_proba"):
-            proba = model.predict_proba(Xs)
+            proba = np.asarray(model.predict_proba(Xs))
             # scikit/TabNet (N,2) 또는 (N,1) 가능성 대응
-            if isinstance(proba, np.ndarray):
-                if proba.ndim == 2 and proba.shape[1] >= 2:
-                    proba_1 = float(proba[0, 1])
-                else:
-                    proba_1 = float(proba.ravel()[0])
-            else:
-                # 리스트 등
-                proba_1 = float(np.array(proba).ravel()[0])
-        elif hasattr(model, "predict"):
-            pred = model.predict(Xs)
-            proba_1 = float(np.array(pred).ravel()[0])
-        else:
-            # FallbackClassifier 등
-            proba = model.predict_proba(Xs)
-            proba_1 = float(np.array(proba)[0, 1])
+            if proba.ndim == 2 and proba.shape[1] >= 2:
+                return proba[:, 1].astype(np.float64)
+            return proba.ravel()[:n].astype(np.float64)
+        if hasattr(model, "predict"):
+            return np.asarray(model.predict(Xs)).ravel()[:n].astype(np.float64)
+        raise TypeError(f"predict/predict_proba 인터페이스 없음: {type(model)!r}")
     except Exception as e:
         logging.exception("[INFER] model inference failed. Using 0.5 as fallback. err=%s", e)
-        proba_1 = 0.5
+        FALLBACKS.inc(modality, "inference_error", amount=n)
+        return np.full(n, 0.5)
+
+
+def _scale(scaler: Any, X: np.ndarray, modality: str = "unknown") -> np.ndarray:
+    if isinstance(scaler, PassthroughScaler):
+        FALLBACKS.inc(modality, "passthrough_scaler", amount=X.shape[0])
+    try:
+        return scaler.transform(X)
+    except Exception as e:
+        logging.exception("[INFER] scaler.transform failed. Using raw features. err=%s", e)
+        FALLBACKS.inc(modality, "scaler_error", amount=X.shape[0])
+        return X
 
+
+def _run_rows(entry: Any, Xs: np.ndarray) -> np.ndarray:
+    """이미 스케일된 모델 입력 행렬 → (N,) 확률."""
+    model = entry.artifacts[1]
+    n = Xs.shape[0]
+    BATCH_SIZE.observe(n, entry.modality)
+    if isinstance(model, FallbackClassifier):
+        FALLBACKS.inc(entry.modality, "fallback_classifier", amount=n)
+    with STAGE_LATENCY.time(entry.modality, "inference"):
+        return _proba_class1(model, Xs, entry.modality)
+
+
+@lru_cache(maxsize=32)
+def _gather_index(feature_order: Tuple[str, ...], names: Tuple[str, ...]) -> np.ndarray:
+    """names 순서 벡터 → feature_order 순서로 뽑는 인덱스. 누락 피처는 len(names)(=0.0 패딩) 위치."""
+    pos = {k: i for i, k in enumerate(names)}
+    return np.array([pos.get(k, len(names)) for k in feature_order], dtype=np.intp)
+
+
+def _encode(entry: Any, raw: np.ndarray) -> np.ndarray:
+    """feature_order 순서 원시 벡터 → 스케일까지 적용된 float32 모델 입력 행."""
+    scaler = entry.artifacts[0]
+    return _scale(scaler, raw.astype(np.float32)[None, :], entry.modality)[0].astype(np.float32, copy=False)
+
+
+# 동시 요청을 모아 한 번에 추론 (모달리티별 배치 크기/대기시간은 settings)
+_BATCHERS: Dict[str, MicroBatcher] = {
+    m: MicroBatcher(m, _run_rows, max_batch=batch_config(m)[0], max_wait_ms=batch_config(m)[1])
+    for m in ("face", "speech")
+}
+
+
+def vector_row(modality: str, vec: np.ndarray, names: Sequence[str]) -> np.ndarray:
+    """
+    names 순서의 피처 벡터 → feature_order 순서 + 스케일 적용된 float32 모델 입력 행.
+    (dict 를 거치지 않는 벡터화 경로)
+    """
+    entry = model_registry.get(modality)
+    idx = _gather_index(tuple(entry.artifacts[2]), tuple(names))
+    return _encode(entry, np.append(vec, 0.0)[idx])
+
+
+def feature_row(modality: str, feats: Dict[str, Any], version: Optional[str] = None) -> np.ndarray:
+    """feats dict → 스케일 적용된 float32 모델 입력 행 (누락 피처는 0.0). version 없으면 활성 버전."""
+    entry = model_registry.get(modality, version)
+    raw = np.array([float(feats.get(k, 0.0)) for k in entry.artifacts[2]], dtype=np.float32)
+    return _encode(entry, raw)
+
+
+def feature_count(modality: str) -> int:
+    return len(model_registry.get(modality).artifacts[2])
+
+
+def predict_rows(modality: str, Xs: np.ndarray) -> np.ndarray:
+    """
+    Xs: (N, F) vector_row/feature_row 로 만든 모델 입력 행렬
+    returns: (N,) proba_of_class_1
+    """
+    return _run_rows(model_registry.get(modality), np.asarray(Xs, dtype=np.float32))
+
+
+def predict_proba_batch(modality: str, X: np.ndarray) -> np.ndarray:
+    """
+    X: (N, F) feature_order 순서의 원시 피처 행렬
+    returns: (N,) proba_of_class_1
+    """
+    entry = model_registry.get(modality)
+    return _run_rows(entry, _scale(entry.artifacts[0], np.asarray(X, dtype=np.float32), entry.modality))
+
+
+def predict_row_and_label(modality: str, row: np.ndarray) -> Tuple[float, int]:
+    """모델 입력 행 1개 → (proba_of_class_1, label). 동시 요청과 함께 배칭된다."""
+    entry = model_registry.get(modality)
+    proba_1 = _BATCHERS[modality].submit(row, ctx=entry)
     label = int(proba_1 >= 0.5)
     return proba_1, label
+
+
+def predict_proba_version(modality: str, feats: Dict[str, Any], version: str) -> float:
+    """
+    지정 버전 모델로 feats 1건 추론 (섀도 평가용).
+    배처/단계 메트릭을 거치지 않아 본 요청의 배치·지연 지표와 섞이지 않는다.
+    """
+    entry = model_registry.get(modality, version)
+    row = feature_row(modality, feats, version)
+    return float(_proba_class1(entry.artifacts[1], row[None, :], entry.modality)[0])
+
+
+def predict_proba_and_label(modality: str, feats: Dict[str, Any]) -> Tuple[float, int]:
+    """
+    feats: {feature_name: value}
+    returns: (proba_of_class_1, label)
+    """
+    return predict_row_and_label(modality, feature_row(modality, feats))
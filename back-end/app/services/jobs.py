@@ -0,0 +1,130 @@
+# back-end/app/services/jobs.py
+"""
+실행기 워커에서 돌아가는 측정 작업들.
+프로세스 풀로 넘어가므로 모두 모듈 최상위 함수(피클 가능)여야 한다.
+"""
+from __future__ import annotations
+
+import logging
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from app.services import metrics
+
+# (공유메모리 이름, 바이트 길이)
+ShmSpec = Tuple[str, int]
+
+
+def _face(data) -> Any:
+    from app.services.pipeline import run_pipeline
+    return run_pipeline("face", data)
+
+
+def _arm(start, end) -> Any:
+    from app.services.pipeline import run_pipeline
+    return run_pipeline("arm", (start, end))
+
+
+def _arm_video(*payloads, **params) -> Dict[str, Any]:
+    """팔 검사 동영상(payloads[0]) 또는 프레임 시퀀스(payloads) → 추적 모드 drift 측정"""
+    from app.services.pipeline import run_arm_video
+    return run_arm_video(payloads, **params)
+
+
+def _face_features(data) -> Dict[str, Any]:
+    """배치용: 이미지 1장의 특징 + 모델 입력 행 + 압축 피처/랜드마크. 이미지별 실패는 error 로 돌려준다."""
+    from app.services.pipeline import face_features_and_row
+    try:
+        feats, row, packed = face_features_and_row(data)
+    except ValueError as e:
+        return {"error": str(e)}
+    return {"features": feats, "row": row, "packed": packed}
+
+
+def _face_infer(matrix) -> Any:
+    """배치용: float32 행렬 바이트 → [(proba, label), ...]"""
+    import numpy as np
+    from app.services.inference.tabnet_runner import feature_count
+    from app.services.pipeline import predict_face_rows
+    X = np.frombuffer(matrix, dtype=np.float32).reshape(-1, feature_count("face"))
+    return predict_face_rows(X)
+
+
+def _speech_infer(vec) -> Any:
+    """음성: 요청 프로세스에서 스트리밍으로 누적한 특징 벡터(float64 바이트) → (proba, label)"""
+    import numpy as np
+    from app.services.pipeline import predict_speech_vector
+    return predict_speech_vector(np.frombuffer(vec, dtype=np.float64))
+
+
+def _warmup() -> Dict[str, Dict[str, Any]]:
+    """설정된 모달리티 예열 + 상태 보고 (/ready 용)."""
+    from app.services.readiness import warmup_all
+    return warmup_all()
+
+
+JOBS: Dict[str, Callable[..., Any]] = {
+    "face": _face,
+    "arm": _arm,
+    "arm_video": _arm_video,
+    "face_features": _face_features,
+    "face_infer": _face_infer,
+    "speech_infer": _speech_infer,
+    "warmup": _warmup,
+}
+
+
+# 작업 종류 → 메트릭 modality 레이블
+JOB_MODALITY: Dict[str, str] = {
+    "face": "face",
+    "arm": "arm",
+    "arm_video": "arm",
+    "face_features": "face",
+    "face_infer": "face",
+    "speech_infer": "speech",
+    "warmup": "all",
+}
+
+
+def init_worker() -> None:
+    """
+    워커 시작 시 1회: 모델/검출기를 미리 올리고 더미 추론까지 돌려 첫 요청부터 따뜻한 상태로 처리.
+    실패해도 워커는 띄우고, 실제 요청에서 다시 로딩을 시도한다.
+    """
+    try:
+        _warmup()
+    except Exception:
+        logging.exception("[EXECUTOR] worker warmup failed")
+
+
+def ping() -> bool:
+    return True
+
+
+def run_local(kind: str, payloads: Sequence[Any], params: Optional[Dict[str, Any]] = None) -> Any:
+    """스레드/인라인 모드: 바이트를 그대로 넘긴다."""
+    return JOBS[kind](*payloads, **(params or {}))
+
+
+def run_shared(kind: str, specs: Sequence[ShmSpec], params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, dict]]:
+    """
+    프로세스 모드: 부모가 공유메모리에 써 둔 이미지를 복사 없이 memoryview로 읽는다.
+    (np.frombuffer/cv2.imdecode 모두 memoryview를 그대로 받음)
+    반환: (결과, 이 워커에 쌓인 메트릭 증분) → 부모가 merge 해서 /metrics 에 합친다.
+    """
+    segments = [shared_memory.SharedMemory(name=name) for name, _ in specs]
+    views = [seg.buf[:size] for seg, (_, size) in zip(segments, specs)]
+    try:
+        return JOBS[kind](*views, **(params or {})), metrics.registry.drain()
+    finally:
+        # 예외 트레이스백이 numpy 배열(=버퍼)을 잡고 있으면 release가 실패할 수 있음 → GC에 맡김
+        for v in views:
+            try:
+                v.release()
+            except BufferError:
+                pass
+        for seg in segments:
+            try:
+                seg.close()
+            except BufferError:
+                pass
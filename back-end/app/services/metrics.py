@@ -0,0 +1,271 @@
+# back-end/app/services/metrics.py
+"""
+프로세스 내 경량 메트릭 레지스트리 + Prometheus 텍스트 포맷 출력 (/metrics).
+- Counter / Gauge / Histogram, 레이블은 위치 인자(튜플)로 받아 dict 조회 1회 + 락 1회 (~μs)
+- 측정 워커(프로세스 모드)는 자기 레지스트리에 쌓았다가 작업 결과와 함께 증분(drain)을 돌려주고,
+  부모가 merge 해서 한 곳(/metrics)에서 보인다
+- 값을 계속 읽어야 하는 지표(대기열 깊이 등)는 수집 시점에 콜백으로 계산하는 Gauge 사용
+- HTTP 지연은 MetricsMiddleware(순수 ASGI)가 라우트 템플릿(/api/v1/face/{face_id}/image 등) 단위로 기록
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# 요청/단계 지연용 기본 버킷(초): 0.5ms ~ 30s
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if not float(v).is_integer() else str(int(v))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, doc, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self._header() + [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+    def drain(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            out, self._values = self._values, {}
+        return out
+
+    def merge(self, delta: Dict[LabelValues, float]) -> None:
+        with self._lock:
+            for k, v in delta.items():
+                self._values[k] = self._values.get(k, 0.0) + v
+
+
+class Gauge(_Metric):
+    """set() 으로 값을 두거나, fn 을 주면 수집 시점에 [(레이블, 값), ...] 을 계산."""
+    kind = "gauge"
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = (),
+                 fn: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None):
+        super().__init__(name, doc, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._fn = fn
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        if self._fn is not None:
+            items += list(self._fn())
+        return self._header() + [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, doc, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → [버킷별 개수..., +Inf 개수, 합계]  (누적은 출력 시 계산)
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+            row[i] += 1
+            row[-1] += value
+
+    def time(self, *labels: str) -> "_Timer":
+        """with STAGE_LATENCY.time("face", "decode"): ..."""
+        return _Timer(self, labels)
+
+    def count(self, *labels: str) -> int:
+        row = self._values.get(labels)
+        return int(sum(row[:-1])) if row else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines = self._header()
+        for k, row in items:
+            acc = 0.0
+            for bound, n in zip(self.buckets + (float("inf"),), row[:-1]):
+                acc += n
+                le = 'le="' + _fmt(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, k, le)} {_fmt(acc)}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, k)} {_fmt(row[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, k)} {_fmt(acc)}")
+        return lines
+
+    def drain(self) -> Dict[LabelValues, List[float]]:
+        with self._lock:
+            out, self._values = self._values, {}
+        return out
+
+    def merge(self, delta: Dict[LabelValues, List[float]]) -> None:
+        with self._lock:
+            for k, d in delta.items():
+                row = self._values.get(k)
+                if row is None:
+                    self._values[k] = list(d)
+                else:
+                    for i, v in enumerate(d):
+                        row[i] += v
+
+
+class _Timer:
+    __slots__ = ("_hist", "_labels", "_t0")
+
+    def __init__(self, hist: Histogram, labels: LabelValues):
+        self._hist = hist
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._hist.observe(time.perf_counter() - self._t0, *self._labels)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, doc: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, doc, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, doc: str, labelnames: Sequence[str] = (), fn=None) -> Gauge:
+        return self.register(Gauge(name, doc, labelnames, fn))  # type: ignore[return-value]
+
+    def histogram(self, name: str, doc: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, doc, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for m in self._metrics.values():
+            lines += m.render()
+        return "\n".join(lines) + "\n"
+
+    # ── 워커 → 부모 전달 ────────────────────────────────────────────────────
+    def drain(self) -> Dict[str, dict]:
+        """카운터/히스토그램의 증분을 꺼내고 비운다 (게이지는 프로세스 로컬 값이라 제외)."""
+        out = {}
+        for name, m in self._metrics.items():
+            if isinstance(m, (Counter, Histogram)):
+                d = m.drain()
+                if d:
+                    out[name] = d
+        return out
+
+    def merge(self, delta: Dict[str, dict]) -> None:
+        for name, d in delta.items():
+            m = self._metrics.get(name)
+            if isinstance(m, (Counter, Histogram)):
+                m.merge(d)
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어: 응답 상태 코드와 매칭된 라우트 템플릿으로 HTTP_LATENCY 기록.
+    (BaseHTTPMiddleware 와 달리 응답 본문/스트리밍을 감싸지 않는다)
+    경로 원문 대신 템플릿을 써서 ID 마다 시계열이 늘어나지 않게 하고, 매칭 안 된 요청은 'unmatched'.
+    """
+
+    def __init__(self, app, skip_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = frozenset(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            route = scope.get("route")
+            HTTP_LATENCY.observe(
+                time.perf_counter() - t0,
+                getattr(route, "path", None) or "unmatched", scope.get("method", ""), str(status[0]),
+            )
+
+
+registry = Registry()
+
+# ── 지표 정의 ────────────────────────────────────────────────────────────────
+HTTP_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿별)", ("route", "method", "status"))
+JOB_LATENCY = registry.histogram(
+    "measure_job_duration_seconds", "측정 작업 시간 (대기 포함, 모달리티/작업 종류별)", ("modality", "job"))
+STAGE_LATENCY = registry.histogram(
+    "pipeline_stage_duration_seconds", "파이프라인 단계별 시간 (decode, landmarks, features, inference, blob_write, db_commit)",
+    ("modality", "stage"))
+BATCH_SIZE = registry.histogram(
+    "inference_batch_size", "한 번의 모델 호출에 묶인 행 수", ("modality",), buckets=(1, 2, 4, 8, 16, 32, 64, 128))
+EXECUTOR_REJECTED = registry.counter(
+    "measure_executor_rejected_total", "대기열 포화로 거절(503)된 측정 요청 수")
+MODEL_LOADS = registry.counter(
+    "model_loads_total", "모델 로딩 횟수 (버전/백엔드별)", ("modality", "version", "backend"))
+MODEL_LOAD_LATENCY = registry.histogram(
+    "model_load_duration_seconds", "모델 로딩 시간", ("modality",))
+FALLBACKS = registry.counter(
+    "model_fallback_total", "폴백으로 처리된 행 수 (passthrough_scaler, fallback_classifier, scaler_error, inference_error)",
+    ("modality", "kind"))
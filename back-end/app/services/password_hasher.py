@@ -0,0 +1,97 @@
+# back-end/app/services/password_hasher.py
+"""
+비밀번호 해시/검증 전용 스레드 풀.
+- bcrypt 한 번에 수백 ms 가 걸리므로 로그인/가입이 몰리면 기본 스레드 풀(파일 쓰기, 캐시 조회 등)이 막힌다
+  → 이 작업은 PASSWORD_HASH_WORKERS 개 스레드에서만 돈다 (bcrypt 는 GIL 을 놓으므로 스레드로 충분)
+- 동시 처리 한도(스레드 + PASSWORD_HASH_QUEUE_SIZE)를 넘으면 기다리지 않고 PasswordHasherSaturated (→ 503)
+- cost 는 PASSWORD_BCRYPT_ROUNDS (새 해시에만 적용)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.services.executor import ExecutorSaturated
+from app.services.metrics import registry
+
+PASSWORD_HASH_LATENCY = registry.histogram(
+    "password_hash_seconds", "비밀번호 해시/검증 시간 (대기 포함)", ("op",))
+PASSWORD_HASH_REJECTED = registry.counter(
+    "password_hash_rejected_total", "해시 풀 포화로 거절(503)된 요청 수")
+
+pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS)
+
+
+class PasswordHasherSaturated(ExecutorSaturated):
+    """해시 풀 대기열이 가득 참 (→ 503, 측정 실행기 포화와 같은 응답)."""
+
+
+class PasswordHasher:
+    def __init__(self, ctx: CryptContext, *, workers: int, queue_size: int):
+        self.ctx = ctx
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_size)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight = 0
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    async def hash(self, secret: str) -> str:
+        return await self._run("hash", self.ctx.hash, secret)
+
+    async def verify(self, secret: str, hashed: str) -> bool:
+        return await self._run("verify", self.ctx.verify, secret, hashed)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pwhash")
+                logging.info("[AUTH] password hash pool started (workers=%d, capacity=%d)", self.workers, self.capacity)
+            return self._pool
+
+    def _release(self, _: Any = None) -> None:
+        with self._lock:
+            self._inflight -= 1
+
+    async def _run(self, op: str, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._inflight >= self.capacity:
+                PASSWORD_HASH_REJECTED.inc()
+                raise PasswordHasherSaturated(f"password hash pool saturated ({self._inflight}/{self.capacity})")
+            self._inflight += 1
+        try:
+            fut: Future = self._ensure_pool().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # 슬롯은 클라이언트가 끊겨도 해시 계산이 실제로 끝날 때 반납
+        fut.add_done_callback(self._release)
+        with PASSWORD_HASH_LATENCY.time(op):
+            return await asyncio.wrap_future(fut)
+
+
+# 싱글톤 (풀은 첫 사용 시 생성)
+password_hasher = PasswordHasher(
+    pwd_ctx,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
+registry.gauge(
+    "password_hash_inflight", "실행 중 + 대기 중인 비밀번호 해시/검증 수",
+    fn=lambda: [((), password_hasher.inflight)])
@@ -1,24 +1,109 @@
-from typing import Dict, Tuple
-from app.core.config import Modality
-from app.services.features.face_features import extract_features_from_image_bytes as face_from_image
-from app.services.inference.tabnet_runner import predict_proba_and_label
-from app.services.features.arm_features import extract_features_from_two_images as arm_extract
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import cv2
+import numpy as np
+from app.core.config import Modality, settings, threshold
+from app.services.features.face_features import (
+    FEATURE_NAMES as FACE_FEATURE_NAMES,
+    extract_feature_vector_and_landmarks as face_vector_and_landmarks,
+    features_to_dict as face_features_to_dict,
+)
+from app.services.features.packing import pack_arm_landmarks, pack_face_landmarks, pack_features, packed_result
+from app.services.features.speech_features import (
+    FEATURE_NAMES as SPEECH_FEATURE_NAMES,
+    extract_feature_vector_from_audio_bytes as speech_vector_from_audio,
+    features_to_dict as speech_features_to_dict,
+)
+from app.services.inference.tabnet_runner import predict_row_and_label, predict_rows, uses_fallback, vector_row
+from app.services.features.arm_features import extract_features_and_landmarks as arm_extract
 from app.services.inference.arm_xgb_runner import predict_proba_and_label as arm_predict
+from app.services.features.arm_video import drift_features, iter_image_frames, iter_video_bytes, track_hands, video_settings
 from app.services.arm_result import compose_arm_result
 
-def run_pipeline(modality: Modality, payload: bytes) -> Tuple[Dict[str, float], float, int]:
+def run_pipeline(modality: Modality, payload: bytes):
+    """
+    face → (features, proba, label, packed) / arm → {proba, label, text, features, packed}
+    packed: 저장용 압축 피처/원 랜드마크 (packing.packed_result, 응답에는 싣지 않음)
+    """
     if modality == "face":
-        feats, _ = face_from_image(payload)
-        if not feats: raise ValueError("얼굴 인식 실패")
+        # 벡터 → (feature_order 정렬 + 스케일) 행으로 바로 추론, dict 는 응답용으로만 생성
+        vec, lm, _ = face_vector_and_landmarks(payload)
+        if vec is None: raise ValueError("얼굴 인식 실패")
+        proba, label = predict_row_and_label(modality, vector_row(modality, vec, FACE_FEATURE_NAMES))
+        feats = face_features_to_dict(vec)
+        packed = packed_result(*pack_features("face", feats), pack_face_landmarks(lm))
+        return feats, proba, label, packed
     elif modality == "arm":
         s_bytes, e_bytes = payload
-        feats = arm_extract(s_bytes, e_bytes)
+        feats, s_xy, e_xy = arm_extract(s_bytes, e_bytes)
         proba, label = arm_predict(feats)
         text = compose_arm_result(proba, label, feats)
-        return {"proba": proba, "label": label, "text": text, "features": feats}
+        packed = packed_result(*pack_features("arm", feats), pack_arm_landmarks(s_xy, e_xy))
+        return {"proba": proba, "label": label, "text": text, "features": feats, "packed": packed}
     elif modality == "speech":
-        raise NotImplementedError("speech pipeline 준비 중")
+        # 업로드 스트림은 endpoint 에서 SpeechStream 으로 직접 누적, 여기는 이미 메모리에 있는 WAV 용
+        vec = speech_vector_from_audio(payload)
+        proba, label = predict_speech_vector(vec)
+        return speech_features_to_dict(vec), proba, label
     else:
         raise ValueError("Unknown modality")
-    proba, label = predict_proba_and_label(modality, feats)
-    return feats, proba, label
+
+
+# ── 다중 이미지(배치) 얼굴 파이프라인: 특징 추출은 이미지별, 추론은 행렬 1회 ──
+def face_features_and_row(payload: bytes) -> Tuple[Dict[str, float], np.ndarray, Dict[str, Any]]:
+    """배치용: (특징 dict, 모델 입력 행, packed_result) — 단건 측정과 같은 캐시 항목을 만들 수 있도록 압축 결과 포함."""
+    vec, lm, img = face_vector_and_landmarks(payload)
+    if vec is None:
+        raise ValueError("이미지 디코딩 실패" if img is None else "얼굴 인식 실패")
+    feats = face_features_to_dict(vec)
+    packed = packed_result(*pack_features("face", feats), pack_face_landmarks(lm))
+    return feats, vector_row("face", vec, FACE_FEATURE_NAMES), packed
+
+
+def predict_face_rows(X: np.ndarray) -> List[Tuple[float, int]]:
+    probas = predict_rows("face", X)
+    return [(float(p), int(p >= 0.5)) for p in probas]
+
+
+# ── 음성: 스트리밍으로 누적한 특징 벡터 → 추론 1회 ──
+def predict_speech_vector(vec: np.ndarray) -> Tuple[float, int]:
+    """
+    speech_features.FEATURE_NAMES 순서 벡터 → (proba, label). 라벨은 SPEECH_THRESHOLD 기준.
+    실제 모델이 배포되지 않아 폴백(항상 0.5)으로 떠 있으면 진단값을 만들지 않고 NotImplementedError.
+    """
+    if uses_fallback("speech"):
+        raise NotImplementedError("음성 모델이 아직 준비되지 않았습니다.")
+    proba, _ = predict_row_and_label("speech", vector_row("speech", vec, SPEECH_FEATURE_NAMES))
+    return proba, int(proba >= threshold("speech"))
+
+
+# ── 팔: 동영상/프레임 시퀀스 (추적 모드) → 시작/끝 자세 중앙값 피처 + drift 통계 ──
+def _jpeg(rgb: np.ndarray) -> bytes:
+    ok, buf = cv2.imencode(".jpg", cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR), [cv2.IMWRITE_JPEG_QUALITY, 90])
+    if not ok:
+        raise ValueError("대표 프레임 인코딩 실패")
+    return buf.tobytes()
+
+
+def run_arm_video(
+    payloads: Sequence[bytes], *, source: str = "video", suffix: str = ".mp4", sample_fps: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    source="video": payloads[0] 동영상을 sample_fps 로 샘플링
+    source="frames": payloads 각각이 프레임 이미지 (sample_fps 간격으로 찍었다고 봄)
+    반환: arm run_pipeline 결과 + drift + 저장용 시작/끝 대표 프레임(JPEG)
+    """
+    opts = video_settings(sample_fps)
+    if source == "video":
+        frames = iter_video_bytes(payloads[0], suffix=suffix, **opts)
+    else:
+        frames = iter_image_frames(payloads, fps=opts["sample_fps"], max_side=opts["max_side"])
+    times, tracks, (first, last) = track_hands(frames, keep_edges=True)
+    if all(np.isnan(xy[:, 0, 0]).all() for xy in tracks.values()):
+        raise ValueError("손 인식 실패")
+    feats, drift = drift_features(times, tracks, edge_seconds=settings.ARM_VIDEO_EDGE_SECONDS)
+    proba, label = arm_predict(feats)
+    return {
+        "proba": proba, "label": label, "text": compose_arm_result(proba, label, feats),
+        "features": feats, "drift": drift, "packed": packed_result(*pack_features("arm", feats), None),
+        "start_jpeg": _jpeg(first), "end_jpeg": _jpeg(last),
+    }
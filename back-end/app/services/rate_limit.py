@@ -0,0 +1,97 @@
+# back-end/app/services/rate_limit.py
+"""
+로그인/가입 실패 한도 (프로세스 로컬 토큰 버킷).
+- 키(클라이언트 IP, 아이디)마다 window 초에 limit 회까지, 남은 토큰만큼은 한꺼번에 허용
+- 요청 전에는 retry_after 로 확인만 하고, 실패했을 때만 hit 로 차감
+  → 정상 로그인·가입이 몰려도 막히지 않고, 남의 아이디로 요청을 보내 잠글 수도 없다 (틀린 비밀번호만 셈)
+- 클라이언트 IP 는 신뢰 프록시(AUTH_TRUSTED_PROXIES)를 거친 요청만 AUTH_CLIENT_IP_HEADER 에서 읽는다
+- 키 수는 max_keys 로 제한 (오래 안 쓴 키부터 버림) → 임의 아이디를 돌려도 메모리가 늘지 않는다
+- 워커 프로세스끼리 공유하지 않으므로 실제 한도는 (워커 수 × limit) 이다
+"""
+from __future__ import annotations
+
+import ipaddress
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Tuple
+
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.services.metrics import registry
+
+AUTH_RATE_LIMITED = registry.counter(
+    "auth_rate_limited_total", "실패 한도 초과로 거절(429)된 로그인/가입 요청 수", ("scope",))
+
+
+class RateLimiter:
+    def __init__(self, *, limit: int, window: float, max_keys: int = 10000):
+        self.limit = max(0, limit)
+        self.rate = self.limit / window if window > 0 else 0.0
+        self.max_keys = max(1, max_keys)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()  # key → (남은 토큰, 갱신 시각)
+        self._lock = threading.Lock()
+
+    def retry_after(self, key: str) -> float:
+        """차감 없이 확인. 반환: 0 이면 허용, 아니면 다음 시도까지 기다릴 초."""
+        return self._take(key, 0.0)
+
+    def hit(self, key: str) -> float:
+        """1회 차감 (토큰이 없으면 차감하지 않음). 반환은 retry_after 와 같다."""
+        return self._take(key, 1.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def _take(self, key: str, cost: float) -> float:
+        if self.limit == 0 or self.rate == 0:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (float(self.limit), now))
+            tokens = min(float(self.limit), tokens + (now - last) * self.rate)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return 0.0 if allowed else (1.0 - tokens) / self.rate
+
+
+@lru_cache(maxsize=8)
+def _trusted_networks(spec: str) -> Tuple[ipaddress._BaseNetwork, ...]:
+    return tuple(ipaddress.ip_network(s.strip(), strict=False) for s in spec.split(",") if s.strip())
+
+
+def _is_trusted(addr: str) -> bool:
+    networks = _trusted_networks(settings.AUTH_TRUSTED_PROXIES)
+    if not networks:
+        return False
+    try:
+        ip = ipaddress.ip_address(addr)
+    except ValueError:
+        return False
+    return any(ip in net for net in networks)
+
+
+def client_ip(request: Request) -> str:
+    """
+    연결 주소가 신뢰 프록시면 AUTH_CLIENT_IP_HEADER(X-Forwarded-For) 를 오른쪽부터 보며
+    신뢰 프록시가 아닌 첫 주소를 클라이언트로 본다 (그보다 왼쪽 값은 클라이언트가 위조할 수 있음).
+    """
+    peer = request.client.host if request.client else "-"
+    if not _is_trusted(peer):
+        return peer
+    header = request.headers.get(settings.AUTH_CLIENT_IP_HEADER, "")
+    for addr in reversed([a.strip() for a in header.split(",") if a.strip()]):
+        if not _is_trusted(addr):
+            return addr
+    return peer
+
+
+auth_ip_limiter = RateLimiter(limit=settings.AUTH_RATE_LIMIT_PER_IP, window=settings.AUTH_RATE_LIMIT_WINDOW)
+auth_id_limiter = RateLimiter(limit=settings.AUTH_RATE_LIMIT_PER_ID, window=settings.AUTH_RATE_LIMIT_WINDOW)
@@ -0,0 +1,161 @@
+# back-end/app/services/readiness.py
+"""
+시작 시 예열과 /ready 상태.
+- 모달리티별로 활성 버전 모델 로딩 → 더미 입력 1건 추론 → 검출기(MediaPipe) 1개 생성
+- 예열은 측정이 실제로 도는 곳(프로세스 모드면 워커)에서 실행하고, 결과를 부모가 받아 보관
+- 폴백 모델(FallbackClassifier, 항상 0.5)이나 통과 스케일러로 떠 있으면 'degraded' → 기본은 준비 안 됨
+/health 는 프로세스 생존만, /ready 는 측정 요청을 받아도 되는지를 나타낸다.
+ML 라이브러리는 예열 함수 안에서만 import 한다 (이 모듈 자체는 가볍게).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from app.core.config import settings
+
+# 이 이름의 모델/스케일러로 로딩됐다면 실제 모델이 아니라 안전장치로 떠 있는 것
+_FALLBACK_BACKENDS = {"FallbackClassifier", "PassthroughScaler"}
+
+
+def _warm_face() -> Dict[str, Any]:
+    import numpy as np
+    from app.services.inference.model_registry import model_registry
+    from app.services.inference.tabnet_runner import feature_count, predict_rows
+    from app.services.features.face_features import face_mesh_pool
+
+    entry = model_registry.get("face")
+    scaler, model, _ = entry.artifacts
+    t0 = time.perf_counter()
+    predict_rows("face", np.zeros((1, feature_count("face")), dtype=np.float32))
+    face_mesh_pool.warmup()
+    return {
+        "version": entry.version,
+        "backend": type(model).__name__,
+        "scaler": type(scaler).__name__,
+        "load_ms": round(entry.load_ms, 1),
+        "warmup_ms": round((time.perf_counter() - t0) * 1000, 1),
+    }
+
+
+def _warm_arm() -> Dict[str, Any]:
+    import numpy as np
+    from app.core.config import model_version
+    from app.services.features.arm_features import FEATURE_COLS, hands_pool
+    from app.services.inference.arm_xgb_runner import _load_model, predict_proba_batch
+
+    t0 = time.perf_counter()
+    model = _load_model()
+    t1 = time.perf_counter()
+    predict_proba_batch(np.zeros((1, len(FEATURE_COLS))))
+    hands_pool.warmup()
+    return {
+        "version": model_version("arm"),
+        "backend": type(model).__name__,
+        "load_ms": round((t1 - t0) * 1000, 1),
+        "warmup_ms": round((time.perf_counter() - t1) * 1000, 1),
+    }
+
+
+def _warm_speech() -> Dict[str, Any]:
+    import numpy as np
+    from app.services.inference.model_registry import model_registry
+    from app.services.inference.tabnet_runner import feature_count, predict_rows
+
+    entry = model_registry.get("speech")
+    scaler, model, _ = entry.artifacts
+    t0 = time.perf_counter()
+    predict_rows("speech", np.zeros((1, feature_count("speech")), dtype=np.float32))
+    return {
+        "version": entry.version,
+        "backend": type(model).__name__,
+        "scaler": type(scaler).__name__,
+        "load_ms": round(entry.load_ms, 1),
+        "warmup_ms": round((time.perf_counter() - t0) * 1000, 1),
+    }
+
+
+WARMERS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "face": _warm_face,
+    "arm": _warm_arm,
+    "speech": _warm_speech,
+}
+
+
+def configured_modalities() -> List[str]:
+    return [m.strip() for m in settings.WARMUP_MODALITIES.split(",") if m.strip()]
+
+
+def warmup_modality(modality: str) -> Dict[str, Any]:
+    """모달리티 1개 예열. 실패해도 예외를 던지지 않고 상태로 돌려준다."""
+    t0 = time.perf_counter()
+    try:
+        info = WARMERS[modality]()
+    except Exception as e:
+        logging.exception("[READY] warmup failed: %s", modality)
+        return {"status": "failed", "error": f"{type(e).__name__}: {e}", "elapsed_ms": round((time.perf_counter() - t0) * 1000, 1)}
+    degraded = _FALLBACK_BACKENDS & {info.get("backend"), info.get("scaler")}
+    if degraded:
+        logging.error("[READY] %s is serving with fallback %s", modality, ", ".join(sorted(degraded)))
+    return {"status": "degraded" if degraded else "ready", **info}
+
+
+def warmup_all(modalities: List[str] | None = None) -> Dict[str, Dict[str, Any]]:
+    return {m: warmup_modality(m) for m in (configured_modalities() if modalities is None else modalities)}
+
+
+class Readiness:
+    """부모 프로세스가 보관하는 예열 결과. phase: starting → warming → done"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.phase = "starting"
+        self.modalities: Dict[str, Dict[str, Any]] = {}
+        self.started_at = time.time()
+        self.elapsed_ms: float | None = None
+
+    def record(self, phase: str, modalities: Dict[str, Dict[str, Any]] | None = None) -> None:
+        with self._lock:
+            self.phase = phase
+            if modalities is not None:
+                self.modalities = modalities
+            if phase == "done":
+                self.elapsed_ms = round((time.time() - self.started_at) * 1000, 1)
+
+    def is_ready(self) -> bool:
+        ok = {"ready", "degraded"} if settings.READY_ALLOW_DEGRADED else {"ready"}
+        with self._lock:
+            return self.phase == "done" and all(s.get("status") in ok for s in self.modalities.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"phase": self.phase, "elapsed_ms": self.elapsed_ms, "modalities": dict(self.modalities)}
+
+
+readiness = Readiness()
+
+
+def run_startup_warmup() -> None:
+    """
+    실행기 워커를 띄우고(워커마다 jobs.init_worker 로 모델 로딩) 예열 작업 1건의 결과를 기록.
+    프로세스 모드에서는 워커 하나의 결과지만, 모든 워커가 같은 초기화를 거친다.
+    """
+    from app.services.executor import measure_executor
+
+    modalities = configured_modalities()
+    if not modalities:
+        # 측정 모달리티가 없는 워커(인증 전용 등) → ML 워커를 띄우지 않음
+        readiness.record("done", {})
+        return
+    readiness.record("warming")
+    try:
+        measure_executor.start()
+        report = asyncio.run(measure_executor.run("warmup"))
+    except Exception as e:
+        logging.exception("[READY] startup warmup failed")
+        report = {m: {"status": "failed", "error": f"{type(e).__name__}: {e}"} for m in modalities}
+    readiness.record("done", report)
+    logging.info("[READY] warmup done: %s", {m: s.get("status") for m, s in report.items()})
@@ -0,0 +1,239 @@
+# back-end/app/services/result_cache.py
+"""
+측정 결과 캐시: (입력 바이트 sha256 + 모달리티 + 모델 버전 + 임계치) → 파이프라인 결과.
+- 1단계: 프로세스 메모리 LRU
+- 2단계: 디스크(JSON, 키 앞 2자리로 디렉터리 분산) — 재시작 후에도 유지
+같은 이미지가 다시 들어오면 디코딩/MediaPipe/추론을 모두 건너뛴다.
+모델 버전이나 임계치, 모델 디렉터리 파일(이름·mtime·크기)이 바뀌면 키 자체가 달라지므로 이전 항목은 조회되지 않고,
+(같은 버전에 실제 모델 파일을 새로 넣어도 폴백 모델로 계산된 옛 결과가 재사용되지 않는다)
+디스크의 옛 항목은 용량 한도를 넘을 때 오래된 것부터 정리된다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from app.core.config import Modality, model_dir, model_version, settings, threshold
+from app.services.executor import measure_executor
+from app.services.inference.model_registry import _dir_fingerprint
+
+# 특징 계산 방식이 바뀌면 올려서 기존 항목을 모두 무효화
+CACHE_SCHEMA = "2"
+
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+_fingerprints: Dict[str, Tuple[float, str]] = {}  # 모델 디렉터리 → (확인 시각, 지문 해시)
+_fp_lock = threading.Lock()
+
+
+def model_files_digest(modality: Modality) -> str:
+    """
+    활성 모델 디렉터리 파일 지문의 해시 (모델 레지스트리의 재로딩 기준과 같음).
+    stat 은 MODEL_RELOAD_CHECK_SECONDS 마다 한 번만.
+    """
+    mdir = Path(model_dir(modality))
+    if not mdir.is_absolute():
+        mdir = _BACKEND_ROOT / mdir
+    key, now = str(mdir), time.monotonic()
+    with _fp_lock:
+        cached = _fingerprints.get(key)
+    if cached is not None and now - cached[0] < settings.MODEL_RELOAD_CHECK_SECONDS:
+        return cached[1]
+    digest = hashlib.sha256(repr(_dir_fingerprint(key)).encode()).hexdigest()[:16]
+    with _fp_lock:
+        _fingerprints[key] = (now, digest)
+    return digest
+
+
+class ResultCache:
+    def __init__(self, *, max_entries: int, disk_dir: Optional[str], disk_max_mb: int):
+        self.max_entries = max(0, max_entries)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = max(0, disk_max_mb) * 1024 * 1024
+        self._mem: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None  # 첫 저장 시 한 번 스캔
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "disk_errors": 0}
+
+    # ── 키 ──────────────────────────────────────────────────────────────────
+    @staticmethod
+    def key(modality: Modality, payloads: Sequence[bytes]) -> str:
+        h = hashlib.sha256()
+        h.update(f"{CACHE_SCHEMA}|{modality}|{model_version(modality)}|{model_files_digest(modality)}|{threshold(modality)!r}".encode())
+        for p in payloads:
+            # 다중 입력(arm 시작/끝) 경계가 섞이지 않도록 길이를 함께 넣는다
+            h.update(len(p).to_bytes(8, "little"))
+            h.update(p)
+        return h.hexdigest()
+
+    # ── 조회/저장 ───────────────────────────────────────────────────────────
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            text = self._mem.get(key)
+            if text is not None:
+                self._mem.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return json.loads(text)
+
+        text = self._read_disk(key)
+        with self._lock:
+            if text is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._remember(key, text)
+        return json.loads(text)
+
+    def put(self, key: str, value: Any) -> None:
+        # 두 계층 모두 JSON 문자열로 보관 → 호출자가 결과를 바꿔도 캐시는 그대로
+        text = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, text)
+            self._counters["stores"] += 1
+        self._write_disk(key, text)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counters)
+            out["memory_entries"] = len(self._mem)
+        lookups = out["memory_hits"] + out["disk_hits"] + out["misses"]
+        out["hit_rate"] = round((out["memory_hits"] + out["disk_hits"]) / lookups, 4) if lookups else 0.0
+        out["disk_bytes"] = self._disk_bytes
+        return out
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _remember(self, key: str, text: str) -> None:
+        if self.max_entries == 0:
+            return
+        self._mem[key] = text
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if self.disk_dir is None:
+            return None
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError:
+            logging.exception("[CACHE] disk read failed: %s", key)
+            with self._lock:
+                self._counters["disk_errors"] += 1
+            return None
+
+    def _write_disk(self, key: str, text: str) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._path(key)
+        data = text.encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)  # 동시 저장/읽기에도 반쯤 쓴 파일이 보이지 않게
+        except OSError:
+            logging.exception("[CACHE] disk write failed: %s", key)
+            with self._lock:
+                self._counters["disk_errors"] += 1
+            return
+        self._account(len(data))
+
+    def _account(self, added: int) -> None:
+        if not self.disk_max_bytes:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(f.stat().st_size for f in self.disk_dir.glob("*/*.json"))
+            else:
+                self._disk_bytes += added
+            over = self._disk_bytes > self.disk_max_bytes
+        if over:
+            self._prune()
+
+    def _prune(self) -> None:
+        """디스크 한도 초과 시 오래 쓰인 파일부터 한도의 90%까지 삭제."""
+        files = []
+        for f in self.disk_dir.glob("*/*.json"):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, f))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.disk_max_bytes * 0.9)
+        for _, size, f in files:
+            if total <= target:
+                break
+            try:
+                f.unlink()
+                total -= size
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._disk_bytes = total
+
+
+def _well_formed(modality: Modality, value: Any) -> bool:
+    """face 항목은 (features, proba, label, packed) 4개 — 형태가 다른 옛 항목은 없는 것으로 본다."""
+    if modality == "face":
+        return isinstance(value, (list, tuple)) and len(value) == 4
+    return True
+
+
+def _lookup(modality: Modality, payloads: Sequence[bytes]) -> Tuple[str, Optional[Any]]:
+    key = result_cache.key(modality, payloads)
+    hit = result_cache.get(key)
+    if hit is not None and not _well_formed(modality, hit):
+        logging.warning("[CACHE] malformed %s entry ignored: %s", modality, key)
+        hit = None
+    return key, hit
+
+
+async def lookup(modality: Modality, payloads: Sequence[bytes]) -> Tuple[Optional[str], Optional[Any]]:
+    """(키, 캐시된 결과|None). 캐시를 끄면 (None, None). 해시/디스크 I/O 는 스레드에서."""
+    if not settings.RESULT_CACHE_ENABLED:
+        return None, None
+    return await asyncio.to_thread(_lookup, modality, payloads)
+
+
+async def store(key: Optional[str], value: Any) -> None:
+    if key is not None:
+        await asyncio.to_thread(result_cache.put, key, value)
+
+
+async def measure_cached(modality: Modality, *payloads: bytes) -> Any:
+    """
+    measure_executor.run(modality, ...) 의 캐시 버전.
+    실패(얼굴 미검출 등)는 캐시하지 않는다.
+    """
+    key, hit = await lookup(modality, payloads)
+    if hit is not None:
+        return hit
+    out = await measure_executor.run(modality, *payloads)
+    await store(key, out)
+    return out
+
+
+# 싱글톤 (API 프로세스에서만 사용)
+result_cache = ResultCache(
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    disk_dir=settings.RESULT_CACHE_DIR or None,
+    disk_max_mb=settings.RESULT_CACHE_DISK_MAX_MB,
+)
@@ -0,0 +1,174 @@
+# back-end/app/services/shadow.py
+"""
+섀도 평가: 후보 모델 버전(FACE_SHADOW_VERSION / ARM_SHADOW_VERSION)을 본 요청과 같은 피처로 추론해
+활성 버전 결과 옆에 기록 (shadow_result 테이블) → 트래픽을 옮기기 전에 오프라인으로 비교.
+- 요청 경로에서는 대기열에 넣기만 (put_nowait) → 응답 시간에 추가되는 것은 없다
+- 섀도 전용 스레드(SHADOW_WORKERS 개)가 처리, 측정 실행기·마이크로배처와 자원을 나누지 않음
+- 부하 시 섀도부터 버림: 대기열이 차거나 측정 실행기 사용률이 SHADOW_SHED_LOAD_RATIO 이상이면
+  넣을 때도, 꺼낼 때도 버린다 (metrics: shadow_jobs_total{outcome="dropped_*"})
+- 기록은 대기열이 빌 때 또는 SHADOW_FLUSH_ROWS 행마다 일괄 INSERT
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import Modality, model_version, settings, threshold
+from app.services.executor import measure_executor
+from app.services.metrics import registry
+
+SHADOW_JOBS = registry.counter(
+    "shadow_jobs_total", "섀도 평가 작업 수 (evaluated, error, dropped_queue, dropped_load)", ("modality", "outcome"))
+SHADOW_LATENCY = registry.histogram(
+    "shadow_inference_seconds", "섀도 후보 모델 추론 시간", ("modality",))
+
+_STOP = object()
+
+
+def shadow_version(modality: Modality) -> Optional[str]:
+    """설정된 후보 버전 (없거나 활성 버전과 같으면 None)."""
+    ver = {"face": settings.FACE_SHADOW_VERSION, "arm": settings.ARM_SHADOW_VERSION}.get(modality) or None
+    return None if ver == model_version(modality) else ver
+
+
+def _predict(modality: Modality, features: Dict[str, Any], version: str) -> tuple:
+    """후보 버전 → (proba, label). 라벨 기준은 본 요청과 같다 (face 0.5, arm ARM_THRESHOLD)."""
+    if modality == "face":
+        from app.services.inference.tabnet_runner import predict_proba_version
+        proba = predict_proba_version("face", features, version)
+        return proba, int(proba >= 0.5)
+    from app.services.inference.arm_xgb_runner import predict_proba_version
+    proba = predict_proba_version(features, version)
+    return proba, int(proba >= float(getattr(settings, "ARM_THRESHOLD", None) or threshold("arm") or 0.5))
+
+
+def _write_records(records: List[Dict[str, Any]]) -> None:
+    from app.db.session import SessionLocal
+    from app.models.shadow import ShadowResult
+    from sqlalchemy import insert
+
+    with SessionLocal() as db:
+        db.execute(insert(ShadowResult), records)
+        db.commit()
+
+
+class ShadowEvaluator:
+    def __init__(self, *, workers: int, queue_size: int, shed_ratio: float, flush_rows: int,
+                 record: Callable[[List[Dict[str, Any]]], None] = _write_records):
+        self.workers = max(1, workers)
+        self.shed_ratio = shed_ratio
+        self.flush_rows = max(1, flush_rows)
+        self.record = record
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def overloaded(self) -> bool:
+        """본 측정 경로가 바쁜지 (실행기 사용률 기준)."""
+        cap = measure_executor.capacity
+        return cap > 0 and measure_executor.inflight >= self.shed_ratio * cap
+
+    def submit(self, modality: Modality, features: Dict[str, Any], *, proba: float, label: int,
+               source_id: Optional[int] = None) -> bool:
+        """
+        후보 버전이 설정돼 있으면 섀도 평가를 예약 (요청 경로용: 막히지 않고 즉시 반환).
+        반환: 예약 여부 (후보 없음/부하로 버림이면 False)
+        """
+        version = shadow_version(modality)
+        if version is None or not features:
+            return False
+        if self.overloaded():
+            SHADOW_JOBS.inc(modality, "dropped_load")
+            return False
+        job = {
+            "modality": modality, "source_id": source_id, "features": dict(features),
+            "primary_version": model_version(modality), "primary_proba": float(proba), "primary_label": int(label),
+            "shadow_version": version,
+        }
+        self._ensure_threads()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            SHADOW_JOBS.inc(modality, "dropped_queue")
+            return False
+        return True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """남은 작업을 처리·기록하고 스레드 종료 (대기열이 차 있으면 timeout 후 포기)."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                break
+        for t in threads:
+            t.join(timeout)
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _ensure_threads(self) -> None:
+        if len(self._threads) >= self.workers:
+            return
+        with self._lock:
+            while len(self._threads) < self.workers:
+                t = threading.Thread(target=self._run, name=f"shadow-{len(self._threads)}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _evaluate(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        features = job.pop("features")
+        modality = job["modality"]
+        t0 = time.perf_counter()
+        try:
+            proba, label = _predict(modality, features, job["shadow_version"])
+        except Exception as e:
+            logging.exception("[SHADOW] %s/%s inference failed", modality, job["shadow_version"])
+            SHADOW_JOBS.inc(modality, "error")
+            return {**job, "shadow_proba": None, "shadow_label": None, "shadow_latency_ms": None,
+                    "error": f"{type(e).__name__}: {e}"[:255]}
+        elapsed = time.perf_counter() - t0
+        SHADOW_LATENCY.observe(elapsed, modality)
+        SHADOW_JOBS.inc(modality, "evaluated")
+        return {**job, "shadow_proba": proba, "shadow_label": label,
+                "shadow_latency_ms": round(elapsed * 1000, 3), "error": None}
+
+    def _flush(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        try:
+            self.record(records)
+        except Exception:
+            logging.exception("[SHADOW] failed to record %d results", len(records))
+        records.clear()
+
+    def _run(self) -> None:
+        records: List[Dict[str, Any]] = []
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                self._flush(records)
+                return
+            if self.overloaded():
+                SHADOW_JOBS.inc(job["modality"], "dropped_load")
+            else:
+                records.append(self._evaluate(job))
+            # 대기열이 비었을 때(한가할 때) 또는 일정 행마다 일괄 기록
+            if len(records) >= self.flush_rows or self._queue.empty():
+                self._flush(records)
+
+
+# 싱글톤 (API 프로세스에서만 사용)
+shadow_evaluator = ShadowEvaluator(
+    workers=settings.SHADOW_WORKERS,
+    queue_size=settings.SHADOW_QUEUE_SIZE,
+    shed_ratio=settings.SHADOW_SHED_LOAD_RATIO,
+    flush_rows=settings.SHADOW_FLUSH_ROWS,
+)
+registry.gauge("shadow_queue_length", "섀도 평가 대기 작업 수", fn=lambda: [((), shadow_evaluator.pending)])
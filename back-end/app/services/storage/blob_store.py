@@ -0,0 +1,137 @@
+# back-end/app/services/storage/blob_store.py
+"""
+이미지 원본 저장소 (DB 에는 키/MIME/크기만 둔다).
+- 키 = 내용의 sha256 hex → 같은 이미지는 한 번만 저장(중복 제거)
+- BlobStore 를 상속해 백엔드를 교체할 수 있고, 현재는 로컬 파일시스템 구현만 제공
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from app.core.config import settings
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobNotFound(KeyError):
+    """저장소에 키가 없음 (→ 404)."""
+
+
+def blob_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobStore(ABC):
+    """저장소 공통 인터페이스. 구현체는 put/open/size/exists/delete 를 제공한다 (read/stream 은 open 위에서 동작)."""
+
+    @abstractmethod
+    def put(self, data: bytes, key: Optional[str] = None) -> str:
+        """저장 후 키 반환. key 를 주면 내용 해시 대신 그 키로 저장 (원본에서 결정적으로 파생된 데이터용)."""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """읽기용 파일 객체. 키가 없으면 BlobNotFound."""
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        """바이트 크기. 키가 없으면 BlobNotFound."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """없는 키는 무시."""
+
+    def read(self, key: str) -> bytes:
+        with self.open(key) as f:
+            return f.read()
+
+    def stream(self, key: str, start: int = 0, end: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """[start, end] (end 포함) 구간을 chunk_size 단위로 읽는다. end=None 이면 끝까지."""
+        f = self.open(key)
+        try:
+            f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            f.close()
+
+
+class LocalBlobStore(BlobStore):
+    """
+    root/ab/cd/abcd…(sha256) 로 2단계 샤딩해 한 디렉터리에 파일이 몰리지 않게 저장.
+    쓰기는 임시 파일 → os.replace 로 원자적으로 처리해 반쯤 쓴 파일이 보이지 않는다.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        if len(key) != 64 or any(c not in "0123456789abcdef" for c in key):
+            raise BlobNotFound(key)
+        return self.root / key[:2] / key[2:4] / key
+
+    def put(self, data: bytes, key: Optional[str] = None) -> str:
+        key = key or blob_key(data)
+        path = self.path(key)
+        if path.exists():
+            return key  # 동일 내용이 이미 있음
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        return key
+
+    def open(self, key: str) -> BinaryIO:
+        try:
+            return open(self.path(key), "rb")
+        except FileNotFoundError:
+            raise BlobNotFound(key)
+
+    def size(self, key: str) -> int:
+        try:
+            return self.path(key).stat().st_size
+        except FileNotFoundError:
+            raise BlobNotFound(key)
+
+    def exists(self, key: str) -> bool:
+        try:
+            return self.path(key).exists()
+        except BlobNotFound:
+            return False
+
+    def delete(self, key: str) -> None:
+        try:
+            self.path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def get_blob_store() -> BlobStore:
+    backend = settings.BLOB_STORE_BACKEND
+    if backend == "local":
+        return LocalBlobStore(settings.BLOB_STORE_DIR)
+    raise ValueError(f"unknown BLOB_STORE_BACKEND: {backend}")
@@ -0,0 +1,66 @@
+# back-end/app/services/storage/derivatives.py
+"""
+목록/결과 화면용 축소 이미지(small/medium, WebP 또는 JPEG).
+- 첫 요청 때 만들어 blob 저장소에 넣고 이후엔 그대로 재사용
+- 키 = sha256(원본 키 | 크기 이름 | 긴 변 px | 포맷 | 버전) → 원본이 같으면 항상 같은 결과이므로
+  ETag 로 그대로 쓸 수 있고, 설정(px)이나 인코딩 방식이 바뀌면 새 키로 자연히 재생성
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, Dict
+
+from app.core.config import settings
+from app.services.storage.blob_store import BlobStore
+
+DERIVATIVE_VERSION = "1"
+
+# 포맷 → (확장자, MIME, 화질)
+_FORMATS = {
+    "webp": (".webp", "image/webp", 80),
+    "jpeg": (".jpg", "image/jpeg", 82),
+}
+
+
+def derivative_sizes() -> Dict[str, int]:
+    """크기 이름 → 긴 변(px)."""
+    return {"small": settings.THUMB_SMALL_SIDE, "medium": settings.THUMB_MEDIUM_SIDE}
+
+
+def negotiate_format(accept: str) -> str:
+    """브라우저가 WebP 를 받으면 WebP, 아니면 JPEG."""
+    return "webp" if "image/webp" in (accept or "") else "jpeg"
+
+
+def derivative_mime(fmt: str) -> str:
+    return _FORMATS[fmt][1]
+
+
+def derivative_key(source_key: str, size: str, fmt: str) -> str:
+    side = derivative_sizes()[size]
+    return hashlib.sha256(f"{source_key}|{size}|{side}|{fmt}|v{DERIVATIVE_VERSION}".encode()).hexdigest()
+
+
+def render_derivative(image_bytes: bytes, size: str, fmt: str) -> bytes:
+    """원본 → 긴 변 N px 축소본 (축소 디코딩 + EXIF 방향 적용). 디코딩 실패 시 ValueError."""
+    # OpenCV 는 실제로 축소본을 만들 때만 import (이미지 조회 라우트 import 를 가볍게)
+    import cv2
+    from app.services.features.image_ingest import ingest_image
+
+    image = ingest_image(image_bytes, max_side=derivative_sizes()[size])
+    if image is None:
+        raise ValueError("이미지 디코딩 실패")
+    ext, _, quality = _FORMATS[fmt]
+    flag = cv2.IMWRITE_WEBP_QUALITY if fmt == "webp" else cv2.IMWRITE_JPEG_QUALITY
+    ok, buf = cv2.imencode(ext, cv2.cvtColor(image.rgb, cv2.COLOR_RGB2BGR), [flag, quality])
+    if not ok:
+        raise ValueError(f"{fmt} 인코딩 실패")
+    return buf.tobytes()
+
+
+def ensure_derivative(store: BlobStore, source_key: str, size: str, fmt: str, load_source: Callable[[], bytes]) -> str:
+    """축소본이 없으면 만들어 저장하고 키를 돌려준다 (동시 생성돼도 같은 내용이라 안전)."""
+    key = derivative_key(source_key, size, fmt)
+    if not store.exists(key):
+        store.put(render_derivative(load_source(), size, fmt), key=key)
+    return key
@@ -0,0 +1,191 @@
+# back-end/app/services/storage/http.py
+"""
+저장된 측정 이미지 HTTP 응답.
+- 이미지는 한 번 쓰이면 바뀌지 않으므로 ETag = 내용 sha256 (강한 검증자), immutable 캐시
+  저장소로 이관되기 전 행(DB BLOB)은 내용 해시 대신 행 id + created_at 으로 만든 검증자 (legacy_validator)
+- If-None-Match / If-Modified-Since 가 맞으면 원본을 읽지 않고 304 (이관 전 행도 BLOB 을 읽지 않음)
+- 단일 구간 Range → 206 (If-Range 지원), 범위 밖이면 416
+- size=small|medium 이면 축소본(Accept 에 따라 WebP/JPEG)을 첫 요청 때 만들어 저장소에 두고 이후 재사용
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.services.storage.blob_store import BlobNotFound, blob_key, get_blob_store
+from app.services.storage.derivatives import derivative_key, derivative_mime, ensure_derivative, negotiate_format
+
+# 로그인 사용자 본인 이미지 → 공유 캐시(프록시)에는 저장하지 않음
+CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+_UNSATISFIABLE = "unsatisfiable"
+
+
+def _http_date(dt: datetime) -> str:
+    # DB DATETIME 은 tz 정보가 없으므로 UTC 로 간주
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 는 약한 비교 (W/ 접두어 무시)."""
+    if header.strip() == "*":
+        return True
+    return any(t.strip().removeprefix("W/") == etag for t in header.split(","))
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    inm = request.headers.get("if-none-match")
+    if inm is not None:
+        return _etag_matches(inm, etag)  # 둘 다 있으면 If-None-Match 만 본다
+    ims = request.headers.get("if-modified-since")
+    if ims and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(ims)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위이므로 같은 형식으로 절삭해 비교
+        return parsedate_to_datetime(_http_date(last_modified)) <= since
+    return False
+
+
+def _if_range_ok(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """If-Range 가 현재 표현과 일치할 때만 Range 를 적용 (ETag 는 강한 비교)."""
+    value = request.headers.get("if-range")
+    if value is None:
+        return True
+    value = value.strip()
+    if value.startswith('"') or value.startswith("W/"):
+        return value == etag
+    return last_modified is not None and value == _http_date(last_modified)
+
+
+def legacy_validator(row: str, created_at: Optional[datetime]) -> str:
+    """이관 전 행의 ETag 값 (행은 한 번 쓰이면 바뀌지 않으므로 행 식별자 + 생성 시각으로 충분)."""
+    return hashlib.sha256(f"legacy|{row}|{created_at.isoformat() if created_at else ''}".encode()).hexdigest()
+
+
+def parse_range(header: Optional[str], size: int) -> Union[None, str, Tuple[int, int]]:
+    """
+    'bytes=a-b' | 'bytes=a-' | 'bytes=-n' → (start, end) (end 포함).
+    해석 불가/다중 구간이면 None (전체 응답), 범위 밖이면 'unsatisfiable'.
+    """
+    if not header or not header.strip().lower().startswith("bytes="):
+        return None
+    spec = header.strip()[6:].strip()
+    if "," in spec:
+        return None
+    first, sep, last = spec.partition("-")
+    if not sep:
+        return None
+    try:
+        if first.strip() == "":
+            n = int(last)
+            if n <= 0:
+                return _UNSATISFIABLE
+            return max(0, size - n), size - 1
+        start = int(first)
+        end = int(last) if last.strip() else None
+    except ValueError:
+        return None
+    if start < 0 or (end is not None and end < start):
+        return None
+    if start >= size:
+        return _UNSATISFIABLE
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+def image_response(
+    request: Request,
+    *,
+    key: Optional[str],
+    mime: str,
+    last_modified: Optional[datetime] = None,
+    load_blob: Optional[Callable[[], Optional[bytes]]] = None,
+    size: str = "original",
+    legacy_etag: Optional[str] = None,
+) -> Optional[Response]:
+    """
+    저장소 키가 있으면 파일을 (구간) 스트리밍. 키가 없는 이관 전 행만 load_blob() 으로 DB 원본을 읽는다.
+    legacy_etag(legacy_validator) 를 주면 이관 전 행도 304 판단까지 원본을 읽지 않는다
+    (없으면 원본을 읽어 내용 해시로 ETag).
+    원본이 없으면 None (호출 측에서 404).
+    """
+    store = get_blob_store()
+    blob: Optional[bytes] = None
+    length = 0
+    if key:
+        try:
+            length = store.size(key)
+        except BlobNotFound:
+            return None
+        validator = key
+    elif legacy_etag:
+        validator = legacy_etag
+    else:
+        blob = load_blob() if load_blob else None
+        if not blob:
+            return None
+        length, validator = len(blob), blob_key(blob)
+
+    def _source() -> Optional[bytes]:
+        """이관 전 행의 DB 원본 (304 가 아닐 때 한 번만 읽음)."""
+        nonlocal blob, length
+        if blob is None and not key:
+            blob = load_blob() if load_blob else None
+            length = len(blob) if blob else 0
+        return blob
+
+    headers = {"Cache-Control": CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+
+    if size != "original":
+        fmt = negotiate_format(request.headers.get("accept", ""))
+        headers["Vary"] = "Accept"
+        # 축소본 ETag 는 원본 검증자에서 결정되므로 생성 전에도 알 수 있다 → 재방문은 생성 없이 304
+        thumb_etag = f'"{derivative_key(validator, size, fmt)}"'
+        if _not_modified(request, thumb_etag, last_modified):
+            return Response(status_code=304, headers={"ETag": thumb_etag, **headers})
+        if not key and not _source():
+            return None
+        source = blob
+        try:
+            # 축소본 저장 키는 원본 내용 해시 기준 (저장소 키가 있는 행은 검증자와 같다)
+            derived = ensure_derivative(store, key or blob_key(blob), size, fmt,
+                                        lambda: source if source is not None else store.read(key))
+        except ValueError:
+            # 디코딩할 수 없는 원본 → 축소 없이 원본 그대로
+            headers.pop("Vary")
+        else:
+            key, blob, mime = derived, None, derivative_mime(fmt)
+            length = store.size(key)
+            validator = thumb_etag.strip('"')
+
+    etag = f'"{validator}"'
+    headers["ETag"] = etag
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    if not key and not _source():
+        return None
+
+    rng = parse_range(request.headers.get("range"), length) if _if_range_ok(request, etag, last_modified) else None
+    if rng == _UNSATISFIABLE:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{length}"})
+    if rng:
+        start, end = rng
+        status = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{length}"
+    else:
+        start, end, status = 0, length - 1, 200
+    headers["Content-Length"] = str(end - start + 1)
+
+    if blob is not None:
+        return Response(content=blob[start:end + 1], status_code=status, media_type=mime, headers=headers)
+    return StreamingResponse(store.stream(key, start, end), status_code=status, media_type=mime, headers=headers)
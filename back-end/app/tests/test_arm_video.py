@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.features import arm_video as av
+from app.services.features.arm_features import FEATURE_COLS, features_from_hand_landmarks
+
+PUBLIC = Path(__file__).resolve().parents[3] / "front-end" / "public"
+
+
+def _tracks(n=21, fps=10.0, rate=10.0):
+    times = np.arange(n) / fps
+    base = np.stack([np.arange(21) * 3.0, 100.0 + np.arange(21)], axis=1)
+    left = base[None] + np.stack([np.zeros(n), rate * times], axis=1)[:, None, :]  # 손 전체가 rate px/s 로 하강
+    left[5] = np.nan  # 한 프레임 추적 실패
+    right = np.full((n, 21, 2), np.nan)
+    return times, {"Left": left, "Right": right}
+
+
+def test_drift_features_from_tracks():
+    times, tracks = _tracks()
+    feats, drift = av.drift_features(times, tracks, edge_seconds=0.2)
+
+    assert list(feats) == FEATURE_COLS
+    assert drift["left_tip_drop_rate"] == pytest.approx(10.0)
+    assert drift["left_max_drop"] == pytest.approx(10.0 * 2.0 - 1.0)  # 시작 자세 = 0~0.2초 중앙값(0.1초)
+    assert drift["left_coverage"] == pytest.approx(20 / 21)
+    assert drift["right_coverage"] == 0.0 and drift["right_tip_drop_rate"] == 0.0
+    assert drift["frames"] == 21 and drift["duration_s"] == pytest.approx(2.0)
+
+    start = np.median(tracks["Left"][:3], axis=0)
+    end = np.median(tracks["Left"][-3:], axis=0)
+    assert feats == features_from_hand_landmarks({"Left": start, "Right": None}, {"Left": end, "Right": None})
+    assert feats["left_y0"] == pytest.approx(18.0)
+    assert feats["right_y0"] == 0.0
+
+
+def _write_video(path, seconds=2.0, fps=30, size=(160, 120)):
+    vw = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    if not vw.isOpened():
+        pytest.skip("OpenCV 동영상 인코더 없음")
+    for i in range(int(seconds * fps)):
+        vw.write(np.full((size[1], size[0], 3), i % 255, dtype=np.uint8))
+    vw.release()
+
+
+def test_video_frames_are_sampled_and_shrunk(tmp_path):
+    path = tmp_path / "clip.avi"
+    _write_video(path)
+
+    frames = list(av.iter_video_frames(str(path), sample_fps=10, max_seconds=15, max_side=80))
+    assert len(frames) == 20
+    assert [round(t, 2) for t, *_ in frames[:3]] == [0.0, 0.1, 0.2]
+    t, rgb, w, h = frames[0]
+    assert rgb.shape == (60, 80, 3) and (w, h) == (160, 120)
+
+    with pytest.raises(ValueError, match="최대"):
+        list(av.iter_video_frames(str(path), sample_fps=10, max_seconds=1.0, max_side=80))
+
+    data = path.read_bytes()
+    assert len(list(av.iter_video_bytes(data, suffix=".avi", sample_fps=5, max_seconds=15, max_side=80))) == 10
+
+
+def test_tracking_frame_sequence():
+    img = (PUBLIC / "armtest.png").read_bytes()
+    times, tracks, (first, last) = av.track_hands(
+        av.iter_image_frames([img] * 4, fps=10, max_side=640), keep_edges=True,
+    )
+    assert times.tolist() == pytest.approx([0.0, 0.1, 0.2, 0.3])
+    assert not np.isnan(tracks["Left"][:, 0, 0]).any()
+    # 같은 프레임 반복 → drift 없음
+    _, drift = av.drift_features(times, tracks, edge_seconds=0.1)
+    assert abs(drift["left_max_drop"]) < 3.0
+    assert first.shape == last.shape
+
+
+def test_invalid_frame_raises():
+    with pytest.raises(ValueError, match="디코딩"):
+        list(av.iter_image_frames([b"nope"], fps=10, max_side=640))
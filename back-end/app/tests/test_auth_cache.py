@@ -0,0 +1,92 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.core.ttl_cache import MISS, TTLCache
+from app.crud import user as crud_user
+
+
+def _request(token):
+    return SimpleNamespace(cookies={"access_token": token})
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    security.token_cache.clear()
+    calls = []
+    real = security.jwt.decode
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting)
+    yield calls
+    security.token_cache.clear()
+
+
+def test_verified_token_is_decoded_once(decodes):
+    token = security.create_access_token("user01")
+    for _ in range(3):
+        assert security.get_user_id_from_cookie(_request(token)) == "user01"
+    assert security.verify_token(token) == "user01"
+    assert len(decodes) == 1
+
+    # 실패한 검증은 저장하지 않는다
+    for _ in range(2):
+        with pytest.raises(HTTPException) as e:
+            security.get_user_id_from_cookie(_request(token + "x"))
+        assert e.value.detail == "Invalid/expired token"
+    assert len(decodes) == 3
+
+
+def test_cached_token_never_outlives_jwt_exp(decodes):
+    token = jwt.encode({"sub": "u", "exp": int(time.time()) + 2}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    assert security.get_user_id_from_cookie(_request(token)) == "u"
+    [(deadline, _)] = security.token_cache._data.values()
+    assert deadline - time.monotonic() <= 2 < settings.AUTH_TOKEN_CACHE_TTL
+
+
+def test_ttl_cache_bounds():
+    c = TTLCache(max_entries=2, ttl=60)
+    c.put("a", 1)
+    c.put("b", 2)
+    assert c.get("a") == 1
+    c.put("c", 3)  # 가장 오래 안 쓴 b 가 밀려남
+    assert c.get("b") is MISS and c.get("c") == 3
+    c.put("d", 4, ttl=0)  # 이미 만료된 값은 넣지 않음
+    assert c.get("d") is MISS
+    assert c.stats()["entries"] == 2
+
+
+def test_profile_cache_invalidated_on_write():
+    class FakeDB:
+        def __init__(self):
+            self.rows = {"user01": SimpleNamespace(id="user01", name="홍길동")}
+            self.gets = 0
+
+        async def get(self, model, key):
+            self.gets += 1
+            return self.rows.get(key)
+
+    db = FakeDB()
+
+    async def run():
+        crud_user.invalidate_user_profile("user01")
+        assert await crud_user.get_user_name_async(db, "user01") == "홍길동"
+        assert await crud_user.get_user_name_async(db, "user01") == "홍길동"
+        assert await crud_user.get_user_name_async(db, "ghost") is None
+        assert db.gets == 2
+
+        db.rows["user01"].name = "김철수"
+        crud_user.invalidate_user_profile("user01")
+        assert await crud_user.get_user_name_async(db, "user01") == "김철수"
+        assert db.gets == 3
+
+    asyncio.run(run())
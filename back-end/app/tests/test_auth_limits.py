@@ -0,0 +1,139 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.session import get_async_db
+from app.models.user import User
+from app.services import password_hasher as ph
+from app.services import rate_limit
+from app.services.rate_limit import RateLimiter
+
+# bcrypt 대신 가벼운 스킴으로 풀/엔드포인트 동작만 확인
+FAST_CTX = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__rounds=1000)
+SIGNUP = {"id": "user01", "email": "u1@example.com", "password": "secret12",
+          "name": "홍길동", "birth_date": "1990-01-01", "privacy_agreed": True}
+
+
+def test_rate_limiter_refills_per_key():
+    lim = RateLimiter(limit=2, window=60)
+    assert lim.hit("a") == 0 and lim.hit("a") == 0
+    assert lim.hit("a") == pytest.approx(30, abs=0.5)
+    assert lim.hit("b") == 0
+    assert RateLimiter(limit=0, window=60).hit("a") == 0
+
+    peek = RateLimiter(limit=1, window=60)
+    assert peek.retry_after("a") == 0 and peek.retry_after("a") == 0  # 확인만으로는 차감되지 않음
+    peek.hit("a")
+    assert peek.retry_after("a") > 0
+
+    small = RateLimiter(limit=1, window=60, max_keys=2)
+    for k in ("a", "b", "c"):
+        small.hit(k)
+    assert small.hit("a") == 0  # 가장 오래된 키는 밀려나 새 버킷
+
+
+def test_hasher_pool_is_bounded():
+    assert ph.pwd_ctx.to_dict()["bcrypt__rounds"] == settings.PASSWORD_BCRYPT_ROUNDS
+    hasher = ph.PasswordHasher(FAST_CTX, workers=1, queue_size=1)
+    gate = threading.Event()
+
+    async def run():
+        h = await hasher.hash("secret12")
+        assert await hasher.verify("secret12", h) and not await hasher.verify("nope", h)
+
+        blocked = [asyncio.ensure_future(hasher._run("hash", gate.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(ph.PasswordHasherSaturated):
+            await hasher.hash("secret12")
+        gate.set()
+        await asyncio.gather(*blocked)
+
+    try:
+        asyncio.run(run())
+    finally:
+        gate.set()
+        hasher.shutdown()
+    assert hasher.inflight == 0
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    from app.main import create_app
+
+    url = tmp_path / "auth.db"
+    User.__table__.create(create_engine(f"sqlite:///{url}"))
+    engine = create_async_engine(f"sqlite+aiosqlite:///{url}", poolclass=NullPool)
+    selects = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: selects.append(stmt) if stmt.lstrip().upper().startswith("SELECT") else None)
+
+    async def db():
+        async with AsyncSession(engine, expire_on_commit=False) as s:
+            yield s
+
+    monkeypatch.setattr(ph.password_hasher, "ctx", FAST_CTX)
+    monkeypatch.setattr(rate_limit.auth_ip_limiter, "limit", 0)
+    monkeypatch.setattr(rate_limit.auth_id_limiter, "limit", 0)
+    app = create_app()
+    app.dependency_overrides[get_async_db] = db
+    c = TestClient(app)  # startup(예열) 없이
+    c.selects = selects
+    return c
+
+
+def test_signup_uses_one_uniqueness_query(client):
+    assert client.post("/api/v1/auth/signup", json=SIGNUP).status_code == 201
+
+    client.selects.clear()
+    res = client.post("/api/v1/auth/signup", json={**SIGNUP, "email": "other@example.com"})
+    assert res.status_code == 400 and "아이디" in res.json()["detail"]
+    res = client.post("/api/v1/auth/signup", json={**SIGNUP, "id": "user02"})
+    assert res.status_code == 400 and "이메일" in res.json()["detail"]
+    assert len(client.selects) == 2
+
+    assert client.post("/api/v1/auth/login", json={"id": "user01", "password": "secret12"}).status_code == 200
+    assert client.post("/api/v1/auth/login", json={"id": "user01", "password": "wrong"}).status_code == 401
+
+
+def test_client_ip_only_trusts_configured_proxies(monkeypatch):
+    from types import SimpleNamespace
+
+    def req(peer, xff=None):
+        return SimpleNamespace(client=SimpleNamespace(host=peer), headers={"X-Forwarded-For": xff} if xff else {})
+
+    assert rate_limit.client_ip(req("127.0.0.1", "203.0.113.7")) == "127.0.0.1"  # 설정 없으면 헤더 무시
+    monkeypatch.setattr(settings, "AUTH_TRUSTED_PROXIES", "127.0.0.1, 10.0.0.0/8")
+    assert rate_limit.client_ip(req("127.0.0.1", "203.0.113.7")) == "203.0.113.7"
+    # 클라이언트가 앞에 끼워 넣은 값은 무시, 신뢰 프록시 체인 바로 앞 주소
+    assert rate_limit.client_ip(req("10.1.2.3", "6.6.6.6, 198.51.100.4, 10.0.0.9")) == "198.51.100.4"
+    assert rate_limit.client_ip(req("198.51.100.4", "203.0.113.7")) == "198.51.100.4"  # 신뢰하지 않는 연결
+
+
+def test_successful_logins_are_not_charged(client, monkeypatch):
+    from app.api.v1.endpoints import auth
+
+    monkeypatch.setattr(auth, "auth_ip_limiter", RateLimiter(limit=2, window=60))
+    monkeypatch.setattr(auth, "auth_id_limiter", RateLimiter(limit=2, window=60))
+    assert client.post("/api/v1/auth/signup", json=SIGNUP).status_code == 201
+    for i in range(2, 6):  # 같은 IP 에서 가입/로그인이 몰려도 성공은 한도를 쓰지 않는다
+        assert client.post("/api/v1/auth/signup", json={**SIGNUP, "id": f"user0{i}", "email": f"u{i}@example.com"}).status_code == 201
+        assert client.post("/api/v1/auth/login", json={"id": "user01", "password": "secret12"}).status_code == 200
+
+
+def test_login_rate_limited_per_id(client, monkeypatch):
+    from app.api.v1.endpoints import auth
+
+    monkeypatch.setattr(auth, "auth_id_limiter", RateLimiter(limit=2, window=60))
+    for _ in range(2):
+        assert client.post("/api/v1/auth/login", json={"id": "ghost", "password": "x"}).status_code == 401
+    res = client.post("/api/v1/auth/login", json={"id": "ghost", "password": "x"})
+    assert res.status_code == 429 and int(res.headers["Retry-After"]) >= 1
+    # 다른 아이디는 영향 없음
+    assert client.post("/api/v1/auth/login", json={"id": "other", "password": "x"}).status_code == 401
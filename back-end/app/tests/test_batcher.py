@@ -0,0 +1,46 @@
+import threading
+import time
+
+import numpy as np
+
+from app.services.inference.batcher import MicroBatcher
+
+
+def test_concurrent_rows_share_one_forward_pass():
+    calls = []
+
+    def predict(ctx, X):
+        calls.append(X.shape[0])
+        if len(calls) == 1:
+            time.sleep(0.05)  # 첫 배치를 처리하는 동안 나머지가 쌓이도록
+        return X[:, 0] * 2
+
+    batcher = MicroBatcher("t", predict, max_batch=8, max_wait_ms=200)
+    results = {}
+
+    def worker(i):
+        results[i] = batcher.submit(np.array([float(i), 0.0]))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {i: 2.0 * i for i in range(8)}
+    assert sum(calls) == 8
+    assert len(calls) < 8
+
+
+def test_lone_row_does_not_wait_for_peers():
+    batcher = MicroBatcher("t", lambda ctx, X: X.sum(axis=1), max_batch=8, max_wait_ms=1000)
+    t0 = time.perf_counter()
+    for _ in range(3):
+        assert batcher.submit(np.array([1.0, 2.0])) == 3.0
+    assert time.perf_counter() - t0 < 0.5
+
+
+def test_batching_disabled_runs_inline():
+    batcher = MicroBatcher("t", lambda ctx, X: X.sum(axis=1), max_batch=1, max_wait_ms=0)
+    assert batcher.submit(np.array([1.0, 2.0])) == 3.0
+    assert batcher._thread is None
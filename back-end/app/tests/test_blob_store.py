@@ -0,0 +1,47 @@
+import hashlib
+
+import pytest
+
+from app.services.storage.blob_store import BlobNotFound, BlobStore, LocalBlobStore
+
+
+def test_put_is_content_addressed_and_deduplicated(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    data = b"\x89PNG" + bytes(range(256)) * 1000
+    key = store.put(data)
+
+    assert key == hashlib.sha256(data).hexdigest()
+    assert store.path(key) == tmp_path / key[:2] / key[2:4] / key
+    assert store.put(data) == key
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+    assert store.size(key) == len(data)
+    assert store.read(key) == data
+
+
+def test_stream_ranges(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    data = bytes(range(256)) * 10
+    key = store.put(data)
+
+    assert b"".join(store.stream(key, chunk_size=100)) == data
+    assert b"".join(store.stream(key, start=10, end=509, chunk_size=64)) == data[10:510]
+
+
+def test_missing_or_malformed_key(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    with pytest.raises(BlobNotFound):
+        store.open("0" * 64)
+    with pytest.raises(BlobNotFound):
+        store.size("../../etc/passwd")
+    assert not store.exists("not-a-key")
+
+
+def test_incomplete_backend_cannot_be_created():
+    class PutOnly(BlobStore):
+        def put(self, data, key=None):
+            return key
+
+    with pytest.raises(TypeError):
+        BlobStore()
+    with pytest.raises(TypeError):  # 빠진 메서드는 호출 시점이 아니라 생성 시점에 드러난다
+        PutOnly()
@@ -0,0 +1,41 @@
+import pytest
+
+from app.services.features.detector_pool import DetectorPool
+
+
+class _FakeDetector:
+    closed = 0
+
+    def close(self):
+        _FakeDetector.closed += 1
+
+
+def test_reuses_instances_and_bounds_size():
+    created = []
+    pool = DetectorPool("fake", lambda: created.append(_FakeDetector()) or created[-1], max_size=1, acquire_timeout=0.01)
+
+    with pool.acquire() as a:
+        with pytest.raises(TimeoutError):
+            with pool.acquire():
+                pass
+    with pool.acquire() as b:
+        assert b is a
+    assert len(created) == 1
+
+
+def test_discards_instance_after_error_and_closes_on_shutdown():
+    _FakeDetector.closed = 0
+    pool = DetectorPool("fake", _FakeDetector, max_size=2, acquire_timeout=0.01)
+
+    with pytest.raises(ValueError):
+        with pool.acquire() as bad:
+            raise ValueError("boom")
+    assert _FakeDetector.closed == 1
+
+    with pool.acquire() as good:
+        assert good is not bad
+    pool.shutdown()
+    assert _FakeDetector.closed == 2
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            pass
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services import jobs
+from app.services.executor import ExecutorSaturated, MeasureExecutor
+
+
+@pytest.mark.asyncio
+async def test_fails_fast_when_saturated(monkeypatch):
+    gate = threading.Event()
+    monkeypatch.setitem(jobs.JOBS, "slow", lambda data: gate.wait(5) and len(data))
+
+    ex = MeasureExecutor(mode="thread", workers=1, queue_size=1)
+    try:
+        first = asyncio.ensure_future(ex.run("slow", b"abc"))
+        second = asyncio.ensure_future(ex.run("slow", b"de"))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturated):
+            await ex.run("slow", b"f")
+
+        gate.set()
+        assert await first == 3
+        assert await second == 2
+        await asyncio.sleep(0.05)
+        assert ex.inflight == 0
+    finally:
+        ex.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["inline", "thread"])
+async def test_job_params_are_forwarded(monkeypatch, mode):
+    monkeypatch.setitem(jobs.JOBS, "echo", lambda *payloads, scale=1: [len(p) * scale for p in payloads])
+
+    ex = MeasureExecutor(mode=mode, workers=1, queue_size=0)
+    try:
+        assert await ex.run("echo", b"ab", b"c", scale=3) == [6, 3]
+        assert await ex.run("echo", b"ab") == [2]
+    finally:
+        ex.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_map_keeps_slots_until_workers_finish(monkeypatch):
+    gate = threading.Event()
+    monkeypatch.setitem(jobs.JOBS, "slow", lambda data: gate.wait(5) and len(data))
+
+    ex = MeasureExecutor(mode="thread", workers=2, queue_size=0)
+    try:
+        batch = asyncio.ensure_future(ex.map("slow", [(b"a",), (b"bb",), (b"ccc",)]))
+        await asyncio.sleep(0.05)
+        batch.cancel()  # 클라이언트 연결 끊김
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        # 워커에서 아직 도는 2개가 슬롯을 계속 차지 → 새 작업은 즉시 거절
+        assert ex.inflight == 2
+        with pytest.raises(ExecutorSaturated):
+            await ex.run("slow", b"d")
+
+        gate.set()
+        await asyncio.sleep(0.1)
+        assert ex.inflight == 0
+        assert await ex.map("slow", [(b"a",), (b"bb",), (b"ccc",)]) == [1, 2, 3]
+        assert ex.inflight == 0
+    finally:
+        gate.set()
+        ex.shutdown()
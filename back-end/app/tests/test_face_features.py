@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from app.services.features.face_features import (
+    LM,
+    center_point_idx,
+    feature_vector_from_landmarks,
+    features_to_dict,
+    landmark_pairs,
+)
+
+
+# ── 기준 구현: 벡터화 이전의 쌍별 루프 계산 (dataset.py 와 동일) ──
+def _euclid(p1, p2):
+    return float(np.linalg.norm(np.array(p1) - np.array(p2)))
+
+
+def _calculate_ai(dR, dL):
+    denom = dR + dL
+    return 0.0 if denom == 0 else abs(dR - dL) / denom
+
+
+def _angle(p1, p2):
+    dx, dy = (p2[0] - p1[0]), (p2[1] - p1[1])
+    if dx == 0:
+        return 90.0
+    return round(np.degrees(np.arctan2(dy, dx)), 2)
+
+
+def reference_features(xy):
+    def get_xy(idx):
+        return (float(xy[idx][0]), float(xy[idx][1]))
+
+    cx, cy = get_xy(center_point_idx)
+    features = {}
+    for (l_idx, r_idx) in landmark_pairs:
+        lx, ly = get_xy(l_idx)
+        rx, ry = get_xy(r_idx)
+        dR_x, dL_x = abs(rx - cx), abs(lx - cx)
+        dR_y, dL_y = abs(ry - cy), abs(ly - cy)
+        features[f"AI_x_{l_idx}_{r_idx}"] = round(_calculate_ai(dR_x, dL_x), 3)
+        features[f"AI_y_{l_idx}_{r_idx}"] = round(_calculate_ai(dR_y, dL_y), 3)
+        features[f"angle_{l_idx}_{r_idx}"] = _angle((lx, ly), (rx, ry))
+
+    lip_l, lip_r = get_xy(LM["lip_l"]), get_xy(LM["lip_r"])
+    eye_l, eye_r = get_xy(LM["eye_l"]), get_xy(LM["eye_r"])
+    nose, chin = get_xy(LM["nose"]), get_xy(LM["chin"])
+    lip_u, lip_d = get_xy(LM["lip_u"]), get_xy(LM["lip_d"])
+    eye_center = ((eye_l[0] + eye_r[0]) / 2.0, (eye_l[1] + eye_r[1]) / 2.0)
+    lip_center = ((lip_l[0] + lip_r[0]) / 2.0, (lip_l[1] + lip_r[1]) / 2.0)
+    mouth_width = _euclid(lip_l, lip_r)
+    face_width = _euclid(eye_l, eye_r)
+    eye_nose = _euclid(eye_center, nose)
+    lip_nose = _euclid(lip_center, nose)
+    eye_lip = _euclid(eye_center, lip_center)
+    face_height = _euclid(nose, chin)
+
+    features["lip_slope"] = _angle(lip_l, lip_r)
+    features["lip_down_angle_left"] = _angle(lip_l, chin)
+    features["lip_down_angle_right"] = _angle(lip_r, chin)
+    features["ratio_mouth_face"] = mouth_width / face_width if face_width else 0.0
+    features["ratio_lip_nose_eye_nose"] = lip_nose / eye_nose if eye_nose else 0.0
+    features["ratio_eye_lip_face_height"] = eye_lip / face_height if face_height else 0.0
+    features["angle_diff_lip_eye"] = abs(_angle(lip_l, lip_r) - _angle(eye_l, eye_r))
+    features["ratio_lip_corner_height"] = abs(lip_l[1] - lip_r[1]) / face_height if face_height else 0.0
+    features["angle_diff_eye_lip"] = abs(_angle(eye_l, lip_l) - _angle(eye_r, lip_r))
+    dist_l = _euclid(lip_center, lip_l)
+    dist_r = _euclid(lip_center, lip_r)
+    features["ratio_lip_center_symmetry"] = (abs(dist_l - dist_r) / mouth_width) if mouth_width else 0.0
+    features["ratio_mouth_opening"] = abs(lip_u[1] - lip_d[1]) / face_height if face_height else 0.0
+    return features
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_vectorized_matches_reference_exactly(seed):
+    rng = np.random.default_rng(seed)
+    xy = rng.random((478, 2)) * rng.integers(200, 4000, size=2)
+    assert features_to_dict(feature_vector_from_landmarks(xy)) == reference_features(xy)
+
+
+def test_degenerate_landmarks():
+    xy = np.full((478, 2), 100.0)
+    xy[291, 1] = 120.0  # dx == 0 인 쌍
+    got = features_to_dict(feature_vector_from_landmarks(xy))
+    assert got == reference_features(xy)
+    assert list(got) == list(reference_features(xy))
+
+
+def test_vector_row_matches_dict_row():
+    from app.services.features.face_features import FEATURE_NAMES
+    from app.services.inference.tabnet_runner import feature_row, vector_row
+
+    xy = np.random.default_rng(7).random((478, 2)) * 640
+    vec = feature_vector_from_landmarks(xy)
+    row = vector_row("face", vec, FEATURE_NAMES)
+    assert row.dtype == np.float32
+    np.testing.assert_array_equal(row, feature_row("face", features_to_dict(vec)))
+
+
+def test_affine_scaler_matches_sklearn():
+    from sklearn.preprocessing import MinMaxScaler, StandardScaler
+    from app.services.inference.tabnet_runner import AffineScaler, _compile_scaler
+
+    rng = np.random.default_rng(3)
+    X = (rng.random((100, 59)) * 50 - 10).astype(np.float32)
+    for sk in (StandardScaler().fit(X), MinMaxScaler().fit(X)):
+        compiled = _compile_scaler(sk)
+        assert isinstance(compiled, AffineScaler)
+        np.testing.assert_allclose(compiled.transform(X), sk.transform(X), rtol=1e-5, atol=1e-6)
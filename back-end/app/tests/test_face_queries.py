@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.crud.arm import get_arm_image, get_arm_image_blob
+from app.crud.face import get_face_image_blob, get_face_image_meta, get_latest_face_by_user, list_faces_by_user
+
+# 모델의 MySQL 전용 타입/기본값은 SQLite 에서 만들 수 없으므로 같은 컬럼으로 직접 생성
+DDL = [
+    "CREATE TABLE face (face_id INTEGER PRIMARY KEY, user_id TEXT, image_key TEXT, image_blob BLOB,"
+    " image_mime TEXT, image_size INT, result_text TEXT, landmarks_json TEXT, created_at TEXT, updated_at TEXT,"
+    " feature_schema TEXT, features_bin BLOB, landmarks_bin BLOB)",
+    "CREATE TABLE arm (arm_id INTEGER PRIMARY KEY, user_id TEXT, start_image_key TEXT, start_image_blob BLOB,"
+    " start_image_mime TEXT, start_image_size INT, end_image_key TEXT, end_image_blob BLOB, end_image_mime TEXT,"
+    " end_image_size INT, label TEXT, confidence REAL, features_json TEXT, created_at TEXT, updated_at TEXT,"
+    " feature_schema TEXT, features_bin BLOB, landmarks_bin BLOB)",
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with Session(engine) as s:
+        for ddl in DDL:
+            s.execute(text(ddl))
+        for i, ts in enumerate(["2024-01-01 00:00:00", "2024-03-01 00:00:00", "2024-02-01 00:00:00"], start=1):
+            s.execute(
+                text("INSERT INTO face VALUES (:i, 'u1', NULL, :b, 'image/png', 3, '정상', '{}', :ts, :ts, NULL, NULL, NULL)"),
+                {"i": i, "b": b"img", "ts": ts},
+            )
+        s.execute(text("INSERT INTO arm VALUES (1, 'u1', 'k1', NULL, 'image/png', 1, NULL, :b, 'image/jpeg', 3, '0', 0.1, '{}', '2024-01-01', '2024-01-01', NULL, NULL, NULL)"), {"b": b"end"})
+        s.commit()
+        statements.clear()
+        s.statements = statements
+        yield s
+
+
+def test_latest_and_list_skip_blob_columns(db):
+    latest = get_latest_face_by_user(db, "u1")
+    assert latest.face_id == 2
+    assert [f.face_id for f in list_faces_by_user(db, "u1", limit=2)] == [2, 3]
+    assert all("image_blob" not in sql and "landmarks_json" not in sql for sql in db.statements)
+
+
+def test_image_metadata_skips_blobs(db):
+    row = get_face_image_meta(db, 1)
+    assert (row.user_id, row.image_key, row.image_mime) == ("u1", None, "image/png")
+    assert tuple(get_arm_image(db, 1, "start"))[:2] == ("k1", "image/png")
+    assert all("blob" not in sql for sql in db.statements)
+
+
+def test_legacy_blob_reads_single_column(db):
+    assert get_face_image_blob(db, 1) == b"img"
+    assert get_arm_image_blob(db, 1, "end") == b"end"
+    assert "start_image_blob" not in db.statements[-1]
+    assert get_arm_image_blob(db, 1, "start") is None
+
+
+@pytest.mark.asyncio
+async def test_async_create_and_latest(tmp_path, monkeypatch):
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.crud import face as crud_face
+    from app.services.storage.blob_store import LocalBlobStore
+
+    store = LocalBlobStore(str(tmp_path))
+    monkeypatch.setattr(crud_face, "get_blob_store", lambda: store)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        await db.execute(text(DDL[0].replace("created_at TEXT", "created_at TEXT DEFAULT CURRENT_TIMESTAMP")))
+        rec = await crud_face.create_face_async(
+            db, user_id="u1", image_bytes=b"img", image_mime="image/png", image_size=3, result_text="정상",
+        )
+        assert store.read(rec.image_key) == b"img"
+        latest = await crud_face.get_latest_face_by_user_async(db, "u1")
+        assert latest.face_id == rec.face_id and latest.created_at is not None
+    await engine.dispose()
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.services import face_stream as fs
+from app.services.features.face_features import LM
+
+PUBLIC = Path(__file__).resolve().parents[3] / "front-end" / "public"
+URL = "/api/v1/measure/face/stream"
+
+
+@pytest.mark.asyncio
+async def test_frame_slot_keeps_only_latest():
+    slot = fs.FrameSlot()
+    for seq in (1, 2, 3):
+        slot.put(seq, b"x")
+    seq, _, _ = await slot.get(timeout=1.0)
+    assert seq == 3 and slot.dropped == 2
+
+    slot.put(4, b"y")
+    assert slot.take_newer((3, b"x", 0.0))[0] == 4 and slot.dropped == 3
+    slot.close()
+    assert await slot.get(timeout=1.0) is None
+
+
+def _face(nose_dx=0.0, roll_dy=0.0):
+    xy = np.zeros((478, 2))
+    xy[LM["eye_l"]] = (100.0, 100.0)
+    xy[LM["eye_r"]] = (200.0, 100.0 + roll_dy)
+    xy[LM["nose"]] = (150.0 + nose_dx, 150.0)
+    return xy
+
+
+def test_guidance():
+    still = _face()
+    assert fs.guidance(still, None) == "ok"
+    assert fs.guidance(still, still) == "ok"
+    assert fs.guidance(_face(nose_dx=40.0), None) == "face_camera"
+    assert fs.guidance(_face(roll_dy=30.0), None) == "face_camera"
+    assert fs.guidance(still, still + 10.0) == "hold_still"
+
+
+def _jpeg(name):
+    ok, buf = cv2.imencode(".jpg", cv2.imread(str(PUBLIC / name)), [cv2.IMWRITE_JPEG_QUALITY, 80])
+    assert ok
+    return buf.tobytes()
+
+
+@pytest.fixture
+def client():
+    from app.main import create_app
+
+    return TestClient(create_app())
+
+
+def test_stream_returns_features_and_smoothed_probability(client, monkeypatch):
+    monkeypatch.setattr(fs.settings, "FACE_STREAM_MAX_FPS", 0.0)
+    frame = _jpeg("face.png")
+    with client.websocket_connect(URL) as ws:
+        ws.send_bytes(frame)
+        first = ws.receive_json()
+        ws.send_bytes(frame)
+        second = ws.receive_json()
+        ws.send_bytes(b"not an image")
+        bad = ws.receive_json()
+
+    assert first["type"] == "result" and first["face"] is True and first["seq"] == 1
+    assert len(first["features"]) == 59
+    assert first["smoothed_proba"] == pytest.approx(first["pred_proba"])
+    assert second["seq"] == 2 and second["guidance"] in ("ok", "hold_still", "face_camera")
+    assert 0.0 <= second["smoothed_proba"] <= 1.0
+    assert bad["face"] is False and bad["guidance"] == "bad_frame"
+    assert fs.sessions.active == 0
+
+
+def test_stream_rejects_oversize_frames(client, monkeypatch):
+    monkeypatch.setattr(fs.settings, "FACE_STREAM_MAX_FRAME_KB", 1)
+    with client.websocket_connect(URL) as ws:
+        ws.send_bytes(b"\0" * 2048)
+        msg = ws.receive_json()
+    assert msg["type"] == "error" and msg["seq"] == 1
+
+
+def test_stream_session_limit(client, monkeypatch):
+    monkeypatch.setattr(fs, "sessions", fs.SessionLimiter(0))
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(URL) as ws:
+            ws.receive_json()
+    assert exc.value.code == 1013
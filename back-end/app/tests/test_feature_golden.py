@@ -0,0 +1,30 @@
+from app.services.features.arm_features import FEATURE_COLS
+from app.services.features.face_features import FEATURE_NAMES
+from app.tools.bench_pipeline import check_landmark_parity, compare, load_golden
+
+
+def test_features_match_golden():
+    # 피처 계산을 바꿨다면: python -m app.tools.bench_pipeline --update-golden 후 diff 를 검토
+    golden = load_golden()
+    assert all(list(g["features"]) == list(FEATURE_NAMES) for g in golden["face"].values())
+    assert all(list(g["features"]) == FEATURE_COLS for g in golden["arm"].values())
+    result = check_landmark_parity(golden)
+    assert result["ok"], result["mismatches"]
+
+
+def test_golden_detects_feature_change():
+    golden = load_golden()
+    name = next(iter(golden["face"]))
+    xy = golden["landmarks"][f"face/{name}"].copy()
+    xy[61] += (3.0, 0.0)  # 입꼬리 하나만 이동 (전체 평행이동은 피처 불변)
+    golden["landmarks"][f"face/{name}"] = xy
+    assert check_landmark_parity(golden)["mismatches"] == [f"face/{name}"]
+
+
+def test_compare_flags_p50_regressions():
+    base = {"meta": {"commit": "abc"}, "stages": {"a": {"p50_ms": 1.0}, "b": {"p50_ms": 2.0}, "c": {"error": "x"}}}
+    cur = {"stages": {"a": {"p50_ms": 1.5}, "b": {"p50_ms": 2.1}, "c": {"p50_ms": 1.0}, "d": {"backend": "X"}}}
+    out = compare(cur, base, tolerance=0.2)
+    assert out["regressions"] == ["a"]
+    assert out["p50_ratio"] == {"a": 1.5, "b": 1.05}
+    assert out["baseline_commit"] == "abc"
@@ -0,0 +1,40 @@
+import io
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from app.services.features.image_ingest import ingest_image
+
+
+def _jpeg(w, h, orientation=1):
+    rgb = np.zeros((h, w, 3), np.uint8)
+    rgb[: h // 2, : w // 2] = (255, 0, 0)  # 왼쪽 위 빨강
+    im = Image.fromarray(rgb)
+    exif = im.getexif()
+    exif[0x0112] = orientation
+    buf = io.BytesIO()
+    im.save(buf, "JPEG", quality=95, exif=exif)
+    return buf.getvalue()
+
+
+def test_large_jpeg_is_reduced_but_keeps_original_size():
+    img = ingest_image(_jpeg(4032, 3024), max_side=1000)
+    assert (img.width, img.height) == (4032, 3024)
+    assert max(img.rgb.shape[:2]) == 1000
+    assert img.rgb.shape[2] == 3 and img.rgb.dtype == np.uint8
+    r, g, b = img.rgb[10, 10]
+    assert r > 200 and g < 50 and b < 50  # BGR 이 아닌 RGB
+
+
+def test_exif_rotation_swaps_original_dimensions():
+    img = ingest_image(_jpeg(4000, 3000, orientation=6), max_side=1000)
+    assert (img.width, img.height) == (3000, 4000)
+    assert img.rgb.shape[:2] == (1000, 750)
+
+
+def test_small_png_and_garbage():
+    ok, png = cv2.imencode(".png", np.zeros((120, 200, 3), np.uint8))
+    img = ingest_image(png.tobytes(), max_side=1000)
+    assert (img.width, img.height) == (200, 120) and img.rgb.shape[:2] == (120, 200)
+    assert ingest_image(b"not an image") is None
@@ -0,0 +1,168 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.services.storage import http
+from app.services.storage.blob_store import LocalBlobStore
+from app.services.storage.http import parse_range
+
+DATA = bytes(range(256)) * 40  # 10240 bytes
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    store = LocalBlobStore(str(tmp_path))
+    key = store.put(DATA)
+    monkeypatch.setattr(http, "get_blob_store", lambda: store)
+    loads = []
+
+    app = FastAPI()
+
+    @app.get("/stored")
+    def stored(request: Request):
+        return http.image_response(request, key=key, mime="image/png", load_blob=lambda: loads.append(1))
+
+    @app.get("/legacy")
+    def legacy(request: Request):
+        return http.image_response(request, key=None, mime="image/png", load_blob=lambda: loads.append(1) or DATA)
+
+    c = TestClient(app)
+    c.key, c.loads = key, loads
+    return c
+
+
+def test_etag_and_304_without_loading_blob(client):
+    r = client.get("/stored")
+    assert r.status_code == 200 and r.content == DATA
+    assert r.headers["etag"] == f'"{client.key}"'
+    assert "immutable" in r.headers["cache-control"] and "private" in r.headers["cache-control"]
+
+    r = client.get("/stored", headers={"If-None-Match": f'W/"x", "{client.key}"'})
+    assert r.status_code == 304 and r.content == b""
+    assert client.loads == []
+
+    # 이관 전 행도 같은 내용이면 같은 ETag
+    assert client.get("/legacy").headers["etag"] == f'"{client.key}"'
+
+
+def test_range_requests(client):
+    r = client.get("/stored", headers={"Range": "bytes=100-199"})
+    assert r.status_code == 206
+    assert r.content == DATA[100:200]
+    assert r.headers["content-range"] == f"bytes 100-199/{len(DATA)}"
+
+    r = client.get("/legacy", headers={"Range": "bytes=-10"})
+    assert r.status_code == 206 and r.content == DATA[-10:]
+
+    r = client.get("/stored", headers={"Range": "bytes=999999-"})
+    assert r.status_code == 416
+    assert r.headers["content-range"] == f"bytes */{len(DATA)}"
+
+    # If-Range 가 다르면 전체 응답
+    r = client.get("/stored", headers={"Range": "bytes=0-9", "If-Range": '"other"'})
+    assert r.status_code == 200 and r.content == DATA
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("bytes=0-0", (0, 0)),
+    ("bytes=5-", (5, 99)),
+    ("bytes=50-500", (50, 99)),
+    ("bytes=-200", (0, 99)),
+    ("bytes=0-1,5-6", None),
+    ("bytes=9-3", None),
+    ("items=0-1", None),
+    ("bytes=100-", "unsatisfiable"),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 100) == expected
+
+
+@pytest.fixture
+def thumb_client(tmp_path, monkeypatch):
+    import cv2
+    import numpy as np
+
+    img = np.zeros((900, 1200, 3), np.uint8)
+    img[:, :600] = (0, 0, 255)
+    png = cv2.imencode(".png", img)[1].tobytes()
+    store = LocalBlobStore(str(tmp_path))
+    key = store.put(png)
+    monkeypatch.setattr(http, "get_blob_store", lambda: store)
+
+    app = FastAPI()
+
+    @app.get("/img")
+    def img_endpoint(request: Request, size: str = "original"):
+        return http.image_response(request, key=key, mime="image/png", size=size)
+
+    c = TestClient(app)
+    c.key, c.store = key, store
+    return c
+
+
+def test_derivative_generated_once_and_cached(thumb_client, monkeypatch):
+    import cv2
+    import numpy as np
+    from app.services.storage import derivatives
+
+    calls = []
+    render = derivatives.render_derivative
+    monkeypatch.setattr(derivatives, "render_derivative", lambda *a: calls.append(a) or render(*a))
+
+    r = thumb_client.get("/img?size=small", headers={"Accept": "image/avif,image/webp,*/*"})
+    assert r.status_code == 200 and r.headers["content-type"] == "image/webp"
+    assert r.headers["vary"] == "Accept"
+    thumb = cv2.imdecode(np.frombuffer(r.content, np.uint8), cv2.IMREAD_COLOR)
+    assert max(thumb.shape[:2]) == 160
+
+    etag = r.headers["etag"]
+    assert etag != f'"{thumb_client.key}"'
+    assert thumb_client.get("/img?size=small", headers={"Accept": "image/webp"}).content == r.content
+    assert thumb_client.get("/img?size=small", headers={"Accept": "image/webp", "If-None-Match": etag}).status_code == 304
+    assert len(calls) == 1
+
+    # WebP 미지원 → JPEG 축소본 (별도 키)
+    r = thumb_client.get("/img?size=medium", headers={"Accept": "image/jpeg"})
+    assert r.headers["content-type"] == "image/jpeg" and r.headers["etag"] != etag
+    assert r.content[:2] == b"\xff\xd8"
+
+
+def test_derivative_falls_back_to_original_when_undecodable(tmp_path, monkeypatch):
+    store = LocalBlobStore(str(tmp_path))
+    monkeypatch.setattr(http, "get_blob_store", lambda: store)
+    app = FastAPI()
+
+    @app.get("/img")
+    def img_endpoint(request: Request):
+        return http.image_response(request, key=None, mime="image/png", load_blob=lambda: DATA, size="small")
+
+    r = TestClient(app).get("/img")
+    assert r.status_code == 200 and r.content == DATA and "vary" not in r.headers
+
+
+def test_legacy_row_revalidates_without_reading_blob(tmp_path, monkeypatch):
+    import cv2
+    import numpy as np
+    from datetime import datetime
+
+    png = cv2.imencode(".png", np.full((400, 600, 3), 200, np.uint8))[1].tobytes()
+    store = LocalBlobStore(str(tmp_path))
+    monkeypatch.setattr(http, "get_blob_store", lambda: store)
+    loads = []
+    validator = http.legacy_validator("face/7", datetime(2024, 1, 2, 3, 4, 5))
+    app = FastAPI()
+
+    @app.get("/img")
+    def img_endpoint(request: Request, size: str = "original"):
+        return http.image_response(request, key=None, mime="image/png", size=size,
+                                   load_blob=lambda: loads.append(1) or png, legacy_etag=validator)
+
+    c = TestClient(app)
+    for size in ("original", "small"):
+        r = c.get(f"/img?size={size}", headers={"Accept": "image/jpeg"})
+        assert r.status_code == 200
+        n = len(loads)
+        again = c.get(f"/img?size={size}", headers={"Accept": "image/jpeg", "If-None-Match": r.headers["etag"]})
+        assert again.status_code == 304 and len(loads) == n
+    assert validator != http.legacy_validator("face/8", datetime(2024, 1, 2, 3, 4, 5))
@@ -0,0 +1,74 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.services import metrics
+from app.services.executor import ExecutorSaturated, MeasureExecutor
+
+
+def test_histogram_render_is_cumulative():
+    h = metrics.Histogram("t_seconds", "test", ("stage",), buckets=(0.1, 1.0))
+    h.observe(0.05, "decode")
+    h.observe(0.5, "decode")
+    h.observe(5.0, "decode")
+
+    lines = h.render()
+    assert 't_seconds_bucket{stage="decode",le="0.1"} 1' in lines
+    assert 't_seconds_bucket{stage="decode",le="1"} 2' in lines
+    assert 't_seconds_bucket{stage="decode",le="+Inf"} 3' in lines
+    assert 't_seconds_count{stage="decode"} 3' in lines
+    assert 't_seconds_sum{stage="decode"} 5.55' in lines
+
+
+def test_drain_and_merge_move_worker_deltas():
+    worker, parent = metrics.Registry(), metrics.Registry()
+    for reg in (worker, parent):
+        reg.counter("c_total", "test", ("kind",))
+        reg.histogram("h_seconds", "test", ("stage",))
+    worker._metrics["c_total"].inc("fallback_classifier", amount=3)
+    with worker._metrics["h_seconds"].time("inference"):
+        pass
+
+    parent.merge(worker.drain())
+    parent.merge(worker.drain())  # 두 번째 drain 은 비어 있어 중복 합산 없음
+    assert parent._metrics["c_total"].value("fallback_classifier") == 3
+    assert parent._metrics["h_seconds"].count("inference") == 1
+    assert worker.drain() == {}
+
+
+def test_label_escaping():
+    c = metrics.Counter("e_total", "test", ("v",))
+    c.inc('a"b\\c')
+    assert c.render()[-1] == 'e_total{v="a\\"b\\\\c"} 1'
+
+
+def test_executor_rejections_and_job_latency():
+    ex = MeasureExecutor(mode="inline", workers=1, queue_size=0)
+    before = metrics.EXECUTOR_REJECTED.value()
+    ex._reserve(1)
+    try:
+        try:
+            asyncio.run(ex.run("warmup"))
+        except ExecutorSaturated:
+            pass
+    finally:
+        ex._release(1)
+    assert metrics.EXECUTOR_REJECTED.value() == before + 1
+
+
+def test_metrics_endpoint_labels_by_route_template():
+    from app.main import create_app
+
+    client = TestClient(create_app())
+    assert client.get("/health").status_code == 200
+    client.get("/no-such-path")
+    body = client.get("/metrics")
+
+    assert body.status_code == 200
+    assert body.headers["content-type"].startswith("text/plain")
+    text = body.text
+    assert '# TYPE http_request_duration_seconds histogram' in text
+    assert 'http_request_duration_seconds_count{route="/health",method="GET",status="200"}' in text
+    assert 'route="unmatched",method="GET",status="404"' in text
+    assert 'route="/metrics"' not in text
+    assert "measure_executor_capacity " in text
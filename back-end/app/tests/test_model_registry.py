@@ -0,0 +1,80 @@
+import os
+import threading
+
+from app.services.inference.model_registry import ModelRegistry
+
+
+def _make_registry(tmp_path, max_bytes=10_000):
+    calls = []
+
+    def loader(mdir):
+        calls.append(mdir)
+        with open(os.path.join(mdir, "model.bin"), "rb") as f:
+            return f.read()
+
+    reg = ModelRegistry(max_bytes=max_bytes, check_interval=0.0)
+    reg.register("face", loader, lambda m, v: str(tmp_path / m / v))
+    return reg, calls
+
+
+def _write(tmp_path, version, data):
+    d = tmp_path / "face" / version
+    d.mkdir(parents=True, exist_ok=True)
+    (d / "model.bin").write_bytes(data)
+
+
+def test_loads_once_across_threads(tmp_path):
+    _write(tmp_path, "v1", b"a" * 10)
+    reg, calls = _make_registry(tmp_path)
+
+    threads = [threading.Thread(target=reg.get, args=("face", "v1")) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert reg.get("face", "v1").artifacts == b"a" * 10
+
+
+def test_reloads_when_files_change(tmp_path):
+    _write(tmp_path, "v1", b"old")
+    reg, calls = _make_registry(tmp_path)
+    assert reg.get("face", "v1").artifacts == b"old"
+
+    _write(tmp_path, "v1", b"newer")
+    assert reg.get("face", "v1").artifacts == b"newer"
+    assert len(calls) == 2
+
+
+def test_lru_eviction_under_budget(tmp_path):
+    for v in ("v1", "v2", "v3"):
+        _write(tmp_path, v, b"x" * 40)
+    reg, _ = _make_registry(tmp_path, max_bytes=100)
+
+    reg.get("face", "v1")
+    reg.get("face", "v2")
+    reg.get("face", "v1")  # v1 을 최근 사용으로 갱신
+    reg.get("face", "v3")
+
+    resident = {e["version"] for e in reg.snapshot()}
+    assert resident == {"v1", "v3"}
+
+
+def test_arm_loader_caches_by_resolved_path(tmp_path, monkeypatch):
+    from app.core.config import settings
+    from app.services.inference import arm_xgb_runner as arm
+
+    (tmp_path / "arm" / "v1").mkdir(parents=True)
+    (tmp_path / "arm" / "v1" / arm.MODEL_FILENAME).write_bytes(b"x")
+    calls = []
+    monkeypatch.setattr(settings, "MODEL_DIR_BASE", str(tmp_path))
+    monkeypatch.setattr(settings, "ARM_MODEL_VERSION", "v1")
+    monkeypatch.setattr(arm, "load", lambda p: calls.append(p) or object())
+    arm._load_model_at.cache_clear()
+    try:
+        # 활성 버전을 생략하든 명시하든 같은 캐시 항목
+        assert arm._load_model() is arm._load_model(None) is arm._load_model("v1")
+        assert len(calls) == 1
+    finally:
+        arm._load_model_at.cache_clear()
@@ -0,0 +1,66 @@
+import json
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from app.services.inference import onnx_runner, tabnet_runner  # noqa: E402
+
+W = np.array([[1.0, -1.0], [0.5, 0.25], [-2.0, 2.0]], dtype=np.float32)
+B = np.array([0.1, -0.1], dtype=np.float32)
+
+
+def _reference(X):
+    z = X @ W + B
+    e = np.exp(z - z.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
+
+
+@pytest.fixture
+def mdir(tmp_path):
+    """x(N,3) → softmax(xW + b) 를 model.onnx 로 저장한 모델 디렉터리."""
+    graph = helper.make_graph(
+        [helper.make_node("MatMul", ["x", "W"], ["z0"]),
+         helper.make_node("Add", ["z0", "B"], ["z"]),
+         helper.make_node("Softmax", ["z"], ["proba"], axis=1)],
+        "tiny",
+        [helper.make_tensor_value_info("x", TensorProto.FLOAT, ["batch", 3])],
+        [helper.make_tensor_value_info("proba", TensorProto.FLOAT, ["batch", 2])],
+        [numpy_helper.from_array(W, "W"), numpy_helper.from_array(B, "B")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(tmp_path / onnx_runner.ONNX_MODEL))
+
+    (tmp_path / onnx_runner.SOURCE_MODEL).write_bytes(b"tabnet weights")
+    (tmp_path / onnx_runner.ONNX_META).write_text(json.dumps({
+        "source": onnx_runner.SOURCE_MODEL,
+        "source_sha256": onnx_runner.file_sha256(str(tmp_path / onnx_runner.SOURCE_MODEL)),
+    }))
+    X = np.random.default_rng(0).normal(size=(32, 3)).astype(np.float32)
+    np.savez(tmp_path / onnx_runner.ONNX_PARITY, X=X, proba=_reference(X.astype(np.float64)))
+    return tmp_path
+
+
+def test_onnx_preferred_and_matches_reference(mdir, monkeypatch):
+    monkeypatch.setattr(tabnet_runner, "_try_load_tabnet_zip", lambda d: pytest.fail("TabNet zip 로딩 시도"))
+    model = tabnet_runner._load_model_flexible(str(mdir))
+    assert isinstance(model, onnx_runner.OnnxClassifier)
+
+    X = np.array([[0.3, -1.2, 2.0]], dtype=np.float32)
+    assert np.allclose(tabnet_runner._proba_class1(model, X), _reference(X)[:, 1], atol=1e-6)
+
+
+def test_parity_mismatch_rejected(mdir):
+    with np.load(mdir / onnx_runner.ONNX_PARITY) as ref:
+        X, proba = ref["X"], ref["proba"]
+    np.savez(mdir / onnx_runner.ONNX_PARITY, X=X, proba=proba[:, ::-1])
+    assert onnx_runner.try_load_onnx(str(mdir)) is None
+
+
+def test_stale_export_rejected(mdir):
+    (mdir / onnx_runner.SOURCE_MODEL).write_bytes(b"retrained tabnet weights")
+    assert onnx_runner.try_load_onnx(str(mdir)) is None
@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services.features import packing
+
+PUBLIC = Path(__file__).resolve().parents[3] / "front-end" / "public"
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+def test_array_roundtrip(dtype):
+    a = np.arange(24, dtype=np.float64).reshape(2, 3, 4) / 7
+    out = packing.unpack_array(packing.pack_array(a, dtype))
+    assert out.dtype == np.dtype(dtype) and out.shape == (2, 3, 4)
+    assert np.array_equal(out, a.astype(dtype))
+
+    with pytest.raises(ValueError, match="형식"):
+        packing.unpack_array(b"XX" + packing.pack_array(a)[2:])
+
+
+def test_stack_uses_one_buffer_and_falls_back_on_mixed_shapes():
+    rows = [np.full((478, 3), i, dtype=np.float32) for i in range(5)]
+    blobs = [packing.pack_array(r) for r in rows]
+    stacked = packing.unpack_stack(blobs)
+    assert stacked.shape == (5, 478, 3) and np.array_equal(stacked, np.stack(rows))
+
+    mixed = packing.unpack_stack([packing.pack_array(np.ones(3)), packing.pack_array(np.zeros(3), np.float16)])
+    assert mixed.tolist() == [[1, 1, 1], [0, 0, 0]]
+
+
+def test_feature_schema_follows_feature_order(tmp_path, monkeypatch):
+    mdir = tmp_path / "face" / "v9"
+    mdir.mkdir(parents=True)
+    (mdir / "feature_order.json").write_text(json.dumps(["b", "a", "c"]))
+    monkeypatch.setattr(packing.settings, "MODEL_DIR_BASE", str(tmp_path))
+
+    schema, blob = packing.pack_features("face", {"a": 1.0, "b": 2.0}, version="v9")
+    assert schema.startswith("face/v9#")
+    vec, names = packing.decode_features(blob, schema)
+    assert names == ("b", "a", "c") and vec.dtype == np.float32
+    assert vec[:2].tolist() == [2.0, 1.0] and np.isnan(vec[2])
+
+    # feature_order.json 이 바뀌면 옛 스키마 id 는 새 순서로 읽히지 않는다
+    (mdir / "feature_order.json").write_text(json.dumps(["a", "b", "c"]))
+    assert packing.feature_schema("face", "v9") != schema
+    packing.schema_names.cache_clear()
+    with pytest.raises(ValueError, match="바뀌었습니다"):
+        packing.decode_features(blob, schema)
+
+
+def test_refeaturize_face_from_stored_landmarks():
+    from app.services.features.face_features import feature_vector_from_landmarks
+    from app.services.pipeline import run_pipeline
+
+    feats, _, _, packed = run_pipeline("face", (PUBLIC / "face.png").read_bytes())
+    cols = packing.packed_columns(packed)
+    lm = packing.unpack_array(cols["landmarks_bin"])
+    assert lm.shape == (478, 3) and lm.dtype == np.float32
+
+    vec, names = packing.decode_features(cols["features_bin"], cols["feature_schema"])
+    assert np.allclose(vec, [feats[k] for k in names], rtol=1e-6)
+    # float32 좌표로 다시 계산해도 저장된 피처와 같다 (AI 값의 3자리 반올림 경계만 허용)
+    again = dict(zip(feats, feature_vector_from_landmarks(lm[:, :2].astype(np.float64))))
+    assert np.allclose([again[k] for k in names], vec, atol=1.1e-3)
+
+
+def test_arm_landmarks_roundtrip():
+    from app.services.features.arm_features import features_from_hand_landmarks
+
+    left = np.arange(42, dtype=np.float64).reshape(21, 2) * 3
+    start, end = {"Left": left, "Right": None}, {"Left": left + 5, "Right": None}
+    arr = packing.unpack_array(packing.pack_arm_landmarks(start, end))
+    assert arr.shape == (2, 2, 21, 2) and np.isnan(arr[:, 1]).all()
+
+    s2, e2 = packing.arm_landmarks_to_dicts(arr)
+    assert s2["Right"] is None and features_from_hand_landmarks(s2, e2) == features_from_hand_landmarks(start, end)
+
+
+def test_crud_reads_feature_matrix_without_json():
+    from app.crud.face import get_face_feature_matrix, get_face_landmarks
+
+    engine = create_engine("sqlite://")
+    rows = []
+    for i in range(1, 5):
+        schema, blob = packing.pack_features("face", {"AI_x_61_291": float(i)})
+        rows.append({"i": i, "s": schema if i != 3 else "face/v0#00000000", "f": blob,
+                     "l": packing.pack_face_landmarks(np.full((478, 3), i)) if i != 2 else None})
+    with Session(engine) as db:
+        db.execute(text("CREATE TABLE face (face_id INTEGER PRIMARY KEY, feature_schema TEXT, features_bin BLOB, landmarks_bin BLOB)"))
+        db.execute(text("INSERT INTO face VALUES (:i, :s, :f, :l)"), rows)
+
+        ids, X = get_face_feature_matrix(db, schema=rows[0]["s"])
+        assert ids.tolist() == [1, 2, 4] and X.shape == (3, 59) and X[:, 0].tolist() == [1.0, 2.0, 4.0]
+        ids, X = get_face_feature_matrix(db, schema=rows[0]["s"], after_id=1, limit=1)
+        assert ids.tolist() == [2]
+
+        ids, lm = get_face_landmarks(db)
+        assert ids.tolist() == [1, 3, 4] and lm.shape == (3, 478, 3) and lm[1, 0, 0] == 3.0
@@ -0,0 +1,58 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import readiness as rd
+
+
+def test_app_import_does_not_load_ml_stack():
+    code = (
+        "import sys, json, app.main; "
+        "print(json.dumps([m for m in ('cv2', 'mediapipe', 'torch', 'pytorch_tabnet', 'sklearn', 'onnxruntime') if m in sys.modules]))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert json.loads(out.stdout.strip().splitlines()[-1]) == []
+
+
+def test_warmup_status(monkeypatch):
+    monkeypatch.setitem(rd.WARMERS, "ok", lambda: {"backend": "OnnxClassifier", "scaler": "AffineScaler"})
+    monkeypatch.setitem(rd.WARMERS, "fallback", lambda: {"backend": "FallbackClassifier", "scaler": "AffineScaler"})
+    monkeypatch.setitem(rd.WARMERS, "broken", lambda: 1 / 0)
+
+    report = rd.warmup_all(["ok", "fallback", "broken"])
+    assert report["ok"]["status"] == "ready" and report["ok"]["backend"] == "OnnxClassifier"
+    assert report["fallback"]["status"] == "degraded"
+    assert report["broken"]["status"] == "failed" and "ZeroDivisionError" in report["broken"]["error"]
+
+
+def test_speech_is_warmed_by_default():
+    assert "speech" in rd.configured_modalities()
+    # 음성 모델은 feature_order.json 만 있어 폴백으로 뜬다 → /ready 에 degraded 로 드러나야 함
+    assert rd.warmup_modality("speech")["status"] == "degraded"
+
+
+@pytest.mark.parametrize("statuses, allow_degraded, expected", [
+    (["ready", "ready"], False, 200),
+    (["ready", "degraded"], False, 503),
+    (["ready", "degraded"], True, 200),
+    (["ready", "failed"], True, 503),
+])
+def test_ready_endpoint(monkeypatch, statuses, allow_degraded, expected):
+    from app import main
+
+    state = rd.Readiness()
+    monkeypatch.setattr(main, "readiness", state)
+    monkeypatch.setattr(rd.settings, "READY_ALLOW_DEGRADED", allow_degraded)
+    client = TestClient(main.app)
+
+    r = client.get("/ready")
+    assert r.status_code == 503 and r.json()["phase"] == "starting"
+
+    state.record("done", {f"m{i}": {"status": s} for i, s in enumerate(statuses)})
+    r = client.get("/ready")
+    assert r.status_code == expected
+    assert r.json()["modalities"]["m0"] == {"status": "ready"}
+    assert client.get("/health").status_code == 200
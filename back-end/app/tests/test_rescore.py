@@ -0,0 +1,107 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.rescore import RescoreResult
+from app.tools import rescore as rs
+
+PUBLIC = Path(__file__).resolve().parents[3] / "front-end" / "public"
+RUN = {"modality": "face", "model_version": "v1", "source": "test", "sink": "table"}
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rescore.db'}")
+    RescoreResult.__table__.create(engine)
+    with engine.begin() as conn:  # face 모델의 MySQL 전용 기본값은 SQLite 에서 만들 수 없어 같은 컬럼으로 직접 생성
+        conn.execute(text("CREATE TABLE face (face_id INTEGER PRIMARY KEY, user_id TEXT, image_key TEXT, image_blob BLOB)"))
+    return sessionmaker(bind=engine)
+
+
+def _results(Session):
+    with Session() as s:
+        return {r.source_key: r for r in s.scalars(select(RescoreResult)).all()}
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    root = tmp_path / "images"
+    (root / "b").mkdir(parents=True)
+    shutil.copy(PUBLIC / "face.png", root / "a.png")
+    shutil.copy(PUBLIC / "face.png", root / "b" / "c.png")
+    (root / "b" / "broken.jpg").write_bytes(b"not an image")
+    (root / "notes.txt").write_text("skip")
+    return root
+
+
+def test_directory_rescore_resumes_from_checkpoint(db, image_dir, tmp_path):
+    sink = rs.TableSink(db, "face", "v1")
+    ckpt = rs.Checkpoint(tmp_path / "ckpt.json", RUN)
+    first = rs.rescore(list(rs.iter_dir_items(image_dir, "face", after=None))[:2], "face", sink, ckpt,
+                       workers=0, batch_size=1, with_features=True)
+    assert first == {"rows": 2, "errors": 1}
+    assert ckpt.last == ["b", "broken.jpg"]
+
+    # 중단 후 재실행: 체크포인트 이후만 처리
+    resumed = rs.Checkpoint(tmp_path / "ckpt.json", RUN)
+    items = list(rs.iter_dir_items(image_dir, "face", after=resumed.last))
+    rs.rescore(items, "face", sink, resumed, workers=0, batch_size=2)
+    assert [key for key, _, _ in items] == ["b/c.png"]
+
+    rows = _results(db)
+    assert sorted(rows) == ["a.png", "b/broken.jpg", "b/c.png"]
+    assert rows["b/broken.jpg"].proba is None and "디코딩" in rows["b/broken.jpg"].error
+    assert 0.0 <= rows["a.png"].proba <= 1.0 and rows["a.png"].pred_label in (0, 1)
+    assert len(rows["a.png"].features_json) == 59
+    assert rows["b/c.png"].proba == pytest.approx(rows["a.png"].proba)
+    assert json.loads((tmp_path / "ckpt.json").read_text())["rows"] == 3
+
+    with pytest.raises(SystemExit, match="다른 실행 조건"):
+        rs.Checkpoint(tmp_path / "ckpt.json", {**RUN, "model_version": "v2"})
+
+
+def test_db_rescore_with_process_pool_is_idempotent(db, tmp_path):
+    face = (PUBLIC / "face.png").read_bytes()
+    with db() as s:
+        s.execute(text("INSERT INTO face (face_id, user_id, image_blob) VALUES (:i, 'u', :b)"),
+                  [{"i": 1, "b": face}, {"i": 2, "b": None}, {"i": 5, "b": face}])
+        s.commit()
+
+    sink = rs.TableSink(db, "face", "v1")
+    for _ in range(2):  # 체크포인트 없이 다시 돌려도 같은 키는 덮어쓴다
+        ckpt = rs.Checkpoint(tmp_path / "db.json", RUN, restart=True)
+        with db() as src:
+            rs.rescore(rs.iter_db_items(src, "face", after=None, batch_size=2), "face", sink, ckpt,
+                       workers=1, batch_size=2, chunk_size=1)
+    assert ckpt.last == 5
+
+    rows = _results(db)
+    assert sorted(rows) == ["1", "2", "5"]
+    assert rows["5"].source_id == 5 and rows["5"].proba == pytest.approx(rows["1"].proba)
+    assert rows["2"].proba is None and "원본" in rows["2"].error
+
+    with db() as src:
+        assert [k for k, _, _ in rs.iter_db_items(src, "face", after=1, batch_size=2)] == ["2", "5"]
+
+
+def test_arm_directory_pairs(tmp_path):
+    for name in ("p1_start.jpg", "p1_end.jpg", "p2_start.jpg", "lonely.jpg"):
+        (tmp_path / name).write_bytes(b"x")
+    items = list(rs.iter_dir_items(tmp_path, "arm", after=None))
+    assert [(key, [Path(p).name for _, p in refs]) for key, _, refs in items] == [("p1_start.jpg", ["p1_start.jpg", "p1_end.jpg"])]
+
+
+def test_parquet_sink(image_dir, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    out = tmp_path / "out"
+    ckpt = rs.Checkpoint(out / "ckpt.json", RUN)
+    rs.rescore(rs.iter_dir_items(image_dir, "face", after=None), "face", rs.ParquetSink(out, "face", "v1"), ckpt,
+               workers=0, batch_size=2, with_features=True)
+    from app.services.features.face_features import FEATURE_NAMES
+
+    table = pq.read_table(sorted(out.glob("part-*.parquet")))
+    assert table.num_rows == 3 and FEATURE_NAMES[0] in table.column_names
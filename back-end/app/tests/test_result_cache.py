@@ -0,0 +1,127 @@
+from app.core.config import settings
+from app.services.result_cache import ResultCache
+
+
+def test_memory_then_disk_hit(tmp_path):
+    cache = ResultCache(max_entries=1, disk_dir=str(tmp_path), disk_max_mb=1)
+    k1 = cache.key("face", [b"img-1"])
+    k2 = cache.key("face", [b"img-2"])
+    assert cache.get(k1) is None
+
+    cache.put(k1, [{"f": 1.0}, 0.25, 0])
+    cache.put(k2, [{"f": 2.0}, 0.75, 1])  # 메모리 1칸 → k1 은 디스크에만 남음
+    assert cache.get(k2) == [{"f": 2.0}, 0.75, 1]
+    assert cache.get(k1) == [{"f": 1.0}, 0.25, 0]
+
+    # 재시작 후에도 디스크에서 조회
+    restarted = ResultCache(max_entries=8, disk_dir=str(tmp_path), disk_max_mb=1)
+    assert restarted.get(k2) == [{"f": 2.0}, 0.75, 1]
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_key_changes_with_model_version_and_threshold(monkeypatch):
+    base = ResultCache.key("face", [b"img"])
+    assert ResultCache.key("face", [b"img"]) == base
+    assert ResultCache.key("arm", [b"img"]) != base
+    assert ResultCache.key("arm", [b"ab", b"c"]) != ResultCache.key("arm", [b"a", b"bc"])
+
+    monkeypatch.setattr(settings, "FACE_THRESHOLD", 0.9)
+    assert ResultCache.key("face", [b"img"]) != base
+    monkeypatch.undo()
+    monkeypatch.setattr(settings, "FACE_MODEL_VERSION", "v2")
+    assert ResultCache.key("face", [b"img"]) != base
+
+
+def test_key_changes_when_model_files_replaced(tmp_path, monkeypatch):
+    mdir = tmp_path / "face" / "v1"
+    mdir.mkdir(parents=True)
+    (mdir / "model.onnx").write_text("version https://git-lfs.github.com/spec/v1")  # LFS 포인터
+    monkeypatch.setattr(settings, "MODEL_DIR_BASE", str(tmp_path))
+    monkeypatch.setattr(settings, "MODEL_RELOAD_CHECK_SECONDS", 0.0)
+    base = ResultCache.key("face", [b"img"])
+    assert ResultCache.key("face", [b"img"]) == base
+
+    (mdir / "model.onnx").write_bytes(b"\x08" * 4096)  # 같은 버전에 실제 모델 파일
+    assert ResultCache.key("face", [b"img"]) != base
+
+
+def test_disk_is_pruned_to_budget(tmp_path):
+    cache = ResultCache(max_entries=0, disk_dir=str(tmp_path), disk_max_mb=1)
+    blob = "x" * 200_000
+    for i in range(10):
+        cache.put(cache.key("face", [bytes([i])]), blob)
+    total = sum(f.stat().st_size for f in tmp_path.glob("*/*.json"))
+    assert total <= 1024 * 1024
+
+
+def test_face_predict_and_batch_share_cache_entries(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+    from app.services import result_cache as rc
+    from app.services.executor import measure_executor
+
+    face = (Path(__file__).resolve().parents[3] / "front-end" / "public" / "face.png").read_bytes()
+    monkeypatch.setattr(measure_executor, "mode", "inline")
+    monkeypatch.setattr(rc, "result_cache", ResultCache(max_entries=8, disk_dir=None, disk_max_mb=0))
+    client = TestClient(create_app())
+
+    def predict():
+        return client.post("/api/v1/measure/face/predict", files={"file": ("a.png", face, "image/png")})
+
+    def batch():
+        return client.post("/api/v1/measure/face/predict-batch", files=[("files", ("a.png", face, "image/png"))])
+
+    # 배치가 먼저 채운 항목을 단건이, 단건이 채운 항목을 배치가 그대로 읽는다
+    first = batch().json()["results"][0]
+    assert first["error"] is None
+    r = predict()
+    assert r.status_code == 200 and r.json()["pred_proba"] == first["pred_proba"]
+    key = ResultCache.key("face", [face])
+    assert len(rc.result_cache.get(key)) == 4 and rc.result_cache.get(key)[3]["landmarks_bin"]
+
+    rc.result_cache.clear()
+    assert predict().status_code == 200
+    assert batch().json()["results"][0]["pred_proba"] == first["pred_proba"]
+
+    # 형태가 다른 옛 항목(3개)은 없는 것으로 보고 다시 측정해 덮어쓴다
+    rc.result_cache.put(key, [first["features"], 0.99, 1])
+    assert predict().json()["pred_proba"] == first["pred_proba"]
+    assert len(rc.result_cache.get(key)) == 4
+
+
+def test_face_batch_inference_failure_returns_partial_results(monkeypatch):
+    from pathlib import Path
+
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+    from app.services import result_cache as rc
+    from app.services.executor import ExecutorSaturated, measure_executor
+
+    face = (Path(__file__).resolve().parents[3] / "front-end" / "public" / "face.png").read_bytes()
+    monkeypatch.setattr(measure_executor, "mode", "inline")
+    monkeypatch.setattr(rc, "result_cache", ResultCache(max_entries=8, disk_dir=None, disk_max_mb=0))
+    client = TestClient(create_app())
+    files = [("files", ("a.png", face, "image/png")), ("files", ("b.png", b"", "image/png"))]
+
+    async def broken(kind, *payloads, **params):
+        raise RuntimeError("model exploded")
+
+    monkeypatch.setattr(measure_executor, "run", broken)
+    res = client.post("/api/v1/measure/face/predict-batch", files=files)
+    assert res.status_code == 200
+    a, b = res.json()["results"]
+    assert a["error"] == "model exploded" and a["features"] and a["pred_proba"] is None
+    assert b["error"] == "이미지 파일이 비어 있습니다."
+    assert rc.result_cache.get(ResultCache.key("face", [face])) is None  # 실패한 결과는 캐시하지 않음
+
+    async def saturated(kind, *payloads, **params):
+        raise ExecutorSaturated("full")
+
+    monkeypatch.setattr(measure_executor, "run", saturated)
+    assert client.post("/api/v1/measure/face/predict-batch", files=files).status_code == 503
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import shadow
+from app.services.executor import measure_executor
+from app.services.features.face_features import FEATURE_NAMES
+from app.services.inference.tabnet_runner import predict_proba_version
+
+FEATS = {name: 0.1 * i for i, name in enumerate(FEATURE_NAMES)}
+
+
+@pytest.fixture
+def candidate(monkeypatch):
+    # 활성 버전을 바꾸고 기존 v1 을 후보로 → 같은 자산으로 섀도 경로만 검증
+    monkeypatch.setattr(shadow.settings, "FACE_MODEL_VERSION", "v0")
+    monkeypatch.setattr(shadow.settings, "FACE_SHADOW_VERSION", "v1")
+
+
+def _evaluator(records, **kw):
+    opts = dict(workers=1, queue_size=8, shed_ratio=0.5, flush_rows=10, record=records.extend)
+    return shadow.ShadowEvaluator(**{**opts, **kw})
+
+
+def test_shadow_records_candidate_next_to_primary(candidate):
+    records = []
+    ev = _evaluator(records)
+    assert ev.submit("face", FEATS, proba=0.7, label=1)
+    ev.shutdown()
+
+    [rec] = records
+    assert rec["primary_version"] == "v0" and rec["primary_proba"] == 0.7 and rec["primary_label"] == 1
+    assert rec["shadow_version"] == "v1" and rec["error"] is None
+    assert rec["shadow_proba"] == pytest.approx(predict_proba_version("face", FEATS, "v1"))
+    assert rec["shadow_latency_ms"] >= 0.0
+    assert "features" not in rec
+
+
+def test_no_candidate_or_same_version_is_noop(monkeypatch):
+    ev = _evaluator([])
+    monkeypatch.setattr(shadow.settings, "FACE_SHADOW_VERSION", "")
+    assert not ev.submit("face", FEATS, proba=0.5, label=0)
+    monkeypatch.setattr(shadow.settings, "FACE_SHADOW_VERSION", shadow.settings.FACE_MODEL_VERSION)
+    assert not ev.submit("face", FEATS, proba=0.5, label=0)
+    assert ev._threads == []
+
+
+def test_shadow_is_dropped_under_load(candidate, monkeypatch):
+    ev = _evaluator([])
+    monkeypatch.setattr(measure_executor, "_inflight", measure_executor.capacity)
+    before = shadow.SHADOW_JOBS.value("face", "dropped_load")
+    assert not ev.submit("face", FEATS, proba=0.5, label=0)
+    assert shadow.SHADOW_JOBS.value("face", "dropped_load") == before + 1
+
+
+def test_full_queue_drops_instead_of_blocking(candidate, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow(*args):
+        started.set()
+        release.wait(5)
+        return 0.5, 1
+
+    monkeypatch.setattr(shadow, "_predict", slow)
+    records = []
+    ev = _evaluator(records, queue_size=1)
+    assert ev.submit("face", FEATS, proba=0.5, label=0)
+    assert started.wait(5)  # 첫 작업은 처리 중
+    assert ev.submit("face", FEATS, proba=0.5, label=0)  # 대기열 1칸
+    assert not ev.submit("face", FEATS, proba=0.5, label=0)
+    release.set()
+    ev.shutdown()
+    assert len(records) == 2
+
+
+def test_failed_candidate_is_recorded_as_error(candidate, monkeypatch):
+    def broken(*args):
+        raise FileNotFoundError("no model")
+
+    monkeypatch.setattr(shadow, "_predict", broken)
+    records = []
+    ev = _evaluator(records)
+    ev.submit("face", FEATS, proba=0.5, label=0)
+    ev.shutdown()
+    assert records[0]["shadow_proba"] is None and "no model" in records[0]["error"]
+
+
+def test_face_predict_submits_shadow_after_primary(monkeypatch):
+    from app.api.v1.endpoints import measure
+    from app.main import create_app
+
+    async def fake_measure(modality, data):
+        return {"f": 1.0}, 0.25, 0, None
+
+    calls = []
+    monkeypatch.setattr(measure.result_cache, "measure_cached", fake_measure)
+    monkeypatch.setattr(measure.shadow_evaluator, "submit", lambda *a, **kw: calls.append((a, kw)))
+    res = TestClient(create_app()).post("/api/v1/measure/face/predict", files={"file": ("a.jpg", b"x", "image/jpeg")})
+    assert res.status_code == 200 and res.json()["pred_proba"] == 0.25
+    assert calls == [(("face", {"f": 1.0}), {"proba": 0.25, "label": 0})]
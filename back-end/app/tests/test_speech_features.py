@@ -0,0 +1,133 @@
+import io
+import struct
+import wave
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.features import speech_features as sf
+
+SR = 16000
+
+
+def _signal(f0=150.0, seconds=1.0, pause=0.4):
+    """무음 - 유성음(f0 + 배음) - 무음 - 유성음 - 무음"""
+    t = np.arange(int(SR * seconds)) / SR
+    voice = sum(0.3 / k * np.sin(2 * np.pi * f0 * k * t) for k in range(1, 6))
+    sil = np.zeros(int(SR * pause))
+    return np.concatenate([sil, voice, sil, voice, sil]).astype(np.float32)
+
+
+def _wav(x, sr=SR, channels=1):
+    pcm = np.repeat((x * 32767).astype("<i2")[:, None], channels, axis=1).tobytes()
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(sr)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _feed_randomly(stream, data, seed=0):
+    rng = np.random.default_rng(seed)
+    i = 0
+    while i < len(data):
+        n = int(rng.integers(1, 3000))
+        stream.feed(data[i: i + n])
+        i += n
+    return stream.finish()
+
+
+def test_prosody_features():
+    d = sf.features_to_dict(sf.extract_feature_vector_from_audio_bytes(_wav(_signal())))
+    assert d["duration_s"] == pytest.approx(3.2)
+    assert d["f0_mean_hz"] == pytest.approx(150.0, rel=0.01)
+    assert d["pause_count"] == 1  # 앞뒤 무음은 휴지로 세지 않음
+    assert d["mean_pause_s"] == pytest.approx(0.4, abs=0.05)
+    assert d["voiced_ratio"] > 0.9
+    assert len(d) == len(sf.FEATURE_NAMES)
+
+
+def test_chunking_does_not_change_features():
+    data = _wav(_signal())
+    whole = sf.extract_feature_vector_from_audio_bytes(data, chunk_size=len(data))
+    streamed = _feed_randomly(sf.SpeechStream(), data)  # 헤더/샘플 경계가 청크에 걸리도록 임의 크기
+    assert np.allclose(whole, streamed, rtol=1e-5, atol=1e-6)
+
+
+def test_raw_pcm_and_stereo_match_wav():
+    x = _signal()
+    ref = sf.extract_feature_vector_from_audio_bytes(_wav(x))
+    raw = _feed_randomly(sf.SpeechStream(sf.RawPcmDecoder(SR)), (x * 32767).astype("<i2").tobytes())
+    stereo = sf.extract_feature_vector_from_audio_bytes(_wav(x, channels=2))
+    assert np.allclose(ref, raw, rtol=1e-5, atol=1e-6)
+    assert np.allclose(ref, stereo, rtol=1e-5, atol=1e-6)
+
+
+def test_wav_skips_unknown_chunks_and_unknown_data_size():
+    data = _wav(_signal())
+    # fmt 와 data 사이에 LIST 청크 삽입 + data 크기를 0xFFFFFFFF(길이 미상) 로
+    fmt_end = 12 + 8 + 16
+    extra = b"LIST" + struct.pack("<I", 5) + b"abcde\x00"
+    body = data[:fmt_end] + extra + data[fmt_end: fmt_end + 4] + struct.pack("<I", 0xFFFFFFFF) + data[fmt_end + 8:]
+    assert np.allclose(sf.extract_feature_vector_from_audio_bytes(body), sf.extract_feature_vector_from_audio_bytes(data))
+
+
+def test_accumulator_state_is_bounded():
+    acc = sf.SpeechFeatureAccumulator(SR)
+    x = _signal()
+    for _ in range(20):
+        acc.feed(x)
+    assert len(acc._tail) < acc._a["frame"]
+    assert acc.finish()[0] == pytest.approx(20 * len(x) / SR)
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"not a wav file at all", "WAV"),
+    (_wav(np.zeros(SR, dtype=np.float32)), "음성"),
+    (_wav(np.zeros(0, dtype=np.float32)), "샘플"),
+])
+def test_invalid_audio(data, message):
+    with pytest.raises(ValueError, match=message):
+        sf.extract_feature_vector_from_audio_bytes(data)
+
+
+def test_too_long_fails_before_upload_ends():
+    stream = sf.SpeechStream(max_seconds=1.0)
+    data = _wav(_signal())
+    with pytest.raises(sf.AudioTooLong):
+        for i in range(0, len(data), 4096):
+            stream.feed(data[i: i + 4096])
+    assert stream.duration_s < 1.2
+
+
+def test_speech_predict_endpoint_streams_body(monkeypatch):
+    from app.main import create_app
+    from app.services.executor import MeasureExecutor
+    from app.api.v1.endpoints import measure
+    from app.services import pipeline
+
+    monkeypatch.setattr(measure, "measure_executor", MeasureExecutor(mode="inline", workers=1, queue_size=1))
+    monkeypatch.setattr(measure.settings, "SPEECH_STREAM_CHUNK_BYTES", 4096)
+    client = TestClient(create_app())
+    data = _wav(_signal())
+
+    # 음성 모델 미배포(feature_order.json 만 있음) → 폴백으로 만든 진단 대신 503
+    res = client.post("/api/v1/measure/speech/predict", content=data)
+    assert res.status_code == 503 and "음성 모델" in res.json()["detail"]
+
+    monkeypatch.setattr(pipeline, "uses_fallback", lambda modality: False)
+    res = client.post("/api/v1/measure/speech/predict", content=(data[i: i + 1000] for i in range(0, len(data), 1000)))
+    assert res.status_code == 200, res.text
+    body = res.json()
+    assert body["modality"] == "speech" and body["duration_s"] == pytest.approx(3.2)
+    assert 0.0 <= body["pred_proba"] <= 1.0 and body["pred_label"] in (0, 1)
+    assert body["features"]["f0_mean_hz"] == pytest.approx(150.0, rel=0.01)
+
+    raw = client.post("/api/v1/measure/speech/predict?format=s16le", content=b"\x00" * 10)
+    assert raw.status_code == 400
+
+    monkeypatch.setattr(measure.settings, "SPEECH_MAX_SECONDS", 1.0)
+    assert client.post("/api/v1/measure/speech/predict", content=data).status_code == 413
@@ -0,0 +1,347 @@
+# back-end/app/tools/bench_pipeline.py
+"""
+측정 파이프라인 단계별 벤치마크 + 피처 골든 비교.
+실행 (back-end 에서):
+    python -m app.tools.bench_pipeline [--repeat 20] [--out bench.json] [--compare base.json]
+    python -m app.tools.bench_pipeline --update-golden   # 피처 계산을 의도적으로 바꿨을 때만
+- 단계: 디코딩 → 랜드마크(MediaPipe) → 피처 → 스케일 → 추론(face/arm) → 결과 문장 → DB 쓰기(SQLite 대용)
+- 골든: 저장된 랜드마크 → 피처는 완전히 같아야 하고(face 59개, arm 16개),
+        샘플 이미지 → 피처는 atol 이내여야 한다 (MediaPipe 버전/CPU 에 따라 미세하게 다를 수 있음)
+- 결과는 JSON (stdout 또는 --out). --compare 로 이전 커밋 결과와 단계별 p50 을 비교
+종료 코드: 0 정상, 1 골든 불일치, 2 성능 회귀(--compare)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+FIXTURE_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "pipeline"
+GOLDEN_JSON = FIXTURE_DIR / "golden.json"
+LANDMARKS_NPZ = FIXTURE_DIR / "landmarks.npz"
+
+# 저장소에 이미 포함된 예시 이미지 (프런트 안내 화면용) — 복사하지 않고 경로로 참조
+FACE_SAMPLES = ["front-end/public/face.png", "front-end/public/facetest.png"]
+ARM_SAMPLES = [("front-end/public/armtest.png", "front-end/public/arm.png")]
+HANDS = ("Left", "Right")
+
+# 모델 없이 재현 가능한 합성 이미지 (디코딩/축소 단계용)
+SYNTHETIC = {"synthetic_4032x3024.jpg": (4032, 3024), "synthetic_1280x720.jpg": (1280, 720)}
+
+# DB 대용: 모델의 MySQL 전용 타입은 SQLite 에서 만들 수 없어 같은 컬럼으로 직접 생성
+_FACE_DDL = (
+    "CREATE TABLE face (face_id INTEGER PRIMARY KEY, user_id TEXT, image_key TEXT, image_blob BLOB,"
+    " image_mime TEXT, image_size INT, result_text TEXT, landmarks_json TEXT, created_at TEXT, updated_at TEXT,"
+    " feature_schema TEXT, features_bin BLOB, landmarks_bin BLOB)"
+)
+
+
+# ── 공통 ─────────────────────────────────────────────────────────────────────
+def _read(rel: str) -> bytes:
+    return (REPO_ROOT / rel).read_bytes()
+
+
+def _synthetic_jpeg(width: int, height: int) -> bytes:
+    import cv2
+
+    rng = np.random.default_rng(0)
+    gx = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    gy = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    img = np.stack([gx + 0 * gy, gy + 0 * gx, (gx + gy) / 2], axis=-1)
+    img += rng.normal(0, 12, size=img.shape).astype(np.float32)
+    return cv2.imencode(".jpg", np.clip(img, 0, 255).astype(np.uint8), [cv2.IMWRITE_JPEG_QUALITY, 90])[1].tobytes()
+
+
+def _summary(samples_ms: List[float]) -> Dict[str, float]:
+    s = sorted(samples_ms)
+    return {
+        "n": len(s),
+        "mean_ms": round(statistics.fmean(s), 4),
+        "p50_ms": round(s[len(s) // 2], 4),
+        "p95_ms": round(s[min(len(s) - 1, int(len(s) * 0.95))], 4),
+        "min_ms": round(s[0], 4),
+    }
+
+
+def _time(fn: Callable[[], Any], repeat: int, warmup: int = 2) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    out = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return _summary(out)
+
+
+def _stage(results: Dict[str, Any], name: str, fn: Callable[[], Any], repeat: int) -> None:
+    """실패한 단계(모델/패키지 없음 등)는 오류만 기록하고 나머지 단계는 계속."""
+    try:
+        results[name] = _time(fn, repeat)
+    except Exception as e:
+        results[name] = {"error": f"{type(e).__name__}: {e}"}
+
+
+def _hands_to_npz(prefix: str, xy: Dict[str, Optional[np.ndarray]], out: Dict[str, np.ndarray]) -> None:
+    for hand in HANDS:
+        if xy.get(hand) is not None:
+            out[f"{prefix}/{hand}"] = xy[hand]
+
+
+def _hands_from_npz(prefix: str, npz: Any) -> Dict[str, Optional[np.ndarray]]:
+    return {hand: (npz[f"{prefix}/{hand}"] if f"{prefix}/{hand}" in npz else None) for hand in HANDS}
+
+
+def _arm_name(pair) -> str:
+    return "+".join(Path(p).name for p in pair)
+
+
+# ── 골든 ─────────────────────────────────────────────────────────────────────
+def detect_samples() -> Dict[str, Any]:
+    """예시 이미지에서 랜드마크/피처를 새로 계산 (골든 갱신·이미지 단위 비교 공용)."""
+    from app.services.features.arm_features import _decode, _extract_xy21, features_from_hand_landmarks
+    from app.services.features.face_features import detect_face_landmarks, feature_vector_from_landmarks, features_to_dict
+    from app.services.features.image_ingest import ingest_image
+
+    face, arm, landmarks = {}, {}, {}
+    for rel in FACE_SAMPLES:
+        xy = detect_face_landmarks(ingest_image(_read(rel)))
+        if xy is None:
+            raise RuntimeError(f"얼굴 미검출: {rel}")
+        name = Path(rel).name
+        landmarks[f"face/{name}"] = xy
+        face[name] = {"source": rel, "features": features_to_dict(feature_vector_from_landmarks(xy))}
+    for pair in ARM_SAMPLES:
+        s_xy, e_xy = (_extract_xy21(_decode(_read(rel))) for rel in pair)
+        name = _arm_name(pair)
+        _hands_to_npz(f"arm/{name}/start", s_xy, landmarks)
+        _hands_to_npz(f"arm/{name}/end", e_xy, landmarks)
+        arm[name] = {"start": pair[0], "end": pair[1], "features": features_from_hand_landmarks(s_xy, e_xy)}
+    return {"face": face, "arm": arm, "landmarks": landmarks}
+
+
+def update_golden() -> None:
+    import cv2
+    import mediapipe
+
+    fresh = detect_samples()
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(LANDMARKS_NPZ, **fresh["landmarks"])
+    golden = {
+        "schema": 1,
+        "generated_with": {"mediapipe": mediapipe.__version__, "opencv": cv2.__version__, "numpy": np.__version__},
+        "face": fresh["face"],
+        "arm": fresh["arm"],
+    }
+    GOLDEN_JSON.write_text(json.dumps(golden, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    print(f"[BENCH] golden updated: {GOLDEN_JSON.relative_to(REPO_ROOT)}, {LANDMARKS_NPZ.relative_to(REPO_ROOT)}")
+
+
+def load_golden() -> Dict[str, Any]:
+    golden = json.loads(GOLDEN_JSON.read_text(encoding="utf-8"))
+    with np.load(LANDMARKS_NPZ) as npz:
+        golden["landmarks"] = {k: npz[k] for k in npz.files}
+    return golden
+
+
+def _max_diff(got: Dict[str, float], want: Dict[str, float]) -> float:
+    if list(got) != list(want):
+        return float("inf")
+    return max((abs(float(got[k]) - float(want[k])) for k in want), default=0.0)
+
+
+def check_landmark_parity(golden: Dict[str, Any]) -> Dict[str, Any]:
+    """저장된 랜드마크 → 피처가 골든과 완전히 같은지 (피처 계산 코드 변경 검증)."""
+    from app.services.features.arm_features import features_from_hand_landmarks
+    from app.services.features.face_features import feature_vector_from_landmarks, features_to_dict
+
+    lm = golden["landmarks"]
+    mismatches = []
+    for name, g in golden["face"].items():
+        if features_to_dict(feature_vector_from_landmarks(lm[f"face/{name}"])) != g["features"]:
+            mismatches.append(f"face/{name}")
+    for name, g in golden["arm"].items():
+        feats = features_from_hand_landmarks(_hands_from_npz(f"arm/{name}/start", lm), _hands_from_npz(f"arm/{name}/end", lm))
+        if feats != g["features"]:
+            mismatches.append(f"arm/{name}")
+    return {"samples": len(golden["face"]) + len(golden["arm"]), "mismatches": mismatches, "ok": not mismatches}
+
+
+def check_image_parity(golden: Dict[str, Any], atol: float) -> Dict[str, Any]:
+    """예시 이미지 → (디코딩 + MediaPipe) → 피처가 골든과 atol 이내인지 (적재/검출 경로 변경 검증)."""
+    fresh = detect_samples()
+    diffs = {}
+    for modality in ("face", "arm"):
+        for name, g in golden[modality].items():
+            got = fresh[modality].get(name)
+            diffs[f"{modality}/{name}"] = _max_diff(got["features"], g["features"]) if got else float("inf")
+    ok = max(diffs.values(), default=0.0) <= atol
+    # 키 불일치/누락(inf)은 JSON 호환을 위해 null 로 기록
+    return {"atol": atol, "max_abs_diff": {k: (v if np.isfinite(v) else None) for k, v in diffs.items()}, "ok": ok}
+
+
+# ── 벤치마크 ─────────────────────────────────────────────────────────────────
+def run_benchmarks(golden: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    from app.core.config import settings
+    from app.crud.face import create_face
+    from app.models import user  # noqa: F401  (FK 대상 테이블 등록)
+    from app.services.arm_result import compose_arm_result
+    from app.services.face_result import compose_result_text
+    from app.services.features.arm_features import _decode, _extract_xy21, features_from_hand_landmarks
+    from app.services.features.face_features import FEATURE_NAMES, detect_face_landmarks, feature_vector_from_landmarks, features_to_dict
+    from app.services.features.image_ingest import ingest_image
+    from app.services.inference import arm_xgb_runner, tabnet_runner
+    from app.services.storage import blob_store
+
+    stages: Dict[str, Any] = {}
+    lm = golden["landmarks"]
+    face_name = next(iter(golden["face"]))
+    face_bytes = _read(golden["face"][face_name]["source"])
+    arm_name = next(iter(golden["arm"]))
+    arm_start = _read(golden["arm"][arm_name]["start"])
+    face_xy = lm[f"face/{face_name}"]
+    s_xy, e_xy = _hands_from_npz(f"arm/{arm_name}/start", lm), _hands_from_npz(f"arm/{arm_name}/end", lm)
+    face_vec = feature_vector_from_landmarks(face_xy)
+    face_feats = features_to_dict(face_vec)
+    arm_feats = features_from_hand_landmarks(s_xy, e_xy)
+
+    # 1) 디코딩 (+ 축소/EXIF/RGB)
+    _stage(stages, "decode/face_sample", lambda: ingest_image(face_bytes), repeat)
+    for name, (w, h) in SYNTHETIC.items():
+        data = _synthetic_jpeg(w, h)
+        _stage(stages, f"decode/{name}", lambda data=data: ingest_image(data), repeat)
+
+    # 2) 랜드마크
+    face_img, arm_img = ingest_image(face_bytes), _decode(arm_start)
+    _stage(stages, "landmarks/face_mesh", lambda: detect_face_landmarks(face_img), repeat)
+    _stage(stages, "landmarks/hands", lambda: _extract_xy21(arm_img), repeat)
+
+    # 3) 피처
+    _stage(stages, "features/face", lambda: feature_vector_from_landmarks(face_xy), repeat * 10)
+    _stage(stages, "features/face_dict", lambda: features_to_dict(face_vec), repeat * 10)
+    _stage(stages, "features/arm", lambda: features_from_hand_landmarks(s_xy, e_xy), repeat * 10)
+
+    # 4) 스케일 (feature_order 정렬 + scaler)
+    _stage(stages, "scale/face_vector_row", lambda: tabnet_runner.vector_row("face", face_vec, FEATURE_NAMES), repeat * 10)
+    row = tabnet_runner.vector_row("face", face_vec, FEATURE_NAMES)
+
+    # 5) 추론 (모델 로딩은 제외: 예열 후 측정)
+    stages["model/face"] = {"backend": type(tabnet_runner.model_registry.get("face").artifacts[1]).__name__}
+    _stage(stages, "predict/face_row", lambda: tabnet_runner.predict_row_and_label("face", row), repeat * 10)
+    _stage(stages, "predict/face_batch32", lambda: tabnet_runner.predict_rows("face", np.repeat(row[None, :], 32, axis=0)), repeat)
+    _stage(stages, "predict/arm_row", lambda: arm_xgb_runner.predict_proba_and_label(arm_feats), repeat * 10)
+
+    # 6) 결과 문장
+    _stage(stages, "compose/face", lambda: compose_result_text(user_name_or_id="bench", is_abnormal=True, features=face_feats), repeat * 10)
+    _stage(stages, "compose/arm", lambda: compose_arm_result(0.7, "detected", arm_feats), repeat * 10)
+
+    # 7) DB 쓰기 (SQLite 파일 + 로컬 blob 저장소; 같은 이미지라 2회차부터 blob 은 중복 제거됨)
+    with tempfile.TemporaryDirectory() as tmp:
+        old_dir = settings.BLOB_STORE_DIR
+        settings.BLOB_STORE_DIR = os.path.join(tmp, "blobs")
+        blob_store.get_blob_store.cache_clear()
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        try:
+            with Session(engine) as db:
+                db.execute(text(_FACE_DDL))
+                db.commit()
+                _stage(stages, "db/create_face", lambda: create_face(
+                    db, user_id="bench", image_bytes=face_bytes, image_mime="image/png",
+                    image_size=len(face_bytes), result_text="정상", landmarks_json=face_feats,
+                ), repeat)
+        finally:
+            engine.dispose()
+            settings.BLOB_STORE_DIR = old_dir
+            blob_store.get_blob_store.cache_clear()
+    return stages
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, min_delta_ms: float = 0.05) -> Dict[str, Any]:
+    """단계별 p50 비율 (현재/기준). 비율이 tolerance 를 넘고 절대 증가도 min_delta_ms 이상이면 회귀 (μs 단위 단계의 잡음 제외)."""
+    ratios, regressions = {}, []
+    for name, cur in current["stages"].items():
+        base = baseline.get("stages", {}).get(name, {})
+        if "p50_ms" in cur and base.get("p50_ms"):
+            r = cur["p50_ms"] / base["p50_ms"]
+            ratios[name] = round(r, 3)
+            if r > 1 + tolerance and cur["p50_ms"] - base["p50_ms"] >= min_delta_ms:
+                regressions.append(name)
+    return {"baseline_commit": baseline.get("meta", {}).get("commit"), "tolerance": tolerance, "p50_ratio": ratios, "regressions": regressions}
+
+
+def _meta() -> Dict[str, Any]:
+    import cv2
+    import mediapipe
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "mediapipe": mediapipe.__version__,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="측정 파이프라인 단계별 벤치마크 + 피처 골든 비교")
+    ap.add_argument("--repeat", type=int, default=20, help="단계별 반복 횟수 (가벼운 단계는 ×10)")
+    ap.add_argument("--out", default=None, help="결과 JSON 경로 (기본: stdout)")
+    ap.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="p50 회귀 허용 비율 (0.2 = 20%%)")
+    ap.add_argument("--image-atol", type=float, default=1e-6, help="이미지 → 피처 골든 허용 오차")
+    ap.add_argument("--parity-only", action="store_true", help="골든 비교만 실행")
+    ap.add_argument("--update-golden", action="store_true", help="예시 이미지로 골든 다시 생성")
+    args = ap.parse_args()
+
+    if args.update_golden:
+        update_golden()
+        return
+
+    golden = load_golden()
+    report: Dict[str, Any] = {"meta": _meta(), "parity": {
+        "landmark_features": check_landmark_parity(golden),
+        "image_features": check_image_parity(golden, args.image_atol),
+    }}
+    if not args.parity_only:
+        report["stages"] = run_benchmarks(golden, max(1, args.repeat))
+    if args.compare and "stages" in report:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            report["compare"] = compare(report, json.load(f), args.tolerance)
+
+    text_out = json.dumps(report, ensure_ascii=False, indent=1)
+    if args.out:
+        Path(args.out).write_text(text_out + "\n", encoding="utf-8")
+    else:
+        print(text_out)
+
+    if not all(p["ok"] for p in report["parity"].values()):
+        print("[BENCH] golden parity failed", file=sys.stderr)
+        sys.exit(1)
+    if report.get("compare", {}).get("regressions"):
+        print(f"[BENCH] regressions: {', '.join(report['compare']['regressions'])}", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
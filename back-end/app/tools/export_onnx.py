@@ -0,0 +1,145 @@
+# back-end/app/tools/export_onnx.py
+"""
+TabNet_final.zip → model.onnx 내보내기 (같은 모델 버전 디렉터리에 저장).
+실행 (back-end 에서, torch/pytorch_tabnet/onnxruntime 이 설치된 환경):
+    python -m app.tools.export_onnx [--modality face] [--version v1] [--rows 512] [--samples raw.csv]
+- 네트워크 + softmax 를 내보내므로 출력은 TabNetClassifier.predict_proba 와 같은 (N, 2) 확률
+- 스케일러는 서빙에서 AffineScaler(numpy) 로 이미 풀어서 적용하므로 그래프 밖에 둔다
+- 내보낸 뒤 원본 모델과 같은 입력으로 비교해 오차가 허용치를 넘으면 파일을 남기지 않는다
+- 비교에 쓴 입력/원본 출력은 model.onnx.parity.npz 로 저장 → 서빙 시 torch 없이 재검증
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from app.core.config import model_version
+from app.services.inference.onnx_runner import (
+    ONNX_META,
+    ONNX_MODEL,
+    ONNX_PARITY,
+    PARITY_ATOL,
+    SOURCE_MODEL,
+    OnnxClassifier,
+    check_parity,
+    file_sha256,
+)
+from app.services.inference.tabnet_runner import _compile_scaler, _load_feature_order, _model_dir, _try_load_scaler
+
+
+def _parity_inputs(mdir: str, rows: int, samples: str | None, seed: int) -> np.ndarray:
+    """비교용 모델 입력 (스케일 적용 후). samples CSV(원시 피처, 헤더=피처명)가 있으면 그 행 + 난수 행."""
+    feature_order = _load_feature_order(mdir)
+    rng = np.random.default_rng(seed)
+    # 표준화된 피처 공간 기준의 난수 (이상치 대비 꼬리를 넓게)
+    parts = [rng.standard_t(df=4, size=(rows, len(feature_order))).astype(np.float32)]
+    if samples:
+        import pandas as pd
+
+        raw = pd.read_csv(samples).reindex(columns=feature_order, fill_value=0.0).to_numpy(np.float32)
+        parts.insert(0, np.asarray(_compile_scaler(_try_load_scaler(mdir)).transform(raw), dtype=np.float32))
+    return np.concatenate(parts)
+
+
+def export(mdir: str, *, opset: int, rows: int, samples: str | None, seed: int, atol: float) -> dict:
+    import torch
+    from pytorch_tabnet.tab_model import TabNetClassifier
+
+    clf = TabNetClassifier()
+    clf.load_model(os.path.join(mdir, SOURCE_MODEL))
+    network = clf.network.to("cpu").eval()
+
+    class _Proba(torch.nn.Module):
+        """TabNetClassifier.predict_proba 와 같은 계산: network(x)[0] → softmax."""
+
+        def __init__(self, net):
+            super().__init__()
+            self.net = net
+
+        def forward(self, x):
+            return torch.softmax(self.net(x)[0], dim=1)
+
+    X = _parity_inputs(mdir, rows, samples, seed)
+    expected = np.asarray(clf.predict_proba(X), dtype=np.float64)
+
+    out = os.path.join(mdir, ONNX_MODEL)
+    tmp = out + ".tmp"
+    kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        kwargs["dynamo"] = False  # sparsemax(autograd.Function) 는 TorchScript 기반 exporter 로 인라인
+    with torch.no_grad():
+        torch.onnx.export(
+            _Proba(network), torch.from_numpy(X[:1]), tmp,
+            input_names=["x"], output_names=["proba"],
+            dynamic_axes={"x": {0: "batch"}, "proba": {0: "batch"}},
+            opset_version=opset, **kwargs,
+        )
+
+    try:
+        diff = float(np.max(np.abs(OnnxClassifier(tmp).predict_proba(X) - expected)))
+        if diff > atol:
+            raise ValueError(f"parity check failed: max_abs_diff={diff:.3g} > {atol:g}")
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    np.savez_compressed(os.path.join(mdir, ONNX_PARITY), X=X, proba=expected)
+    meta = {
+        "source": SOURCE_MODEL,
+        "source_sha256": file_sha256(os.path.join(mdir, SOURCE_MODEL)),
+        "opset": opset,
+        "input_dim": int(X.shape[1]),
+        "parity_rows": int(X.shape[0]),
+        "max_abs_diff": diff,
+        "torch": torch.__version__,
+        "exported_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    with open(os.path.join(mdir, ONNX_META), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp, out)  # 메타/기준값을 먼저 써 두고 모델을 마지막에 교체 (레지스트리 재로딩 트리거)
+    return meta
+
+
+def bench(mdir: str, n: int = 2000) -> float:
+    """1행 추론 평균 지연(ms)."""
+    model = OnnxClassifier(os.path.join(mdir, ONNX_MODEL))
+    with np.load(os.path.join(mdir, ONNX_PARITY)) as ref:
+        row = ref["X"][:1]
+    for _ in range(50):
+        model.predict_proba(row)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        model.predict_proba(row)
+    return (time.perf_counter() - t0) / n * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="TabNet .zip → ONNX 내보내기 + 원본 대비 parity 검사")
+    ap.add_argument("--modality", default="face")
+    ap.add_argument("--version", default=None, help="모델 버전 (기본: 현재 활성 버전)")
+    ap.add_argument("--opset", type=int, default=17)
+    ap.add_argument("--rows", type=int, default=512, help="parity 검사용 난수 입력 행 수")
+    ap.add_argument("--samples", default=None, help="parity 검사에 추가할 원시 피처 CSV (헤더=피처명)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--atol", type=float, default=PARITY_ATOL)
+    args = ap.parse_args()
+
+    mdir = _model_dir(args.modality, args.version or model_version(args.modality))
+    try:
+        meta = export(mdir, opset=args.opset, rows=args.rows, samples=args.samples, seed=args.seed, atol=args.atol)
+    except Exception as e:
+        print(f"[EXPORT] failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    check_parity(OnnxClassifier(os.path.join(mdir, ONNX_MODEL)), mdir, args.atol)
+    print(f"[EXPORT] {os.path.join(mdir, ONNX_MODEL)}: max_abs_diff={meta['max_abs_diff']:.3g} "
+          f"over {meta['parity_rows']} rows, 1-row latency {bench(mdir):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
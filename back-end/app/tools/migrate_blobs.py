@@ -0,0 +1,83 @@
+# back-end/app/tools/migrate_blobs.py
+"""
+DB 에 남아 있는 이미지 원본(face.image_blob, arm.start/end_image_blob)을 blob 저장소로 이관.
+실행 (back-end 에서, `alembic upgrade head` 이후):
+    python -m app.tools.migrate_blobs [--batch-size 100] [--dry-run]
+- PK 순서로 배치 단위 처리, 배치마다 커밋 → 중단돼도 다시 실행하면 남은 행부터 이어서 진행
+- 원본을 저장소에 쓴 뒤 키를 기록하고 BLOB 컬럼은 NULL 로 비운다
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.arm import Arm
+from app.models.face import Face
+from app.models import user  # noqa: F401  (FK 대상 테이블 등록)
+from app.services.storage.blob_store import get_blob_store
+
+# (모델, PK 속성명, [(BLOB 속성명, 키 속성명), ...])
+TARGETS: List[Tuple[type, str, List[Tuple[str, str]]]] = [
+    (Face, "face_id", [("image_blob", "image_key")]),
+    (Arm, "arm_id", [("start_image_blob", "start_image_key"), ("end_image_blob", "end_image_key")]),
+]
+
+
+def migrate_column(db: Session, model: type, pk_attr: str, blob_attr: str, key_attr: str, *, batch_size: int, dry_run: bool) -> Tuple[int, int]:
+    """한 BLOB 컬럼을 이관. 반환: (이관 행 수, 이관 바이트 수)"""
+    pk, blob = getattr(model, pk_attr), getattr(model, blob_attr)
+    store = get_blob_store()
+    rows_done, bytes_done, last_id = 0, 0, None
+
+    while True:
+        q = select(pk, blob).where(blob.is_not(None)).order_by(pk).limit(batch_size)
+        if last_id is not None:
+            q = q.where(pk > last_id)
+        rows = db.execute(q).all()
+        if not rows:
+            break
+
+        changes = []
+        for row_id, data in rows:
+            key = None if dry_run else store.put(data)
+            changes.append({pk_attr: row_id, key_attr: key, blob_attr: None})
+            bytes_done += len(data)
+        if not dry_run:
+            # 저장소 쓰기가 끝난 뒤에 키 기록 + BLOB 비우기 (PK 기준 일괄 UPDATE)
+            db.execute(update(model), changes)
+            db.commit()
+        else:
+            db.rollback()
+
+        rows_done += len(rows)
+        last_id = rows[-1][0]
+        print(f"[MIGRATE] {model.__tablename__}.{blob_attr}: {rows_done} rows, {bytes_done / 1e6:.1f} MB (last {pk_attr}={last_id})")
+
+    return rows_done, bytes_done
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="DB 이미지 BLOB → blob 저장소 이관")
+    ap.add_argument("--batch-size", type=int, default=100, help="한 번에 읽어 올 행 수 (메모리 ≈ 행 수 × 이미지 크기)")
+    ap.add_argument("--dry-run", action="store_true", help="저장소/DB 를 바꾸지 않고 대상만 집계")
+    args = ap.parse_args()
+
+    t0 = time.time()
+    total_rows = total_bytes = 0
+    with SessionLocal() as db:
+        for model, pk_attr, columns in TARGETS:
+            for blob_attr, key_attr in columns:
+                n, b = migrate_column(db, model, pk_attr, blob_attr, key_attr, batch_size=max(1, args.batch_size), dry_run=args.dry_run)
+                total_rows += n
+                total_bytes += b
+    mode = "dry-run" if args.dry_run else "done"
+    print(f"[MIGRATE] {mode}: {total_rows} blobs, {total_bytes / 1e6:.1f} MB in {time.time() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
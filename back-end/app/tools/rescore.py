@@ -0,0 +1,357 @@
+# back-end/app/tools/rescore.py
+"""
+저장된 측정(face/arm 테이블) 또는 이미지 디렉터리를 새 모델 버전으로 일괄 재채점.
+실행 (back-end 에서, `alembic upgrade head` 이후):
+    python -m app.tools.rescore face [--model-version v2] [--workers 8] [--batch-size 512]
+    python -m app.tools.rescore arm --parquet out/arm_v2
+    python -m app.tools.rescore face --dir /data/research --parquet out/research_v2 [--with-features]
+- DB 원본은 PK 순서로 서버 측 커서(yield_per) 스트리밍 → 메모리는 배치 크기만큼만
+- 디코딩·랜드마크·피처는 프로세스 풀로 분산, 추론은 배치 전체를 행렬 1회로 (이 프로세스에서)
+- 결과: rescore_result 테이블(모델 버전별, 배치마다 일괄 INSERT) 또는 Parquet 파트 파일(pyarrow 필요)
+- 배치가 기록될 때마다 체크포인트 저장 → 중단돼도 같은 명령을 다시 실행하면 이어서 진행 (--restart 로 처음부터)
+디렉터리의 arm 은 같은 폴더의 `<이름>_start.*` / `<이름>_end.*` 쌍을 한 건으로 본다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import Modality, model_version, settings, threshold
+
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+PREFETCH_BATCHES = 2  # 결과를 기록하는 동안 풀이 놀지 않도록 미리 넣어 두는 배치 수
+
+# 원본 참조: ("blob", 저장소 키) | ("bytes", 이관 전 BLOB) | ("file", 경로)
+Ref = Tuple[str, Union[str, bytes]]
+# (source_key, source_id, 이미지 참조들)  — face 는 1개, arm 은 (시작, 끝) 2개
+Item = Tuple[str, Optional[int], Tuple[Optional[Ref], ...]]
+# 워커 결과: (피처 벡터 | 피처 dict | None, 오류 메시지 | None)
+Extracted = Tuple[Any, Optional[str]]
+
+
+# ── 원본 ────────────────────────────────────────────────────────────────────
+def _ref(key: Optional[str], blob: Optional[bytes]) -> Optional[Ref]:
+    if key:
+        return ("blob", key)
+    return ("bytes", bytes(blob)) if blob is not None else None
+
+
+def iter_db_items(db: Session, modality: Modality, *, after: Optional[int], batch_size: int) -> Iterator[Item]:
+    """face/arm 테이블을 PK 순서로 서버 측 커서 스트리밍 (after 다음 행부터)."""
+    from app.models.arm import Arm
+    from app.models.face import Face
+
+    if modality == "face":
+        pk = Face.face_id
+        q = select(pk, Face.image_key, Face.image_blob)
+    else:
+        pk = Arm.arm_id
+        q = select(pk, Arm.start_image_key, Arm.start_image_blob, Arm.end_image_key, Arm.end_image_blob)
+    if after is not None:
+        q = q.where(pk > after)
+    q = q.order_by(pk).execution_options(yield_per=batch_size)
+    for row in db.execute(q):
+        refs = tuple(_ref(row[i], row[i + 1]) for i in range(1, len(row), 2))
+        yield str(row[0]), int(row[0]), refs
+
+
+def _walk_sorted(root: Path) -> Iterator[Tuple[str, List[str]]]:
+    """os.walk 를 이름순으로 (재실행해도 같은 순서 → 체크포인트 비교 가능)."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        yield dirpath, sorted(filenames)
+
+
+def iter_dir_items(root: Path, modality: Modality, *, after: Optional[Sequence[str]]) -> Iterator[Item]:
+    """디렉터리 이미지 (after: 체크포인트의 상대 경로 구성요소, 그 이후 파일부터)."""
+    last = tuple(after) if after else None
+    for dirpath, filenames in _walk_sorted(root):
+        images = [f for f in filenames if Path(f).suffix.lower() in IMAGE_EXTS]
+        if modality == "face":
+            pairs = [(f, (f,)) for f in images]
+        else:
+            stems = {Path(f).stem: f for f in images}
+            pairs = [
+                (f, (f, stems[stem[:-6] + "_end"]))
+                for f in images
+                for stem in [Path(f).stem]
+                if stem.endswith("_start") and stem[:-6] + "_end" in stems
+            ]
+        for name, files in pairs:
+            rel = Path(dirpath, name).relative_to(root)
+            if last is not None and rel.parts <= last:
+                continue
+            yield rel.as_posix(), None, tuple(("file", os.path.join(dirpath, f)) for f in files)
+
+
+# ── 워커 (프로세스 풀에서 실행되므로 모듈 최상위 함수) ─────────────────────────
+def _load(ref: Optional[Ref]) -> bytes:
+    if ref is None:
+        raise ValueError("원본 이미지 없음")
+    kind, value = ref
+    if kind == "blob":
+        from app.services.storage.blob_store import get_blob_store
+        return get_blob_store().read(value)
+    if kind == "file":
+        return Path(value).read_bytes()
+    return value
+
+
+def _extract_one(modality: Modality, refs: Tuple[Optional[Ref], ...]) -> Any:
+    if modality == "face":
+        from app.services.features.face_features import extract_feature_vector_from_image_bytes
+
+        vec, img = extract_feature_vector_from_image_bytes(_load(refs[0]))
+        if vec is None:
+            raise ValueError("이미지 디코딩 실패" if img is None else "얼굴 인식 실패")
+        return vec
+    from app.services.features.arm_features import extract_features_from_two_images
+
+    return extract_features_from_two_images(_load(refs[0]), _load(refs[1]))
+
+
+def extract_chunk(modality: Modality, items: Sequence[Item]) -> List[Extracted]:
+    """이미지 묶음 → 피처. 건별 실패는 전체 작업을 멈추지 않고 오류 메시지로 돌려준다."""
+    out: List[Extracted] = []
+    for _, _, refs in items:
+        try:
+            out.append((_extract_one(modality, refs), None))
+        except Exception as e:
+            out.append((None, f"{type(e).__name__}: {e}"[:255]))
+    return out
+
+
+# ── 추론 (배치 전체 1회) ─────────────────────────────────────────────────────
+def score_batch(modality: Modality, extracted: Sequence[Extracted], *, with_features: bool) -> List[Dict[str, Any]]:
+    """피처 → [{proba, pred_label, error, features_json}, ...] (입력 순서 그대로)."""
+    ok = [i for i, (feats, _) in enumerate(extracted) if feats is not None]
+    probas = np.empty(0)
+    if ok and modality == "face":
+        from app.services.features.face_features import FEATURE_NAMES
+        from app.services.inference.tabnet_runner import predict_rows, vector_row
+
+        probas = predict_rows("face", np.stack([vector_row("face", extracted[i][0], FEATURE_NAMES) for i in ok]))
+    elif ok:
+        from app.services.features.arm_features import FEATURE_COLS
+        from app.services.inference.arm_xgb_runner import predict_proba_batch
+
+        probas = predict_proba_batch(np.array([[float(extracted[i][0][k]) for k in FEATURE_COLS] for i in ok]))
+    thr = 0.5 if modality == "face" else float(getattr(settings, "ARM_THRESHOLD", None) or threshold("arm") or 0.5)
+
+    records = [{"proba": None, "pred_label": None, "error": err, "features_json": None} for _, err in extracted]
+    for i, p in zip(ok, probas):
+        feats = extracted[i][0]
+        if with_features:
+            if modality == "face":
+                from app.services.features.face_features import features_to_dict
+                feats = features_to_dict(feats)
+            records[i]["features_json"] = {k: float(v) for k, v in feats.items()}
+        records[i].update(proba=float(p), pred_label=int(p >= thr))
+    return records
+
+
+# ── 결과 기록 ────────────────────────────────────────────────────────────────
+class TableSink:
+    """rescore_result 테이블에 배치마다 일괄 INSERT. 같은 키는 지우고 다시 넣어서 재실행해도 중복이 없다."""
+
+    def __init__(self, session_factory, modality: Modality, version: str):
+        self.session_factory = session_factory
+        self.modality = modality
+        self.version = version
+
+    def write(self, part: int, rows: List[Dict[str, Any]]) -> None:
+        from app.models.rescore import RescoreResult
+
+        rows = [{"modality": self.modality, "model_version": self.version, **r} for r in rows]
+        with self.session_factory() as db:
+            db.execute(delete(RescoreResult).where(
+                RescoreResult.modality == self.modality,
+                RescoreResult.model_version == self.version,
+                RescoreResult.source_key.in_([r["source_key"] for r in rows]),
+            ))
+            db.execute(insert(RescoreResult), rows)
+            db.commit()
+
+
+class ParquetSink:
+    """배치마다 Parquet 파트 파일 1개 (임시 파일에 쓰고 rename → 중단돼도 깨진 파일이 남지 않음)."""
+
+    def __init__(self, out_dir: Path, modality: Modality, version: str):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise SystemExit("Parquet 출력에는 pyarrow 가 필요합니다 (pip install pyarrow)") from e
+        self.out_dir = out_dir
+        self.modality = modality
+        self.version = version
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(self, part: int, rows: List[Dict[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        cols: Dict[str, list] = {k: [r[k] for r in rows] for k in ("source_key", "source_id", "proba", "pred_label", "error")}
+        names = sorted({k for r in rows if r["features_json"] for k in r["features_json"]})
+        for name in names:  # 피처는 JSON 대신 열로 펼친다
+            cols[name] = [(r["features_json"] or {}).get(name) for r in rows]
+        table = pa.table({"modality": [self.modality] * len(rows), "model_version": [self.version] * len(rows), **cols})
+        path = self.out_dir / f"part-{part:06d}.parquet"
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+
+
+# ── 체크포인트 ────────────────────────────────────────────────────────────────
+class Checkpoint:
+    """JSON 파일: 마지막으로 기록된 원본 키 + 누적 건수. 실행 조건(run)이 다르면 이어받지 않는다."""
+
+    def __init__(self, path: Path, run: Dict[str, Any], *, restart: bool = False):
+        self.path = path
+        self.run = run
+        self.state: Dict[str, Any] = {"run": run, "last": None, "rows": 0, "errors": 0, "parts": 0}
+        if path.exists() and not restart:
+            saved = json.loads(path.read_text(encoding="utf-8"))
+            if saved.get("run") != run:
+                raise SystemExit(f"체크포인트 {path} 는 다른 실행 조건입니다: {saved.get('run')} (--restart 로 새로 시작)")
+            self.state = saved
+
+    @property
+    def last(self) -> Any:
+        return self.state["last"]
+
+    def advance(self, last: Any, rows: int, errors: int) -> None:
+        self.state.update(last=last, rows=self.state["rows"] + rows, errors=self.state["errors"] + errors,
+                          parts=self.state["parts"] + 1)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ── 실행 ─────────────────────────────────────────────────────────────────────
+def _batched(items: Iterable[Item], n: int) -> Iterator[List[Item]]:
+    it = iter(items)
+    while batch := list(islice(it, n)):
+        yield batch
+
+
+def _checkpoint_key(item: Item) -> Any:
+    """DB 원본은 PK, 디렉터리는 상대 경로 구성요소 (iter_dir_items 의 순서 비교와 같은 형태)."""
+    return item[1] if item[1] is not None else list(Path(item[0]).parts)
+
+
+def rescore(
+    items: Iterable[Item],
+    modality: Modality,
+    sink: Any,
+    checkpoint: Checkpoint,
+    *,
+    workers: int,
+    batch_size: int,
+    chunk_size: int = 16,
+    with_features: bool = False,
+) -> Dict[str, int]:
+    """
+    items 를 batch_size 씩: 피처 추출(workers > 0 이면 프로세스 풀, 0 이면 이 프로세스) → 추론 → 기록 → 체크포인트.
+    배치 순서대로 기록하므로 체크포인트 이전 원본은 모두 기록돼 있다.
+    """
+    # spawn: 부모가 연 DB 커서/연결을 자식이 물려받지 않게 (executor 와 동일)
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) if workers > 0 else None
+    inflight: deque = deque()
+    done = {"rows": 0, "errors": 0}
+    t0 = time.perf_counter()
+
+    def submit(batch: List[Item]) -> List[Any]:
+        chunks = [batch[i: i + chunk_size] for i in range(0, len(batch), chunk_size)]
+        if pool is None:
+            return [extract_chunk(modality, c) for c in chunks]
+        return [pool.submit(extract_chunk, modality, c) for c in chunks]
+
+    def finish(batch: List[Item], parts: List[Any]) -> None:
+        extracted = [r for p in parts for r in (p.result() if isinstance(p, Future) else p)]
+        records = score_batch(modality, extracted, with_features=with_features)
+        rows = [{"source_key": key, "source_id": sid, **rec} for (key, sid, _), rec in zip(batch, records)]
+        errors = sum(r["error"] is not None for r in rows)
+        sink.write(checkpoint.state["parts"], rows)
+        checkpoint.advance(_checkpoint_key(batch[-1]), len(rows), errors)
+        done["rows"] += len(rows)
+        done["errors"] += errors
+        rate = done["rows"] / max(time.perf_counter() - t0, 1e-9)
+        print(f"[RESCORE] {modality} {checkpoint.run['model_version']}: {checkpoint.state['rows']} rows "
+              f"(errors {checkpoint.state['errors']}), {rate:.1f} rows/s, last={batch[-1][0]}")
+
+    try:
+        for batch in _batched(items, batch_size):
+            inflight.append((batch, submit(batch)))
+            if len(inflight) > PREFETCH_BATCHES:
+                finish(*inflight.popleft())
+        while inflight:
+            finish(*inflight.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+    return done
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="저장된 측정 / 이미지 디렉터리 일괄 재채점")
+    ap.add_argument("modality", choices=["face", "arm"])
+    ap.add_argument("--model-version", help="채점할 모델 버전 (기본: 설정의 *_MODEL_VERSION)")
+    ap.add_argument("--dir", type=Path, help="DB 대신 이 디렉터리의 이미지를 채점")
+    ap.add_argument("--parquet", type=Path, help="rescore_result 테이블 대신 이 디렉터리에 Parquet 파트로 기록")
+    ap.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="피처 추출 프로세스 수 (0: 이 프로세스에서)")
+    ap.add_argument("--batch-size", type=int, default=512, help="추론/기록 단위 행 수")
+    ap.add_argument("--chunk-size", type=int, default=16, help="워커 1회 작업당 이미지 수")
+    ap.add_argument("--with-features", action="store_true", help="피처 값도 함께 기록")
+    ap.add_argument("--checkpoint", type=Path, help="체크포인트 파일 (기본: Parquet 디렉터리 또는 현재 디렉터리)")
+    ap.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    args = ap.parse_args(argv)
+
+    modality: Modality = args.modality
+    if args.model_version:
+        setattr(settings, f"{modality.upper()}_MODEL_VERSION", args.model_version)
+    version = model_version(modality)
+    source = str(args.dir.resolve()) if args.dir else "db"
+    run = {"modality": modality, "model_version": version, "source": source,
+           "sink": str(args.parquet.resolve()) if args.parquet else "table"}
+    ckpt_path = args.checkpoint or (args.parquet or Path(".")) / f"rescore_{modality}_{version}.checkpoint.json"
+    checkpoint = Checkpoint(ckpt_path, run, restart=args.restart)
+
+    from app.db.session import SessionLocal
+
+    if args.parquet:
+        sink = ParquetSink(args.parquet, modality, version)
+    else:
+        sink = TableSink(SessionLocal, modality, version)
+
+    batch_size = max(1, args.batch_size)
+    opts = dict(workers=max(0, args.workers), batch_size=batch_size, chunk_size=max(1, args.chunk_size),
+                with_features=args.with_features)
+    t0 = time.time()
+    if args.dir:
+        done = rescore(iter_dir_items(args.dir, modality, after=checkpoint.last), modality, sink, checkpoint, **opts)
+    else:
+        from app.models import user  # noqa: F401  (FK 대상 테이블 등록)
+
+        # 원본 스트리밍(서버 측 커서)과 결과 기록은 서로 다른 연결
+        with SessionLocal() as db:
+            done = rescore(iter_db_items(db, modality, after=checkpoint.last, batch_size=batch_size),
+                           modality, sink, checkpoint, **opts)
+    print(f"[RESCORE] done: {done['rows']} rows (errors {done['errors']}) in {time.time() - t0:.1f}s, "
+          f"total {checkpoint.state['rows']}, checkpoint {ckpt_path}")
+
+
+if __name__ == "__main__":
+    main()